@@ -11,7 +11,8 @@ from app.db.base import Base
 
 config = context.config
 settings = get_settings()
-config.set_main_option("sqlalchemy.url", settings.database_url or settings.mysql_connection_uri)
+# ConfigParser treats "%" as interpolation, which URL-encoded passwords contain.
+config.set_main_option("sqlalchemy.url", (settings.database_url or settings.mysql_connection_uri).replace("%", "%%"))
 
 if config.config_file_name is not None:
     fileConfig(config.config_file_name)
@@ -29,7 +30,18 @@ def run_migrations_offline() -> None:
 
 
 def run_migrations_online() -> None:
-    """Run migrations in 'online' mode."""
+    """Run migrations in 'online' mode.
+
+    Callers (such as the migration tests) may pass an open connection through
+    ``config.attributes["connection"]`` instead of relying on ``DATABASE_URL``.
+    """
+    connection = config.attributes.get("connection")
+    if connection is not None:
+        context.configure(connection=connection, target_metadata=target_metadata)
+        with context.begin_transaction():
+            context.run_migrations()
+        return
+
     connectable = engine_from_config(
         config.get_section(config.config_ini_section, {}),
         prefix="sqlalchemy.",
@@ -0,0 +1,34 @@
+"""reset token lookup and sweeper indexes
+
+Replaces the single-column user_id index with (user_id, used), which serves
+remove_active_tokens_for_user and still backs the foreign key, and adds the
+expires_at / used_at indexes the token sweeper purges by. The composite is
+created before the old index is dropped so the foreign key always has an index.
+
+Revision ID: 080684836915
+Revises: f55e69af846f
+Create Date: 2026-10-18 09:10:00.000000
+"""
+from app.db import online_ddl
+
+# revision identifiers, used by Alembic.
+revision = "080684836915"
+down_revision = "f55e69af846f"
+branch_labels = None
+depends_on = None
+
+TABLE = "password_reset_tokens"
+
+
+def upgrade():
+    online_ddl.create_index("ix_password_reset_tokens_user_id_used", TABLE, ["user_id", "used"])
+    online_ddl.drop_index("ix_password_reset_tokens_user_id", TABLE)
+    online_ddl.create_index("ix_password_reset_tokens_expires_at", TABLE, ["expires_at"])
+    online_ddl.create_index("ix_password_reset_tokens_used_at", TABLE, ["used_at"])
+
+
+def downgrade():
+    online_ddl.drop_index("ix_password_reset_tokens_used_at", TABLE)
+    online_ddl.drop_index("ix_password_reset_tokens_expires_at", TABLE)
+    online_ddl.create_index("ix_password_reset_tokens_user_id", TABLE, ["user_id"])
+    online_ddl.drop_index("ix_password_reset_tokens_user_id_used", TABLE)
@@ -0,0 +1,28 @@
+"""covering indexes for login
+
+get_login_credentials selects only (id, hashed_password) by email or username.
+InnoDB secondary indexes carry the primary key, so (email, hashed_password) and
+(username, hashed_password) answer the lookup from the index alone without a
+second descent into the clustered index.
+
+Revision ID: ba5a3db0887f
+Revises: 080684836915
+Create Date: 2026-10-18 09:20:00.000000
+"""
+from app.db import online_ddl
+
+# revision identifiers, used by Alembic.
+revision = "ba5a3db0887f"
+down_revision = "080684836915"
+branch_labels = None
+depends_on = None
+
+
+def upgrade():
+    online_ddl.create_index("ix_users_email_hashed_password", "users", ["email", "hashed_password"])
+    online_ddl.create_index("ix_users_username_hashed_password", "users", ["username", "hashed_password"])
+
+
+def downgrade():
+    online_ddl.drop_index("ix_users_username_hashed_password", "users")
+    online_ddl.drop_index("ix_users_email_hashed_password", "users")
@@ -1,4 +1,7 @@
 """Controller translating transport concerns to domain services."""
+from fastapi import BackgroundTasks
+
+from app.models.user import User
 from app.schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
@@ -8,7 +11,19 @@ from app.schemas.auth import (
     UserCreate,
     UserRead,
 )
-from app.services.auth_service import AuthService
+from app.services.auth_service import AsyncAuthService, AuthService
+
+RESET_EMAIL_SENT = MessageResponse(message="If the account exists, a reset email has been sent.")
+PASSWORD_UPDATED = MessageResponse(message="Password updated successfully.")
+
+
+def _registered_user(user: User) -> UserRead:
+    """Build the response for a user just created from a validated ``UserCreate``.
+
+    Every field was either validated on the way in or assigned by the
+    server, so validating the ORM object again would only repeat that work.
+    """
+    return UserRead.model_construct(**{field: getattr(user, field) for field in UserRead.model_fields})
 
 
 class AuthController:
@@ -18,16 +33,46 @@ class AuthController:
         self._service = service
 
     def register(self, payload: UserCreate) -> UserRead:
-        user = self._service.register_user(payload)
-        return UserRead.model_validate(user)
+        return _registered_user(self._service.register_user(payload))
+
+    def me(self, user_id: int) -> UserRead:
+        return UserRead.model_validate(self._service.get_user(user_id))
 
-    def login(self, payload: LoginRequest) -> TokenResponse:
-        return self._service.authenticate_user(payload)
+    def login(self, payload: LoginRequest, client_ip: str | None = None) -> TokenResponse:
+        return self._service.authenticate_user(payload, client_ip)
 
-    def forgot_password(self, payload: ForgotPasswordRequest) -> MessageResponse:
-        self._service.request_password_reset(payload)
-        return MessageResponse(message="If the account exists, a reset email has been sent.")
+    def forgot_password(
+        self, payload: ForgotPasswordRequest, background_tasks: BackgroundTasks | None = None
+    ) -> MessageResponse:
+        self._service.request_password_reset(payload, background_tasks)
+        return RESET_EMAIL_SENT
 
     def reset_password(self, payload: ResetPasswordRequest) -> MessageResponse:
         self._service.reset_password(payload)
-        return MessageResponse(message="Password updated successfully.")
+        return PASSWORD_UPDATED
+
+
+class AsyncAuthController:
+    """Async counterpart of :class:`AuthController` used by the async routes."""
+
+    def __init__(self, service: AsyncAuthService) -> None:
+        self._service = service
+
+    async def register(self, payload: UserCreate) -> UserRead:
+        return _registered_user(await self._service.register_user(payload))
+
+    async def me(self, user_id: int) -> UserRead:
+        return UserRead.model_validate(await self._service.get_user(user_id))
+
+    async def login(self, payload: LoginRequest, client_ip: str | None = None) -> TokenResponse:
+        return await self._service.authenticate_user(payload, client_ip)
+
+    async def forgot_password(
+        self, payload: ForgotPasswordRequest, background_tasks: BackgroundTasks | None = None
+    ) -> MessageResponse:
+        await self._service.request_password_reset(payload, background_tasks)
+        return RESET_EMAIL_SENT
+
+    async def reset_password(self, payload: ResetPasswordRequest) -> MessageResponse:
+        await self._service.reset_password(payload)
+        return PASSWORD_UPDATED
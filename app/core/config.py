@@ -1,5 +1,6 @@
 """Global application configuration powered by Pydantic settings."""
 from functools import lru_cache
+from typing import Literal
 
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
@@ -10,9 +11,26 @@ class Settings(BaseSettings):
     project_name: str = "Cred Authentication API"
     api_prefix: str = "/api/v1"
     database_url: str = "sqlite:///./app.db"
+    async_database_url: str | None = None
+    use_async_db: bool = False
+    server_host: str = "0.0.0.0"
+    server_port: int = 8000
+    web_concurrency: int = 0
+    threadpool_tokens: int = 40
+    db_pool_size: int = 5
+    db_max_overflow: int = 10
+    db_pool_timeout: float = 30.0
+    db_pool_recycle: int = 1800
+    db_pool_pre_ping: bool = True
+    db_bootstrap_schema: bool = False
+    db_replica_urls: list[str] = []
+    db_replica_retry_seconds: float = 30.0
+    db_replica_fallback_on_miss: bool = True
     jwt_secret_key: str = "change-me"
     jwt_algorithm: str = "HS256"
+    jwt_backend: Literal["jose", "pyjwt", "native"] = "jose"
     access_token_expire_minutes: int = 60
+    token_cache_max_size: int = 10_000
 
     mysql_host: str = "db"
     mysql_port: int = 3306
@@ -21,6 +39,11 @@ class Settings(BaseSettings):
     mysql_database: str = "cred_db"
     password_reset_token_expire_minutes: int = 30
     password_reset_base_url: str = "https://example.com/reset-password"
+    used_token_retention_hours: int = 24
+    token_sweeper_enabled: bool = True
+    token_sweeper_interval_seconds: float = 3600.0
+    token_sweeper_batch_size: int = 1000
+    token_sweeper_batch_pause_seconds: float = 0.05
 
     smtp_host: str = "localhost"
     smtp_port: int = 587
@@ -29,6 +52,45 @@ class Settings(BaseSettings):
     smtp_sender: str = "no-reply@example.com"
     smtp_use_tls: bool = True
     smtp_suppress_send: bool = True
+    smtp_idle_timeout_seconds: float = 30.0
+    email_outbox_enabled: bool = True
+    email_outbox_max_size: int = 1000
+    email_outbox_batch_size: int = 20
+
+    request_metrics_enabled: bool = False
+    fast_json_responses: bool = False
+    email_validation_cache_size: int = 10_000
+
+    user_import_api_enabled: bool = False
+    user_import_api_token: str = ""
+    user_import_batch_size: int = 500
+    user_import_hash_workers: int = 0
+    user_import_max_reported_errors: int = 1000
+
+    identifier_filter_enabled: bool = False
+    identifier_filter_capacity: int = 1_000_000
+    identifier_filter_error_rate: float = 0.001
+    identifier_filter_sync_seconds: float = 1.0
+
+    user_cache_enabled: bool = False
+    user_cache_backend: str = "memory"
+    user_cache_max_size: int = 10_000
+    user_cache_shards: int = 16
+    user_cache_ttl_seconds: float = 30.0
+
+    login_rate_limit_enabled: bool = True
+    login_rate_limit_store: str = "memory"
+    login_rate_limit_window_seconds: int = 60
+    login_rate_limit_per_identifier: int = 10
+    login_rate_limit_per_ip: int = 100
+
+    bcrypt_rounds: int = 12
+    password_rehash_on_login: bool = True
+    password_rehash_queue_size: int = 1000
+    password_hash_executor: Literal["thread", "process"] = "thread"
+    password_hash_workers: int = 0
+    password_hash_queue_size: int = 32
+    password_hash_retry_after_seconds: int = 1
 
     model_config = SettingsConfigDict(env_file=".env", env_file_encoding="utf-8", extra="allow")
 
@@ -40,6 +102,25 @@ class Settings(BaseSettings):
             f"{self.mysql_host}:{self.mysql_port}/{self.mysql_database}"
         )
 
+    @property
+    def async_connection_uri(self) -> str:
+        """Async driver variant of the configured database URL (aiosqlite/aiomysql)."""
+        if self.async_database_url:
+            return self.async_database_url
+        url = self.database_url or self.mysql_connection_uri
+        for sync_driver, async_driver in _ASYNC_DRIVERS.items():
+            if url.startswith(sync_driver):
+                return async_driver + url[len(sync_driver):]
+        return url
+
+
+_ASYNC_DRIVERS = {
+    "sqlite+pysqlite:": "sqlite+aiosqlite:",
+    "sqlite:": "sqlite+aiosqlite:",
+    "mysql+pymysql:": "mysql+aiomysql:",
+    "mysql:": "mysql+aiomysql:",
+}
+
 
 @lru_cache
 def get_settings() -> Settings:
@@ -0,0 +1,167 @@
+"""Bounded worker pool that keeps bcrypt work off the request threadpool."""
+from __future__ import annotations
+
+import asyncio
+import multiprocessing
+import os
+import threading
+import time
+from collections.abc import Callable
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass, field
+from functools import lru_cache
+from typing import Any, TypeVar
+
+from app.core.config import Settings, get_settings
+from app.core.request_metrics import record_hash_time
+from app.core.security import get_password_hash, verify_password
+
+T = TypeVar("T")
+
+
+class HashingPoolSaturatedError(RuntimeError):
+    """Raised when the hashing pool has no free slot for another job."""
+
+    def __init__(self, retry_after: int) -> None:
+        super().__init__("password hashing pool is saturated")
+        self.retry_after = retry_after
+
+
+@dataclass
+class _Timing:
+    count: int = 0
+    total: float = 0.0
+    max: float = 0.0
+
+    def observe(self, seconds: float) -> None:
+        self.count += 1
+        self.total += seconds
+        if seconds > self.max:
+            self.max = seconds
+
+    def snapshot(self) -> dict[str, float]:
+        average = self.total / self.count if self.count else 0.0
+        return {"count": self.count, "total_seconds": self.total, "avg_seconds": average, "max_seconds": self.max}
+
+
+@dataclass
+class HashingMetrics:
+    """Aggregated queue-wait and hash-time observations for the hashing pool."""
+
+    queue_wait: _Timing = field(default_factory=_Timing)
+    hash_time: _Timing = field(default_factory=_Timing)
+    rejected: int = 0
+    _lock: threading.Lock = field(default_factory=threading.Lock, repr=False)
+
+    def observe(self, queue_wait: float, hash_time: float) -> None:
+        with self._lock:
+            self.queue_wait.observe(queue_wait)
+            self.hash_time.observe(hash_time)
+
+    def record_rejection(self) -> None:
+        with self._lock:
+            self.rejected += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "queue_wait": self.queue_wait.snapshot(),
+                "hash_time": self.hash_time.snapshot(),
+                "rejected": self.rejected,
+            }
+
+
+def _timed_call(fn: Callable[..., T], *args: Any) -> tuple[T, float, float]:
+    """Run ``fn`` inside the worker and report monotonic start/finish stamps."""
+    started = time.monotonic()
+    result = fn(*args)
+    return result, started, time.monotonic()
+
+
+def admission_capacity(workers: int, queue_size: int, threadpool_tokens: int) -> int:
+    """Jobs admitted at once, kept below the request threadpool size.
+
+    Sync routes block a threadpool thread while their job runs, so a quarter
+    of the threads (at least one) is never handed to hashing and stays free
+    for every other sync route.
+    """
+    reserved = max(1, threadpool_tokens // 4)
+    return max(1, min(workers + queue_size, threadpool_tokens - reserved))
+
+
+class HashingExecutor:
+    """Runs password hashing jobs on a dedicated pool with admission control.
+
+    At most ``workers + queue_size`` jobs may be in flight, and never so many
+    that waiting callers fill the request threadpool (see
+    :func:`admission_capacity`). Anything beyond that is rejected immediately
+    so callers can shed load instead of queueing.
+    """
+
+    def __init__(self, settings: Settings | None = None) -> None:
+        settings = settings or get_settings()
+        self.workers = settings.password_hash_workers or os.cpu_count() or 1
+        self.capacity = admission_capacity(
+            self.workers, settings.password_hash_queue_size, settings.threadpool_tokens
+        )
+        self.retry_after = settings.password_hash_retry_after_seconds
+        self.metrics = HashingMetrics()
+        self._slots = threading.BoundedSemaphore(self.capacity)
+        if settings.password_hash_executor == "process":
+            # Spawned, not forked: forking the threaded server could copy locks
+            # held by other threads into the children.
+            self._pool: Executor = ProcessPoolExecutor(
+                max_workers=self.workers, mp_context=multiprocessing.get_context("spawn")
+            )
+        else:
+            self._pool = ThreadPoolExecutor(max_workers=self.workers, thread_name_prefix="hashing")
+
+    def _submit(self, fn: Callable[..., T], *args: Any) -> tuple[Future, float]:
+        if not self._slots.acquire(blocking=False):
+            self.metrics.record_rejection()
+            raise HashingPoolSaturatedError(self.retry_after)
+        submitted = time.monotonic()
+        try:
+            future = self._pool.submit(_timed_call, fn, *args)
+        except BaseException:
+            self._slots.release()
+            raise
+        future.add_done_callback(lambda _: self._slots.release())
+        return future, submitted
+
+    def _unwrap(self, outcome: tuple[T, float, float], submitted: float) -> T:
+        result, started, finished = outcome
+        self.metrics.observe(max(started - submitted, 0.0), finished - started)
+        record_hash_time(time.monotonic() - submitted)
+        return result
+
+    def run(self, fn: Callable[..., T], *args: Any) -> T:
+        """Execute ``fn`` on the pool and block until it completes."""
+        future, submitted = self._submit(fn, *args)
+        return self._unwrap(future.result(), submitted)
+
+    async def run_async(self, fn: Callable[..., T], *args: Any) -> T:
+        """Execute ``fn`` on the pool without blocking the event loop."""
+        future, submitted = self._submit(fn, *args)
+        return self._unwrap(await asyncio.wrap_future(future), submitted)
+
+    def hash_password(self, password: str) -> str:
+        return self.run(get_password_hash, password)
+
+    def verify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return self.run(verify_password, plain_password, hashed_password)
+
+    async def ahash_password(self, password: str) -> str:
+        return await self.run_async(get_password_hash, password)
+
+    async def averify_password(self, plain_password: str, hashed_password: str) -> bool:
+        return await self.run_async(verify_password, plain_password, hashed_password)
+
+    def shutdown(self) -> None:
+        self._pool.shutdown(wait=False, cancel_futures=True)
+
+
+@lru_cache
+def get_hashing_executor() -> HashingExecutor:
+    """Return the process-wide hashing executor, created on first use."""
+    return HashingExecutor()
@@ -0,0 +1,162 @@
+"""Sliding-window rate limiting for login attempts, checked before any DB or bcrypt work."""
+from __future__ import annotations
+
+import importlib
+import math
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, Protocol
+
+from app.core.config import Settings, get_settings
+
+
+class RateLimitExceededError(RuntimeError):
+    """Raised when a caller has exhausted its attempts for the current window."""
+
+    def __init__(self, scope: str, retry_after: int) -> None:
+        super().__init__(f"rate limit exceeded for {scope}")
+        self.scope = scope
+        self.retry_after = retry_after
+
+
+class CounterStore(Protocol):
+    """Minimal shared-counter interface (maps directly onto Redis ``INCR``/``EXPIRE``/``GET``)."""
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        """Increment ``key``, setting its expiry when created, and return the new value."""
+        ...
+
+    def get(self, key: str) -> int:
+        """Return the current value of ``key`` or ``0`` when missing or expired."""
+        ...
+
+
+class InMemoryCounterStore:
+    """Process-local :class:`CounterStore` with lazy expiry and a bounded key count.
+
+    Keys are kept in the order their expiry was set, so expired keys are
+    dropped from the front in O(1) each. When the store is full of live keys
+    the oldest one is evicted, so it never holds more than ``max_keys``.
+    """
+
+    def __init__(self, max_keys: int = 100_000) -> None:
+        self._max_keys = max_keys
+        self._values: OrderedDict[str, tuple[int, float]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.evictions = 0
+
+    def __len__(self) -> int:
+        return len(self._values)
+
+    def _make_room(self, now: float) -> None:
+        while self._values:
+            _, (_, expires) = next(iter(self._values.items()))
+            if expires > now:
+                break
+            self._values.popitem(last=False)
+        while len(self._values) >= self._max_keys:
+            self._values.popitem(last=False)
+            self.evictions += 1
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        now = time.monotonic()
+        with self._lock:
+            value, expires = self._values.get(key, (0, 0.0))
+            if expires <= now:
+                value, expires = 0, now + ttl_seconds
+                self._values.pop(key, None)
+                self._make_room(now)
+            value += 1
+            self._values[key] = (value, expires)
+            return value
+
+    def get(self, key: str) -> int:
+        with self._lock:
+            value, expires = self._values.get(key, (0, 0.0))
+            return value if expires > time.monotonic() else 0
+
+
+class SlidingWindowRateLimiter:
+    """Approximates a sliding window from the current and previous fixed windows.
+
+    Each check costs one ``incr`` and one ``get`` regardless of traffic, so the
+    same logic works against a shared store without per-attempt logs.
+    """
+
+    def __init__(self, store: CounterStore, window_seconds: int) -> None:
+        self._store = store
+        self._window = window_seconds
+
+    def hit(self, key: str, limit: int) -> int | None:
+        """Record an attempt; return ``None`` when allowed or the seconds until retry."""
+        now = time.time()
+        window_index = int(now // self._window)
+        elapsed_fraction = (now % self._window) / self._window
+        current = self._store.incr(f"{key}:{window_index}", self._window * 2)
+        previous = self._store.get(f"{key}:{window_index - 1}")
+        estimated = previous * (1 - elapsed_fraction) + current
+        if estimated <= limit:
+            return None
+        return max(1, math.ceil(self._window * (1 - elapsed_fraction)))
+
+
+class LoginRateLimiter:
+    """Applies per-identifier and per-client-IP limits and counts shed attempts."""
+
+    def __init__(self, settings: Settings | None = None, store: CounterStore | None = None) -> None:
+        settings = settings or get_settings()
+        self.enabled = settings.login_rate_limit_enabled
+        self._per_identifier = settings.login_rate_limit_per_identifier
+        self._per_ip = settings.login_rate_limit_per_ip
+        self._limiter = SlidingWindowRateLimiter(
+            store or _build_store(settings.login_rate_limit_store), settings.login_rate_limit_window_seconds
+        )
+        self._lock = threading.Lock()
+        self.allowed = 0
+        self.shed_identifier = 0
+        self.shed_ip = 0
+
+    def check(self, identifier: str, client_ip: str | None) -> None:
+        """Raise :class:`RateLimitExceededError` when either limit is exhausted."""
+        if not self.enabled:
+            return
+        if client_ip:
+            retry_after = self._limiter.hit(f"login:ip:{client_ip}", self._per_ip)
+            if retry_after is not None:
+                self._count("shed_ip")
+                raise RateLimitExceededError("client", retry_after)
+        retry_after = self._limiter.hit(f"login:id:{identifier.strip().lower()}", self._per_identifier)
+        if retry_after is not None:
+            self._count("shed_identifier")
+            raise RateLimitExceededError("identifier", retry_after)
+        self._count("allowed")
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self.enabled,
+                "allowed": self.allowed,
+                "shed_identifier": self.shed_identifier,
+                "shed_ip": self.shed_ip,
+            }
+
+
+def _build_store(spec: str) -> CounterStore:
+    """Resolve ``memory`` or a ``package.module:factory`` path returning a CounterStore."""
+    if spec == "memory":
+        return InMemoryCounterStore()
+    module_name, _, factory_name = spec.partition(":")
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    return factory()
+
+
+@lru_cache
+def get_login_rate_limiter() -> LoginRateLimiter:
+    """Return the process-wide login limiter."""
+    return LoginRateLimiter()
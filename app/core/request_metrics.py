@@ -0,0 +1,212 @@
+"""Opt-in per-request timing: total, database, hashing and email time per route."""
+from __future__ import annotations
+
+import threading
+import time
+from contextvars import ContextVar
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+LATENCY_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+
+
+class RequestTimings:
+    """Mutable accumulator for the request currently being served."""
+
+    __slots__ = ("db_seconds", "db_statements", "hash_seconds", "email_seconds")
+
+    def __init__(self) -> None:
+        self.db_seconds = 0.0
+        self.db_statements = 0
+        self.hash_seconds = 0.0
+        self.email_seconds = 0.0
+
+
+_current: ContextVar[RequestTimings | None] = ContextVar("request_timings", default=None)
+
+
+def record_hash_time(seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.hash_seconds += seconds
+
+
+def record_email_time(seconds: float) -> None:
+    timings = _current.get()
+    if timings is not None:
+        timings.email_seconds += seconds
+
+
+_STARTED_ATTRIBUTE = "_request_metrics_started"
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    # The stamp lives on the statement's own execution context, so a statement
+    # that fails cannot leave it behind for a later one.
+    if context is not None and _current.get() is not None:
+        setattr(context, _STARTED_ATTRIBUTE, time.perf_counter())
+
+
+def _charge_statement(context) -> None:  # noqa: ANN001
+    started = getattr(context, _STARTED_ATTRIBUTE, None)
+    timings = _current.get()
+    if started is None or timings is None:
+        return
+    setattr(context, _STARTED_ATTRIBUTE, None)
+    timings.db_seconds += time.perf_counter() - started
+    timings.db_statements += 1
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:  # noqa: ANN001
+    _charge_statement(context)
+
+
+def _handle_error(exception_context) -> None:  # noqa: ANN001
+    """Failed statements skip ``after_cursor_execute`` but still took database time."""
+    _charge_statement(exception_context.execution_context)
+
+
+def instrument_statement_timing(engine: Engine) -> None:
+    """Attach cursor hooks that charge statement time to the current request."""
+    if not event.contains(engine, "before_cursor_execute", _before_cursor_execute):
+        event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+        event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+        event.listen(engine, "handle_error", _handle_error)
+
+
+class _RouteStats:
+    __slots__ = ("count", "total", "db", "statements", "hashing", "email", "buckets")
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.total = 0.0
+        self.db = 0.0
+        self.statements = 0
+        self.hashing = 0.0
+        self.email = 0.0
+        self.buckets = [0] * len(LATENCY_BUCKETS)
+
+
+class RequestMetricsRegistry:
+    """Aggregates request timings per ``(method, route, status)``."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._routes: dict[tuple[str, str, int], _RouteStats] = {}
+
+    def observe(self, method: str, route: str, status: int, total: float, timings: RequestTimings) -> None:
+        key = (method, route, status)
+        with self._lock:
+            stats = self._routes.get(key)
+            if stats is None:
+                stats = self._routes[key] = _RouteStats()
+            stats.count += 1
+            stats.total += total
+            stats.db += timings.db_seconds
+            stats.statements += timings.db_statements
+            stats.hashing += timings.hash_seconds
+            stats.email += timings.email_seconds
+            for index, bound in enumerate(LATENCY_BUCKETS):
+                if total <= bound:
+                    stats.buckets[index] += 1
+                    break
+
+    def reset(self) -> None:
+        with self._lock:
+            self._routes.clear()
+
+    def render_prometheus(self) -> str:
+        """Render the aggregates in the Prometheus text exposition format."""
+        lines = [
+            "# HELP http_request_duration_seconds Total request latency.",
+            "# TYPE http_request_duration_seconds histogram",
+        ]
+        with self._lock:
+            routes = sorted(self._routes.items())
+            for (method, route, status), stats in routes:
+                labels = f'method="{method}",route="{route}",status="{status}"'
+                cumulative = 0
+                for bound, count in zip(LATENCY_BUCKETS, stats.buckets):
+                    cumulative += count
+                    lines.append(f'http_request_duration_seconds_bucket{{{labels},le="{bound}"}} {cumulative}')
+                lines.append(f'http_request_duration_seconds_bucket{{{labels},le="+Inf"}} {stats.count}')
+                lines.append(f"http_request_duration_seconds_sum{{{labels}}} {stats.total}")
+                lines.append(f"http_request_duration_seconds_count{{{labels}}} {stats.count}")
+            for name, attribute, help_text in (
+                ("http_request_db_seconds_total", "db", "Time spent executing SQL statements."),
+                ("http_request_db_statements_total", "statements", "SQL statements executed."),
+                ("http_request_hashing_seconds_total", "hashing", "Time spent waiting on password hashing."),
+                ("http_request_email_seconds_total", "email", "Time spent handing off or sending email."),
+            ):
+                lines.append(f"# HELP {name} {help_text}")
+                lines.append(f"# TYPE {name} counter")
+                for (method, route, status), stats in routes:
+                    labels = f'method="{method}",route="{route}",status="{status}"'
+                    lines.append(f"{name}{{{labels}}} {getattr(stats, attribute)}")
+        return "\n".join(lines) + "\n"
+
+
+request_metrics = RequestMetricsRegistry()
+
+
+def _server_timing(total: float, timings: RequestTimings) -> bytes:
+    return (
+        f"total;dur={total * 1000:.2f}, db;dur={timings.db_seconds * 1000:.2f};desc=\"{timings.db_statements} stmts\", "
+        f"hash;dur={timings.hash_seconds * 1000:.2f}, email;dur={timings.email_seconds * 1000:.2f}"
+    ).encode("latin-1")
+
+
+class RequestMetricsMiddleware:
+    """Pure ASGI middleware that times each HTTP request and adds a Server-Timing header.
+
+    Durations in the header are measured up to the moment headers are sent;
+    the aggregates include the full response body.
+    """
+
+    def __init__(self, app: ASGIApp, registry: RequestMetricsRegistry | None = None) -> None:
+        self.app = app
+        self.registry = registry or request_metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        timings = RequestTimings()
+        token = _current.set(timings)
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_timing(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+                headers = list(message.get("headers", []))
+                headers.append((b"server-timing", _server_timing(time.perf_counter() - started, timings)))
+                message = {**message, "headers": headers}
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_timing)
+        finally:
+            _current.reset(token)
+            route = scope.get("route")
+            route_path = getattr(route, "path", None) or "unmatched"
+            self.registry.observe(
+                scope["method"], route_path, status_code, time.perf_counter() - started, timings
+            )
+
+
+def snapshot_gauges(values: dict[str, Any], prefix: str) -> str:
+    """Render a flat mapping of numeric values as Prometheus gauges."""
+    lines = []
+    for key, value in values.items():
+        if isinstance(value, bool) or not isinstance(value, (int, float)):
+            continue
+        name = f"{prefix}_{key}"
+        lines.append(f"# TYPE {name} gauge")
+        lines.append(f"{name} {value}")
+    return "\n".join(lines) + ("\n" if lines else "")
@@ -0,0 +1,45 @@
+"""JSON response classes for the serialization fast path."""
+from functools import lru_cache
+
+from fastapi.responses import JSONResponse, ORJSONResponse
+from pydantic import BaseModel
+from starlette.responses import Response
+
+from app.core.config import Settings
+
+try:  # optional, faster JSON for responses built from plain dicts
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
+
+
+@lru_cache(maxsize=128)
+def _encode_frozen(model: BaseModel) -> bytes:
+    return model.__pydantic_serializer__.to_json(model)
+
+
+def encode_model(model: BaseModel) -> bytes:
+    """Serialize ``model`` to JSON bytes; frozen models (constant bodies) are encoded once."""
+    if model.model_config.get("frozen"):
+        return _encode_frozen(model)
+    return model.__pydantic_serializer__.to_json(model)
+
+
+class ModelResponse(JSONResponse):
+    """Render an already validated pydantic model straight to bytes.
+
+    Returning a response from a route bypasses FastAPI's ``response_model``
+    round trip (validate again, ``jsonable_encoder``, ``json.dumps``); the
+    route's ``response_model`` still documents the schema. The bytes are the
+    same the round trip would produce.
+    """
+
+    def render(self, content: BaseModel) -> bytes:
+        return encode_model(content)
+
+
+def default_response_class(settings: Settings) -> type[Response]:
+    """orjson-backed responses when ``fast_json_responses`` is on and orjson is installed."""
+    if settings.fast_json_responses and orjson is not None:
+        return ORJSONResponse
+    return JSONResponse
@@ -1,25 +1,194 @@
 """Security helpers for hashing secrets and minting JWT tokens."""
+import base64
+import hashlib
+import hmac
+import json
 import os
-from datetime import datetime, timedelta, timezone
+import time
+from functools import lru_cache
+from typing import Any, Protocol
 
-from jose import jwt
+from jose import JWTError, jwt
 from passlib.context import CryptContext
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+
+try:  # optional, faster JSON for the native codec
+    import orjson
+except ImportError:  # pragma: no cover - depends on the environment
+    orjson = None
 
 # Skip bcrypt wrap detection that can raise on some platforms (e.g., musllinux builds).
 os.environ.setdefault("PASSLIB_BCRYPT_NO_WRAP_CHECK", "1")
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+def build_password_context(rounds: int) -> CryptContext:
+    """Return a bcrypt context that hashes with ``rounds`` and flags any other cost for update."""
+    return CryptContext(
+        schemes=["bcrypt"],
+        deprecated="auto",
+        bcrypt__default_rounds=rounds,
+        bcrypt__min_rounds=rounds,
+        bcrypt__max_rounds=rounds,
+    )
+
+
+pwd_context = build_password_context(get_settings().bcrypt_rounds)
+
+
+class TokenError(Exception):
+    """Raised when a token is malformed, forged, or expired, whatever the backend."""
+
+
+class TokenCodec(Protocol):
+    """Signs and verifies JWT claim sets."""
+
+    def encode(self, claims: dict[str, Any]) -> str: ...
+
+    def decode(self, token: str) -> dict[str, Any]: ...
+
+
+class JoseTokenCodec:
+    """Default codec built on python-jose, which supports every configured algorithm."""
+
+    def __init__(self, settings: Settings) -> None:
+        self._key = settings.jwt_secret_key
+        self._algorithm = settings.jwt_algorithm
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        return jwt.encode(claims, self._key, algorithm=self._algorithm)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            return jwt.decode(token, self._key, algorithms=[self._algorithm])
+        except JWTError as exc:
+            raise TokenError(str(exc)) from exc
+
+
+class PyJWTTokenCodec:
+    """Codec backed by PyJWT (optional dependency)."""
+
+    def __init__(self, settings: Settings) -> None:
+        import jwt as pyjwt
+
+        self._pyjwt = pyjwt
+        self._key = settings.jwt_secret_key
+        self._algorithm = settings.jwt_algorithm
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        return self._pyjwt.encode(claims, self._key, algorithm=self._algorithm)
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            return self._pyjwt.decode(token, self._key, algorithms=[self._algorithm])
+        except self._pyjwt.PyJWTError as exc:
+            raise TokenError(str(exc)) from exc
+
+
+def _b64encode(data: bytes) -> bytes:
+    return base64.urlsafe_b64encode(data).rstrip(b"=")
+
+
+def _b64decode(data: bytes) -> bytes:
+    return base64.urlsafe_b64decode(data + b"=" * (-len(data) % 4))
+
+
+def _dumps(value: dict[str, Any]) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value)
+    return json.dumps(value, separators=(",", ":")).encode()
+
+
+_HMAC_DIGESTS = {"HS256": hashlib.sha256, "HS384": hashlib.sha384, "HS512": hashlib.sha512}
+
+
+class NativeHmacTokenCodec:
+    """Stdlib ``hmac`` codec for HS* algorithms with a precomputed header segment.
+
+    The encoded header and the HMAC key state are prepared once; encoding then
+    only serialises the claims (with orjson when installed) and signs.
+    Tokens are interchangeable with the other codecs.
+    """
+
+    def __init__(self, settings: Settings) -> None:
+        try:
+            digest = _HMAC_DIGESTS[settings.jwt_algorithm]
+        except KeyError:
+            msg = f"native JWT backend only supports {', '.join(_HMAC_DIGESTS)}"
+            raise ValueError(msg) from None
+        self._algorithm = settings.jwt_algorithm
+        self._mac = hmac.new(settings.jwt_secret_key.encode(), digestmod=digest)
+        header = json.dumps({"alg": self._algorithm, "typ": "JWT"}, separators=(",", ":"), sort_keys=True)
+        self._header_segment = _b64encode(header.encode())
+
+    def _sign(self, signing_input: bytes) -> bytes:
+        mac = self._mac.copy()
+        mac.update(signing_input)
+        return _b64encode(mac.digest())
+
+    def encode(self, claims: dict[str, Any]) -> str:
+        signing_input = self._header_segment + b"." + _b64encode(_dumps(claims))
+        return (signing_input + b"." + self._sign(signing_input)).decode()
+
+    def decode(self, token: str) -> dict[str, Any]:
+        try:
+            raw = token.encode("ascii")
+            header_segment, payload_segment, signature = raw.split(b".")
+            if header_segment != self._header_segment:
+                header = json.loads(_b64decode(header_segment))
+                if not isinstance(header, dict) or header.get("alg") != self._algorithm:
+                    raise TokenError("unexpected signing algorithm")
+            signing_input = header_segment + b"." + payload_segment
+            if not hmac.compare_digest(self._sign(signing_input), signature):
+                raise TokenError("signature verification failed")
+            claims = json.loads(_b64decode(payload_segment))
+        except TokenError:
+            raise
+        except (ValueError, UnicodeError) as exc:
+            raise TokenError("malformed token") from exc
+        if not isinstance(claims, dict):
+            raise TokenError("malformed token")
+        expires_at = claims.get("exp")
+        if expires_at is not None and (not isinstance(expires_at, (int, float)) or expires_at <= time.time()):
+            raise TokenError("token has expired")
+        return claims
+
+
+_TOKEN_CODECS: dict[str, type[TokenCodec]] = {
+    "jose": JoseTokenCodec,
+    "pyjwt": PyJWTTokenCodec,
+    "native": NativeHmacTokenCodec,
+}
+
+
+def build_token_codec(settings: Settings) -> TokenCodec:
+    """Instantiate the codec named by ``settings.jwt_backend``."""
+    return _TOKEN_CODECS[settings.jwt_backend](settings)
+
+
+@lru_cache
+def get_token_codec() -> TokenCodec:
+    """Return the process-wide codec, built once with its key material."""
+    return build_token_codec(get_settings())
+
+
+@lru_cache
+def _access_token_lifetime() -> int:
+    return get_settings().access_token_expire_minutes * 60
 
 
 def create_access_token(subject: str) -> str:
     """Return a signed JWT encoding the subject and expiration claims."""
-    settings = get_settings()
-    expires_delta = timedelta(minutes=settings.access_token_expire_minutes)
-    expire_at = datetime.now(timezone.utc) + expires_delta
-    payload = {"sub": subject, "exp": expire_at}
-    return jwt.encode(payload, settings.jwt_secret_key, algorithm=settings.jwt_algorithm)
+    payload = {"sub": subject, "exp": int(time.time()) + _access_token_lifetime()}
+    return get_token_codec().encode(payload)
+
+
+def decode_access_token(token: str) -> dict[str, Any]:
+    """Verify the signature and expiry of ``token`` and return its claims.
+
+    Raises :class:`TokenError` when the token is malformed, forged or expired.
+    """
+    return get_token_codec().decode(token)
 
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -27,6 +196,15 @@ def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
 
 
+def password_needs_rehash(hashed_password: str) -> bool:
+    """Return ``True`` when ``hashed_password`` was made with a different scheme or cost.
+
+    This is the check half of ``CryptContext.verify_and_update``; it only parses
+    the hash, so callers can defer the expensive rehash off the request path.
+    """
+    return pwd_context.needs_update(hashed_password)
+
+
 def get_password_hash(password: str) -> str:
     """Produce a salted hash suitable for persistence."""
     return pwd_context.hash(password)
@@ -0,0 +1,95 @@
+"""Bounded LRU cache of verified access-token claims."""
+from __future__ import annotations
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any
+
+from app.core.config import get_settings
+from app.core.security import decode_access_token
+
+
+class TokenCache:
+    """Maps a token's SHA-256 digest to its decoded claims until ``exp``.
+
+    Only tokens that verified successfully are stored, so a hit skips the HMAC
+    check and JSON parsing without ever accepting a token that failed them.
+    """
+
+    def __init__(self, max_size: int) -> None:
+        self.max_size = max_size
+        self._entries: OrderedDict[bytes, tuple[float, dict[str, Any]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    @staticmethod
+    def _key(token: str) -> bytes:
+        return hashlib.sha256(token.encode()).digest()
+
+    def get(self, token: str) -> dict[str, Any] | None:
+        key = self._key(token)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                self.misses += 1
+                return None
+            expires_at, claims = entry
+            if expires_at <= time.time():
+                del self._entries[key]
+                self.expirations += 1
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return claims
+
+    def put(self, token: str, claims: dict[str, Any]) -> None:
+        expires_at = claims.get("exp")
+        if self.max_size <= 0 or not isinstance(expires_at, (int, float)):
+            return
+        key = self._key(token)
+        with self._lock:
+            self._entries[key] = (float(expires_at), claims)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.max_size:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self._entries.clear()
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "size": len(self._entries),
+                "max_size": self.max_size,
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_ratio": self.hits / lookups if lookups else 0.0,
+                "evictions": self.evictions,
+                "expirations": self.expirations,
+            }
+
+
+@lru_cache
+def get_token_cache() -> TokenCache:
+    """Return the process-wide token cache sized from ``Settings``."""
+    return TokenCache(get_settings().token_cache_max_size)
+
+
+def verify_access_token(token: str) -> dict[str, Any]:
+    """Return the token's claims, decoding and verifying only on a cache miss."""
+    cache = get_token_cache()
+    claims = cache.get(token)
+    if claims is None:
+        claims = decode_access_token(token)
+        cache.put(token, claims)
+    return claims
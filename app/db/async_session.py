@@ -0,0 +1,52 @@
+"""Async SQLAlchemy engine and session utilities (aiosqlite/aiomysql)."""
+import os
+from collections.abc import AsyncGenerator
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.ext.asyncio import AsyncEngine, AsyncSession, async_sessionmaker, create_async_engine
+
+from app.core.config import get_settings
+from app.core.request_metrics import instrument_statement_timing
+from app.db.pool_metrics import TimedAsyncAdaptedQueuePool, instrument_pool
+from app.db.session import pool_options
+
+
+@lru_cache
+def get_async_engine() -> AsyncEngine:
+    """Create the async engine on first use so the sync stack never imports async drivers."""
+    settings = get_settings()
+    url = settings.async_connection_uri
+    engine_kwargs: dict[str, Any] = pool_options(settings, url)
+    if not url.startswith("sqlite"):
+        engine_kwargs["poolclass"] = TimedAsyncAdaptedQueuePool
+    engine = create_async_engine(url, **engine_kwargs)
+    instrument_pool(engine.sync_engine)
+    if settings.request_metrics_enabled:
+        instrument_statement_timing(engine.sync_engine)
+    return engine
+
+
+def _reset_pool_after_fork() -> None:
+    """See ``app.db.session._reset_pools_after_fork``; the async pool is reset the same way."""
+    if get_async_engine.cache_info().currsize:
+        get_async_engine().sync_engine.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pool_after_fork)
+
+
+@lru_cache
+def get_async_sessionmaker() -> async_sessionmaker[AsyncSession]:
+    return async_sessionmaker(bind=get_async_engine(), autoflush=False, expire_on_commit=False)
+
+
+def get_async_session_factory() -> async_sessionmaker[AsyncSession]:
+    """Provide the session factory for work that outlives the request's session."""
+    return get_async_sessionmaker()
+
+
+async def get_async_db() -> AsyncGenerator[AsyncSession, None]:
+    """Yield an async database session for request-scoped usage."""
+    async with get_async_sessionmaker()() as db:
+        yield db
@@ -0,0 +1,32 @@
+"""Index DDL for migrations that must not block writes on large MySQL tables.
+
+On MySQL the statements request ``ALGORITHM=INPLACE, LOCK=NONE`` so InnoDB
+builds or drops the index while reads and writes continue; if the server
+cannot honour that it fails fast instead of silently copying the table.
+Other dialects fall back to Alembic's regular operations.
+"""
+from collections.abc import Sequence
+
+from alembic import op
+
+_ONLINE = "ALGORITHM=INPLACE, LOCK=NONE"
+
+
+def _is_mysql() -> bool:
+    return op.get_context().dialect.name in {"mysql", "mariadb"}
+
+
+def create_index(name: str, table: str, columns: Sequence[str], *, unique: bool = False) -> None:
+    if not _is_mysql():
+        op.create_index(name, table, list(columns), unique=unique)
+        return
+    kind = "UNIQUE INDEX" if unique else "INDEX"
+    column_list = ", ".join(f"`{column}`" for column in columns)
+    op.execute(f"ALTER TABLE `{table}` ADD {kind} `{name}` ({column_list}), {_ONLINE}")
+
+
+def drop_index(name: str, table: str) -> None:
+    if not _is_mysql():
+        op.drop_index(name, table_name=table)
+        return
+    op.execute(f"ALTER TABLE `{table}` DROP INDEX `{name}`, {_ONLINE}")
@@ -0,0 +1,145 @@
+"""Connection pool instrumentation collected through SQLAlchemy pool events.
+
+Every instrumented engine keeps its own :class:`PoolMetrics`, so the sync and
+async engines of one process are reported separately.
+"""
+from __future__ import annotations
+
+import threading
+import time
+import weakref
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+
+class PoolMetrics:
+    """Thread-safe counters describing connection pool behaviour."""
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.reset()
+
+    def reset(self) -> None:
+        with self._lock:
+            self.connects = 0
+            self.checkouts = 0
+            self.checkins = 0
+            self.invalidations = 0
+            self.soft_invalidations = 0
+            self.checkout_wait_total = 0.0
+            self.checkout_wait_max = 0.0
+            self.checkout_timeouts = 0
+
+    def increment(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def observe_checkout_wait(self, seconds: float, timed_out: bool = False) -> None:
+        with self._lock:
+            self.checkout_wait_total += seconds
+            if seconds > self.checkout_wait_max:
+                self.checkout_wait_max = seconds
+            if timed_out:
+                self.checkout_timeouts += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            average = self.checkout_wait_total / self.checkouts if self.checkouts else 0.0
+            return {
+                "connects": self.connects,
+                "checkouts": self.checkouts,
+                "checkins": self.checkins,
+                "invalidations": self.invalidations,
+                "soft_invalidations": self.soft_invalidations,
+                "checkout_timeouts": self.checkout_timeouts,
+                "checkout_wait_avg_seconds": average,
+                "checkout_wait_max_seconds": self.checkout_wait_max,
+            }
+
+
+_engine_metrics: weakref.WeakKeyDictionary[Engine, PoolMetrics] = weakref.WeakKeyDictionary()
+
+
+class _TimedCheckout:
+    """Records how long callers wait for a connection into the pool's ``metrics``.
+
+    Pool events fire only once a connection is handed out, so the wait itself
+    is measured around the pool's internal checkout. ``metrics`` is set by
+    :func:`instrument_pool` and survives ``engine.dispose()``.
+    """
+
+    metrics: PoolMetrics | None = None
+
+    def recreate(self):  # type: ignore[no-untyped-def]
+        pool = super().recreate()  # type: ignore[misc]
+        pool.metrics = self.metrics
+        return pool
+
+    def _do_get(self):  # type: ignore[no-untyped-def]
+        started = time.perf_counter()
+        try:
+            connection = super()._do_get()  # type: ignore[misc]
+        except Exception:
+            if self.metrics is not None:
+                self.metrics.observe_checkout_wait(time.perf_counter() - started, timed_out=True)
+            raise
+        if self.metrics is not None:
+            self.metrics.observe_checkout_wait(time.perf_counter() - started)
+        return connection
+
+
+class TimedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool that records checkout wait times."""
+
+
+class TimedAsyncAdaptedQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """The async engine's queue pool, recording checkout wait times."""
+
+
+def instrument_pool(engine: Engine) -> PoolMetrics:
+    """Attach pool event listeners feeding a new :class:`PoolMetrics` for ``engine``."""
+    pool_metrics = _engine_metrics[engine] = PoolMetrics()
+    if isinstance(engine.pool, _TimedCheckout):
+        engine.pool.metrics = pool_metrics
+
+    @event.listens_for(engine, "connect")
+    def _on_connect(*_: Any) -> None:
+        pool_metrics.increment("connects")
+
+    @event.listens_for(engine, "checkout")
+    def _on_checkout(*_: Any) -> None:
+        pool_metrics.increment("checkouts")
+
+    @event.listens_for(engine, "checkin")
+    def _on_checkin(*_: Any) -> None:
+        pool_metrics.increment("checkins")
+
+    @event.listens_for(engine, "invalidate")
+    def _on_invalidate(*_: Any) -> None:
+        pool_metrics.increment("invalidations")
+
+    @event.listens_for(engine, "soft_invalidate")
+    def _on_soft_invalidate(*_: Any) -> None:
+        pool_metrics.increment("soft_invalidations")
+
+    return pool_metrics
+
+
+def pool_status(engine: Engine) -> dict[str, Any]:
+    """Combine the live pool state with the engine's accumulated event counters."""
+    pool = engine.pool
+    status: dict[str, Any] = {"pool_class": type(pool).__name__}
+    if isinstance(pool, QueuePool):
+        status |= {
+            "size": pool.size(),
+            "checked_out": pool.checkedout(),
+            "checked_in": pool.checkedin(),
+            "overflow": pool.overflow(),
+        }
+    pool_metrics = _engine_metrics.get(engine)
+    if pool_metrics is not None:
+        status |= pool_metrics.snapshot()
+    return status
@@ -0,0 +1,209 @@
+"""Read-replica routing for lookup queries.
+
+Repositories opt individual statements in with :func:`replica_read`; everything
+else, and every statement once a session has started writing, goes to the
+primary. Replicas are used round-robin and one that fails to serve a statement
+is skipped for ``db_replica_retry_seconds`` while its statement is retried on
+the primary.
+"""
+from __future__ import annotations
+
+import itertools
+import logging
+import threading
+import time
+from collections.abc import Callable, Sequence
+from typing import Any, TypeVar
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine, Row
+from sqlalchemy.exc import InterfaceError, OperationalError
+from sqlalchemy.orm import Session
+from sqlalchemy.sql import CompoundSelect, Executable, Select
+
+from app.core.config import Settings
+
+logger = logging.getLogger(__name__)
+
+REPLICA_OPTION = "use_replica"
+# Set by UnitOfWork.begin(); any read inside the scope must see its own writes.
+WRITE_TRANSACTION_KEY = "write_transaction"
+
+StatementT = TypeVar("StatementT", bound=Executable)
+
+
+def replica_read(statement: StatementT) -> StatementT:
+    """Mark a read-only lookup as safe to serve from a replica."""
+    return statement.execution_options(**{REPLICA_OPTION: True})
+
+
+class _Replica:
+    __slots__ = ("engine", "failed_at", "reads", "failures")
+
+    def __init__(self, engine: Engine) -> None:
+        self.engine = engine
+        self.failed_at: float | None = None
+        self.reads = 0
+        self.failures = 0
+
+
+class ReplicaSet:
+    """Round-robin over replica engines that skips replicas in their failure cooldown."""
+
+    def __init__(self, engines: Sequence[Engine], retry_after_seconds: float = 30.0) -> None:
+        self._replicas = [_Replica(engine) for engine in engines]
+        self._cycle = itertools.cycle(self._replicas)
+        self._retry_after = retry_after_seconds
+        self._lock = threading.Lock()
+        self.failovers = 0
+        self.miss_fallbacks = 0
+
+    def choose(self) -> Engine | None:
+        """Return the next healthy replica, or ``None`` when all are cooling down."""
+        now = time.monotonic()
+        with self._lock:
+            for _ in range(len(self._replicas)):
+                replica = next(self._cycle)
+                if replica.failed_at is None or now - replica.failed_at >= self._retry_after:
+                    replica.reads += 1
+                    return replica.engine
+        return None
+
+    def mark_failed(self, engine: Engine) -> None:
+        with self._lock:
+            self.failovers += 1
+            for replica in self._replicas:
+                if replica.engine is engine:
+                    replica.failed_at = time.monotonic()
+                    replica.failures += 1
+
+    def record_miss_fallback(self) -> None:
+        with self._lock:
+            self.miss_fallbacks += 1
+
+    def snapshot(self) -> dict[str, Any]:
+        now = time.monotonic()
+        with self._lock:
+            healthy = [
+                replica.failed_at is None or now - replica.failed_at >= self._retry_after
+                for replica in self._replicas
+            ]
+            return {
+                "replicas": len(self._replicas),
+                "healthy_replicas": sum(healthy),
+                "replica_reads": sum(replica.reads for replica in self._replicas),
+                "replica_failures": sum(replica.failures for replica in self._replicas),
+                "failovers": self.failovers,
+                "miss_fallbacks": self.miss_fallbacks,
+            }
+
+    def dispose(self, close: bool = True) -> None:
+        for replica in self._replicas:
+            replica.engine.dispose(close=close)
+
+
+class RoutingSession(Session):
+    """Session that serves statements tagged with :func:`replica_read` from a replica.
+
+    The session is pinned to the primary while it has pending changes, inside a
+    unit of work, and for the rest of any transaction that flushed or executed DML,
+    so reads that follow a write always see it.
+    """
+
+    def __init__(self, *args: Any, replicas: ReplicaSet | None = None, fallback_on_miss: bool = True, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.replicas = replicas
+        self.fallback_on_miss = fallback_on_miss
+        self.last_bind_was_replica = False
+        self._routed_to: Engine | None = None
+        self._bypass_replicas = False
+        self._pinned = False
+
+    def _pinned_to_primary(self) -> bool:
+        return (
+            self._pinned
+            or self._bypass_replicas
+            or self._flushing
+            or bool(self.new or self.dirty or self.deleted)
+            or bool(self.info.get(WRITE_TRANSACTION_KEY))
+        )
+
+    def get_bind(self, mapper: Any = None, clause: Any = None, **kwargs: Any) -> Any:
+        if (
+            self.replicas is not None
+            and clause is not None
+            and clause.get_execution_options().get(REPLICA_OPTION)
+            and not self._pinned_to_primary()
+        ):
+            engine = self.replicas.choose()
+            if engine is not None:
+                self._routed_to = engine
+                return engine
+        return super().get_bind(mapper, clause=clause, **kwargs)
+
+    def execute(self, statement: Any, *args: Any, **kwargs: Any) -> Any:
+        if getattr(statement, "is_dml", False):
+            self._pinned = True
+        if isinstance(statement, CompoundSelect):
+            # The ORM does not pass compound selects on to ``get_bind``.
+            kwargs["bind_arguments"] = {"clause": statement, **(kwargs.get("bind_arguments") or {})}
+        self._routed_to = None
+        try:
+            result = super().execute(statement, *args, **kwargs)
+        except (OperationalError, InterfaceError):
+            failed = self._routed_to
+            if failed is None or self.replicas is None:
+                raise
+            logger.warning("Replica %s failed; retrying on the primary", failed.url.render_as_string())
+            self.replicas.mark_failed(failed)
+            self._bypass_replicas = True
+            try:
+                result = super().execute(statement, *args, **kwargs)
+            finally:
+                self._bypass_replicas = False
+            self.last_bind_was_replica = False
+            return result
+        self.last_bind_was_replica = self._routed_to is not None
+        return result
+
+    def flush(self, objects: Any = None) -> None:
+        if self.new or self.dirty or self.deleted:
+            self._pinned = True
+        super().flush(objects)
+
+
+@event.listens_for(RoutingSession, "after_transaction_end")
+def _unpin_after_transaction(session: Session, transaction: Any) -> None:
+    if transaction.parent is None and isinstance(session, RoutingSession):
+        session._pinned = False
+
+
+def read_first(db: Session, *statements: Select | CompoundSelect) -> Row | None:
+    """Return the first row produced by ``statements`` tried in order, preferring a replica.
+
+    When every statement misses on a replica and ``fallback_on_miss`` is set,
+    they are retried on the primary, so rows written moments ago (and not yet
+    replicated) are still found.
+    """
+    served_by_replica = False
+    for statement in statements:
+        row = db.execute(replica_read(statement)).first()
+        if row is not None:
+            return row
+        served_by_replica = served_by_replica or getattr(db, "last_bind_was_replica", False)
+    if not (served_by_replica and db.fallback_on_miss):
+        return None
+    db.replicas.record_miss_fallback()
+    for statement in statements:
+        row = db.execute(statement).first()
+        if row is not None:
+            return row
+    return None
+
+
+def build_replica_set(settings: Settings, engine_factory: Callable[[str], Engine]) -> ReplicaSet | None:
+    """Create one engine per ``db_replica_urls`` entry, or ``None`` when there are none."""
+    if not settings.db_replica_urls:
+        return None
+    engines = [engine_factory(url) for url in settings.db_replica_urls]
+    return ReplicaSet(engines, settings.db_replica_retry_seconds)
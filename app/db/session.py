@@ -1,24 +1,114 @@
 """SQLAlchemy session and metadata utilities."""
-from collections.abc import Generator
+import os
+from collections.abc import Callable, Generator
+from functools import lru_cache
 from typing import Any
 
 from sqlalchemy import create_engine
-from sqlalchemy.orm import declarative_base, sessionmaker
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
-from app.core.config import get_settings
+from app.core.config import Settings, get_settings
+from app.db.pool_metrics import TimedQueuePool, instrument_pool
+from app.db.replicas import ReplicaSet, RoutingSession, build_replica_set
 
-settings = get_settings()
-_database_url = settings.database_url or settings.mysql_connection_uri
 
-_engine_kwargs: dict[str, Any] = {"pool_pre_ping": True}
-if _database_url.startswith("sqlite"):
-    _engine_kwargs["connect_args"] = {"check_same_thread": False}
+def pool_options(app_settings: Settings, url: str) -> dict[str, Any]:
+    """Translate the ``db_pool_*`` settings into engine keyword arguments.
+
+    With pre-ping disabled, connection liveness relies on ``pool_recycle``
+    alone, which saves a round trip on every checkout.
+    """
+    options: dict[str, Any] = {"pool_pre_ping": app_settings.db_pool_pre_ping}
+    if url.startswith("sqlite"):
+        return options
+    return options | {
+        "pool_size": app_settings.db_pool_size,
+        "max_overflow": app_settings.db_max_overflow,
+        "pool_timeout": app_settings.db_pool_timeout,
+        "pool_recycle": app_settings.db_pool_recycle,
+    }
+
+
+def _engine_options(app_settings: Settings, url: str) -> dict[str, Any]:
+    options = pool_options(app_settings, url)
+    if url.startswith("sqlite"):
+        options["connect_args"] = {"check_same_thread": False}
+    return options
+
+
+@lru_cache
+def get_engine() -> Engine:
+    """Create the engine on first use; importing the app never touches the database."""
+    settings = get_settings()
+    url = settings.database_url or settings.mysql_connection_uri
+    engine_kwargs = _engine_options(settings, url)
+    if not url.startswith("sqlite"):
+        engine_kwargs["poolclass"] = TimedQueuePool
+    engine = create_engine(url, **engine_kwargs)
+    instrument_pool(engine)
+    return engine
+
+
+@lru_cache
+def get_replica_set() -> ReplicaSet | None:
+    """Create the replica engines on first use; ``None`` when no replicas are configured."""
+    settings = get_settings()
+    return build_replica_set(settings, lambda url: create_engine(url, **_engine_options(settings, url)))
+
+
+@lru_cache
+def get_sessionmaker() -> sessionmaker[Session]:
+    replicas = get_replica_set()
+    if replicas is None:
+        return sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=get_engine())
+    return sessionmaker(
+        class_=RoutingSession,
+        autocommit=False,
+        autoflush=False,
+        expire_on_commit=False,
+        bind=get_engine(),
+        replicas=replicas,
+        fallback_on_miss=get_settings().db_replica_fallback_on_miss,
+    )
+
+
+def dispose_engines() -> None:
+    """Close pooled connections at shutdown; engines that were never created are skipped."""
+    if get_engine.cache_info().currsize:
+        get_engine().dispose()
+    if get_replica_set.cache_info().currsize and (replicas := get_replica_set()) is not None:
+        replicas.dispose()
+
+
+def _reset_pools_after_fork() -> None:
+    """Give a forked worker fresh pools instead of the parent's connections.
+
+    ``close=False`` drops the inherited connections without closing them, so
+    the parent's sockets are left untouched; the child connects on first use.
+    """
+    if get_engine.cache_info().currsize:
+        get_engine().dispose(close=False)
+    if get_replica_set.cache_info().currsize and (replicas := get_replica_set()) is not None:
+        replicas.dispose(close=False)
+
+
+os.register_at_fork(after_in_child=_reset_pools_after_fork)
+
+
+def SessionLocal() -> Session:  # noqa: N802 - keeps the familiar sessionmaker call sites
+    """Open a session bound to the lazily created engine."""
+    return get_sessionmaker()()
+
 
-engine = create_engine(_database_url, **_engine_kwargs)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 Base = declarative_base()
 
 
+def get_session_factory() -> Callable[[], Session]:
+    """Provide the session factory for work that outlives the request's session."""
+    return SessionLocal
+
+
 def get_db() -> Generator:
     """Yield a database session for request-scoped usage."""
     db = SessionLocal()
@@ -0,0 +1,45 @@
+"""Transaction scopes so each service operation commits exactly once."""
+from __future__ import annotations
+
+from collections.abc import AsyncIterator, Iterator
+from contextlib import asynccontextmanager, contextmanager
+
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from app.db.replicas import WRITE_TRANSACTION_KEY
+
+
+class UnitOfWork:
+    """Wraps a session; repositories only flush and the scope commits or rolls back."""
+
+    def __init__(self, db: Session) -> None:
+        self._db = db
+
+    @contextmanager
+    def begin(self) -> Iterator[None]:
+        self._db.info[WRITE_TRANSACTION_KEY] = True
+        try:
+            yield
+            self._db.commit()
+        except BaseException:
+            self._db.rollback()
+            raise
+        finally:
+            self._db.info.pop(WRITE_TRANSACTION_KEY, None)
+
+
+class AsyncUnitOfWork:
+    """Async counterpart of :class:`UnitOfWork`."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    @asynccontextmanager
+    async def begin(self) -> AsyncIterator[None]:
+        try:
+            yield
+            await self._db.commit()
+        except BaseException:
+            await self._db.rollback()
+            raise
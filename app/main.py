@@ -1,18 +1,109 @@
 """FastAPI application entrypoint."""
-from fastapi import FastAPI
+import asyncio
+from collections.abc import AsyncIterator, Callable
+from contextlib import AbstractAsyncContextManager, asynccontextmanager
 
-from app.core.config import get_settings
+import anyio.to_thread
+from fastapi import FastAPI, Request, status
+from fastapi.responses import JSONResponse
+
+from app.core.config import Settings, get_settings
+from app.core.hashing import HashingPoolSaturatedError, get_hashing_executor
+from app.core.rate_limit import RateLimitExceededError
+from app.core.request_metrics import RequestMetricsMiddleware, instrument_statement_timing
+from app.core.responses import default_response_class
 from app.db import base  # noqa: F401 -- ensures models are imported for Alembic
-from app.db.session import Base, engine
+from app.db.async_session import get_async_engine
+from app.db.session import Base, dispose_engines, get_engine
+from app.routers.auth_router import async_router as async_auth_router
 from app.routers.auth_router import router as auth_router
+from app.routers.metrics_router import router as metrics_router
+from app.routers.user_import_router import router as user_import_router
+from app.services.auth_service import get_auth_collaborators
+from app.services.email_outbox import get_email_outbox
+from app.services.identifier_filter import get_identifier_filter
+from app.services.password_rehash import get_password_rehasher
+from app.services.token_sweeper import get_token_sweeper
+from app.services.user_import import get_import_hash_pool
 
 settings = get_settings()
 
 
-def create_app() -> FastAPI:
+def _lifespan(app_settings: Settings) -> Callable[[FastAPI], AbstractAsyncContextManager[None]]:
+    """Do the database and background-thread work at startup rather than at import."""
+
+    @asynccontextmanager
+    async def lifespan(_: FastAPI) -> AsyncIterator[None]:
+        # Threads available to sync routes and dependencies on this worker's event loop.
+        anyio.to_thread.current_default_thread_limiter().total_tokens = app_settings.threadpool_tokens
+        if app_settings.db_bootstrap_schema:
+            await asyncio.to_thread(Base.metadata.create_all, bind=get_engine())
+        if app_settings.request_metrics_enabled:
+            instrument_statement_timing(get_engine())
+        get_auth_collaborators()
+        if app_settings.identifier_filter_enabled:
+            get_identifier_filter().start()
+        if app_settings.token_sweeper_enabled:
+            get_token_sweeper().start()
+        yield
+        await _release_resources()
+
+    return lifespan
+
+
+async def _release_resources() -> None:
+    get_auth_collaborators.cache_clear()
+    if get_password_rehasher.cache_info().currsize:
+        get_password_rehasher().stop()
+    if get_identifier_filter.cache_info().currsize:
+        get_identifier_filter().stop()
+    if get_hashing_executor.cache_info().currsize:
+        get_hashing_executor().shutdown()
+        get_hashing_executor.cache_clear()
+    if get_token_sweeper.cache_info().currsize:
+        get_token_sweeper().stop()
+    if get_email_outbox.cache_info().currsize:
+        get_email_outbox().stop()
+        get_email_outbox.cache_clear()
+    if get_import_hash_pool.cache_info().currsize:
+        get_import_hash_pool().shutdown(wait=False, cancel_futures=True)
+        get_import_hash_pool.cache_clear()
+    if get_async_engine.cache_info().currsize:
+        await get_async_engine().dispose()
+    dispose_engines()
+
+
+def create_app(app_settings: Settings | None = None) -> FastAPI:
     """Build and configure the FastAPI application instance."""
-    application = FastAPI(title=settings.project_name, version="1.0.0")
-    application.include_router(auth_router, prefix=settings.api_prefix)
+    app_settings = app_settings or settings
+    application = FastAPI(
+        title=app_settings.project_name,
+        version="1.0.0",
+        lifespan=_lifespan(app_settings),
+        default_response_class=default_response_class(app_settings),
+    )
+    selected_auth_router = async_auth_router if app_settings.use_async_db else auth_router
+    application.include_router(selected_auth_router, prefix=app_settings.api_prefix)
+    application.include_router(user_import_router, prefix=app_settings.api_prefix)
+    if app_settings.request_metrics_enabled:
+        application.include_router(metrics_router)
+        application.add_middleware(RequestMetricsMiddleware)
+
+    @application.exception_handler(HashingPoolSaturatedError)
+    async def hashing_saturated_handler(_: Request, exc: HashingPoolSaturatedError) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            content={"detail": "service busy, retry later"},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
+
+    @application.exception_handler(RateLimitExceededError)
+    async def rate_limited_handler(_: Request, exc: RateLimitExceededError) -> JSONResponse:
+        return JSONResponse(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            content={"detail": "too many login attempts, retry later"},
+            headers={"Retry-After": str(exc.retry_after)},
+        )
 
     @application.get("/health", tags=["health"])
     def healthcheck() -> dict[str, str]:
@@ -21,7 +112,4 @@ def create_app() -> FastAPI:
     return application
 
 
-# Create database tables during startup for simple deployments.
-Base.metadata.create_all(bind=engine)
-
 app = create_app()
@@ -1,11 +1,16 @@
 """SQLAlchemy model for application users."""
-from sqlalchemy import Column, DateTime, Integer, String, func
+from sqlalchemy import Column, DateTime, Index, Integer, String, func
 
 from app.db.session import Base
 
 
 class User(Base):
     __tablename__ = "users"
+    __table_args__ = (
+        # Covering indexes: login reads (id, hashed_password) from the index alone.
+        Index("ix_users_email_hashed_password", "email", "hashed_password"),
+        Index("ix_users_username_hashed_password", "username", "hashed_password"),
+    )
 
     id = Column(Integer, primary_key=True, index=True)
     first_name = Column(String(100), nullable=False)
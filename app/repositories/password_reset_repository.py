@@ -3,44 +3,117 @@ from __future__ import annotations
 
 from datetime import datetime, timezone
 
+from sqlalchemy import Delete, Select, Update, and_, delete, or_, select, update
+from sqlalchemy.ext.asyncio import AsyncSession
 from sqlalchemy.orm import Session, joinedload
 
+from app.db.replicas import read_first
 from app.models.password_reset_token import PasswordResetToken
 
 
+def _build_token(user_id: int, token_hash: str, expires_at: datetime) -> PasswordResetToken:
+    return PasswordResetToken(
+        user_id=user_id,
+        token_hash=token_hash,
+        expires_at=expires_at,
+        used=False,
+        created_at=datetime.now(timezone.utc),
+    )
+
+
+def _remove_active_statement(user_id: int) -> Delete:
+    return delete(PasswordResetToken).where(
+        PasswordResetToken.user_id == user_id,
+        PasswordResetToken.used.is_(False),
+    )
+
+
+def _by_hash_statement(token_hash: str) -> Select[tuple[PasswordResetToken]]:
+    return (
+        select(PasswordResetToken)
+        .options(joinedload(PasswordResetToken.user))
+        .where(PasswordResetToken.token_hash == token_hash)
+    )
+
+
+def _claim_statement(token: PasswordResetToken) -> Update:
+    """Mark ``token`` used only if it still is unused, so two resets cannot share it."""
+    return (
+        update(PasswordResetToken)
+        .where(PasswordResetToken.id == token.id, PasswordResetToken.used.is_(False))
+        .values(used=True, used_at=datetime.now(timezone.utc))
+        .execution_options(synchronize_session="evaluate")
+    )
+
+
 class PasswordResetRepository:
-    """Encapsulates CRUD operations for password reset tokens."""
+    """Encapsulates CRUD operations for password reset tokens.
+
+    Mutations are left pending in the session; the service's unit of work commits.
+    """
 
     def __init__(self, db: Session) -> None:
         self._db = db
 
     def create(self, user_id: int, token_hash: str, expires_at: datetime) -> PasswordResetToken:
-        token = PasswordResetToken(user_id=user_id, token_hash=token_hash, expires_at=expires_at)
+        token = _build_token(user_id, token_hash, expires_at)
         self._db.add(token)
-        self._db.commit()
-        self._db.refresh(token)
         return token
 
     def remove_active_tokens_for_user(self, user_id: int) -> None:
-        self._db.query(PasswordResetToken).filter(
-            PasswordResetToken.user_id == user_id,
-            PasswordResetToken.used.is_(False),
-        ).delete(synchronize_session=False)
-        self._db.commit()
+        self._db.execute(_remove_active_statement(user_id), execution_options={"synchronize_session": False})
 
     def get_by_hash(self, token_hash: str) -> PasswordResetToken | None:
-        return (
-            self._db.query(PasswordResetToken)
-            .options(joinedload(PasswordResetToken.user))
-            .filter(PasswordResetToken.token_hash == token_hash)
-            .first()
+        row = read_first(self._db, _by_hash_statement(token_hash))
+        return row[0] if row is not None else None
+
+    def mark_used(self, token: PasswordResetToken) -> bool:
+        """Claim ``token``; returns ``False`` when it was used in the meantime."""
+        return self._db.execute(_claim_statement(token)).rowcount == 1
+
+    def purge_batch(self, expired_before: datetime, used_before: datetime, limit: int) -> int:
+        """Delete up to ``limit`` expired unused or long-used tokens and return how many went.
+
+        Ids are selected first so each DELETE is a short primary-key range that
+        holds row locks only briefly, on every backend. The count is the DELETE's
+        own, so rows another sweeper removed in between are not counted twice.
+        """
+        ids = self._db.execute(
+            select(PasswordResetToken.id)
+            .where(
+                or_(
+                    and_(PasswordResetToken.used.is_(False), PasswordResetToken.expires_at < expired_before),
+                    and_(PasswordResetToken.used.is_(True), PasswordResetToken.used_at < used_before),
+                )
+            )
+            .order_by(PasswordResetToken.id)
+            .limit(limit)
+        ).scalars().all()
+        if not ids:
+            return 0
+        result = self._db.execute(
+            delete(PasswordResetToken).where(PasswordResetToken.id.in_(ids)),
+            execution_options={"synchronize_session": False},
         )
+        return result.rowcount
+
 
-    def mark_used(self, token: PasswordResetToken) -> PasswordResetToken:
-        token.used = True
-        token.used_at = datetime.now(timezone.utc)
+class AsyncPasswordResetRepository:
+    """Async counterpart of :class:`PasswordResetRepository`."""
+
+    def __init__(self, db: AsyncSession) -> None:
+        self._db = db
+
+    async def create(self, user_id: int, token_hash: str, expires_at: datetime) -> PasswordResetToken:
+        token = _build_token(user_id, token_hash, expires_at)
         self._db.add(token)
-        self._db.commit()
-        self._db.refresh(token)
         return token
-*** End Patch
\ No newline at end of file
+
+    async def remove_active_tokens_for_user(self, user_id: int) -> None:
+        await self._db.execute(_remove_active_statement(user_id), execution_options={"synchronize_session": False})
+
+    async def get_by_hash(self, token_hash: str) -> PasswordResetToken | None:
+        return (await self._db.execute(_by_hash_statement(token_hash))).scalars().first()
+
+    async def mark_used(self, token: PasswordResetToken) -> bool:
+        return (await self._db.execute(_claim_statement(token))).rowcount == 1
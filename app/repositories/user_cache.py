@@ -0,0 +1,174 @@
+"""TTL cache of account lookups by login identifier, invalidated on every write."""
+from __future__ import annotations
+
+import importlib
+import threading
+import time
+from collections import OrderedDict
+from functools import lru_cache
+from typing import Any, NamedTuple, Protocol
+
+from app.core.config import Settings, get_settings
+
+
+class UserAccount(NamedTuple):
+    """The columns login and forgot-password need, small enough to cache."""
+
+    id: int
+    hashed_password: str
+    email: str
+    first_name: str
+
+
+class UserCacheBackend(Protocol):
+    """Key/value store with per-entry expiry (maps directly onto Redis ``GET``/``SETEX``/``DEL``)."""
+
+    def get(self, key: str) -> UserAccount | None: ...
+
+    def set(self, key: str, value: UserAccount, ttl_seconds: float) -> None: ...
+
+    def delete(self, keys: list[str]) -> None: ...
+
+
+class _Shard:
+    __slots__ = ("lock", "entries", "hits", "misses", "evictions", "expirations")
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        self.entries: OrderedDict[str, tuple[float, UserAccount]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+
+class StripedTTLCache:
+    """Process-local :class:`UserCacheBackend`: LRU shards, each behind its own lock.
+
+    A key only ever touches its own shard, so threadpool workers looking up
+    different accounts rarely wait on each other.
+    """
+
+    def __init__(self, max_size: int, shards: int = 16) -> None:
+        self._shards = [_Shard() for _ in range(max(1, shards))]
+        self._shard_size = max(1, max_size // len(self._shards))
+
+    def _shard(self, key: str) -> _Shard:
+        return self._shards[hash(key) % len(self._shards)]
+
+    def get(self, key: str) -> UserAccount | None:
+        shard = self._shard(key)
+        with shard.lock:
+            entry = shard.entries.get(key)
+            if entry is None:
+                shard.misses += 1
+                return None
+            expires_at, value = entry
+            if expires_at <= time.monotonic():
+                del shard.entries[key]
+                shard.expirations += 1
+                shard.misses += 1
+                return None
+            shard.entries.move_to_end(key)
+            shard.hits += 1
+            return value
+
+    def set(self, key: str, value: UserAccount, ttl_seconds: float) -> None:
+        shard = self._shard(key)
+        with shard.lock:
+            shard.entries[key] = (time.monotonic() + ttl_seconds, value)
+            shard.entries.move_to_end(key)
+            while len(shard.entries) > self._shard_size:
+                shard.entries.popitem(last=False)
+                shard.evictions += 1
+
+    def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            shard = self._shard(key)
+            with shard.lock:
+                shard.entries.pop(key, None)
+
+    def snapshot(self) -> dict[str, Any]:
+        totals = {"size": 0, "hits": 0, "misses": 0, "evictions": 0, "expirations": 0}
+        for shard in self._shards:
+            with shard.lock:
+                totals["size"] += len(shard.entries)
+                totals["hits"] += shard.hits
+                totals["misses"] += shard.misses
+                totals["evictions"] += shard.evictions
+                totals["expirations"] += shard.expirations
+        lookups = totals["hits"] + totals["misses"]
+        return totals | {
+            "max_size": self._shard_size * len(self._shards),
+            "shards": len(self._shards),
+            "hit_ratio": totals["hits"] / lookups if lookups else 0.0,
+        }
+
+
+class UserLookupCache:
+    """Caches :class:`UserAccount` rows by the exact email or username they were found by.
+
+    Only identifiers equal to the row's stored email or username are cached,
+    so invalidating those two keys always removes every entry for the user.
+    A lookup that was in flight while any invalidation happened is not
+    written back, so a read racing a password change cannot re-cache the old
+    hash in this process.
+    """
+
+    def __init__(self, settings: Settings | None = None, backend: UserCacheBackend | None = None) -> None:
+        settings = settings or get_settings()
+        self._ttl = settings.user_cache_ttl_seconds
+        self._backend = backend or _build_backend(settings)
+        self._lock = threading.Lock()
+        self._epoch = 0
+        self.invalidations = 0
+        self.skipped_writes = 0
+
+    @staticmethod
+    def _key(identifier: str) -> str:
+        return f"user:{identifier}"
+
+    def get(self, identifier: str) -> UserAccount | None:
+        return self._backend.get(self._key(identifier))
+
+    def read_token(self) -> int:
+        """Take before querying the database and pass to :meth:`put` with the result."""
+        return self._epoch
+
+    def put(self, identifier: str, account: UserAccount, stored_identifiers: tuple[str, str], token: int) -> None:
+        if identifier not in stored_identifiers:
+            return
+        # Writes and invalidations are serialized; both are rare next to cache hits,
+        # which only take their shard's lock.
+        with self._lock:
+            if token != self._epoch:
+                self.skipped_writes += 1
+                return
+            self._backend.set(self._key(identifier), account, self._ttl)
+
+    def invalidate(self, email: str, username: str) -> None:
+        with self._lock:
+            self._epoch += 1
+            self.invalidations += 1
+            self._backend.delete([self._key(email), self._key(username)])
+
+    def snapshot(self) -> dict[str, Any]:
+        backend_snapshot = getattr(self._backend, "snapshot", None)
+        with self._lock:
+            counters = {"invalidations": self.invalidations, "skipped_writes": self.skipped_writes}
+        return (backend_snapshot() if backend_snapshot else {}) | counters | {"ttl_seconds": self._ttl}
+
+
+def _build_backend(settings: Settings) -> UserCacheBackend:
+    """Resolve ``memory`` or a ``package.module:factory`` path returning a UserCacheBackend."""
+    if settings.user_cache_backend == "memory":
+        return StripedTTLCache(settings.user_cache_max_size, settings.user_cache_shards)
+    module_name, _, factory_name = settings.user_cache_backend.partition(":")
+    factory = getattr(importlib.import_module(module_name), factory_name)
+    return factory()
+
+
+@lru_cache
+def get_user_cache() -> UserLookupCache:
+    """Return the process-wide user lookup cache."""
+    return UserLookupCache()
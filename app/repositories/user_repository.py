@@ -1,47 +1,359 @@
 """Repository encapsulating all persistence logic for users."""
 from __future__ import annotations
 
-from sqlalchemy.orm import Session
+from datetime import datetime, timezone
+from collections.abc import Sequence
+from typing import TYPE_CHECKING, Any, NamedTuple
 
+from sqlalchemy import (
+    ColumnElement,
+    CompoundSelect,
+    Row,
+    Select,
+    event,
+    insert,
+    literal,
+    or_,
+    select,
+    union_all,
+    update,
+)
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import InstrumentedAttribute, Session
+
+from app.db.replicas import read_first
 from app.models.user import User
-from app.schemas.auth import UserCreate
+from app.repositories.user_cache import UserAccount, UserLookupCache
+from app.schemas.auth import IdentifierKind, UserCreate, classify_identifier
+
+if TYPE_CHECKING:
+    from app.services.identifier_filter import KnownIdentifierFilter
+
+
+class DuplicateUserError(Exception):
+    """Raised when an insert violates the unique ``email`` or ``username`` constraint."""
+
+    def __init__(self, field: str) -> None:
+        super().__init__(f"{field} already exists")
+        self.field = field
+
+
+class LoginCredentials(NamedTuple):
+    """Projection of the columns needed to verify a login attempt."""
+
+    id: int
+    hashed_password: str
+
+
+_LOGIN_LOOKUP_COLUMNS: dict[IdentifierKind, tuple[InstrumentedAttribute[str], ...]] = {
+    # Usernames may technically contain ``@`` too, so an email-shaped
+    # identifier also probes the username index; an email match wins.
+    "email": (User.email, User.username),
+    "username": (User.username,),
+}
+
+_LOOKUP_RANK = "lookup_rank"
+
+
+def _identifier_query(identifier: str, kind: IdentifierKind, *projection: Any) -> Select | CompoundSelect:
+    """Select ``projection`` for ``identifier`` in one statement (see ``classify_identifier``).
+
+    Each column its shape allows gets its own ``UNION ALL`` branch, so every
+    branch probes a single unique index and a miss is still one round trip.
+    Branches are ranked in ``_LOGIN_LOOKUP_COLUMNS`` order.
+    """
+    columns = _LOGIN_LOOKUP_COLUMNS[kind]
+    if len(columns) == 1:
+        return select(*projection).where(columns[0] == identifier).limit(1)
+    branches = [
+        select(*projection, literal(rank).label(_LOOKUP_RANK)).where(column == identifier)
+        for rank, column in enumerate(columns)
+    ]
+    return union_all(*branches).order_by(_LOOKUP_RANK).limit(1)
+
+
+def _user_query(identifier: str, kind: IdentifierKind) -> Select[tuple[User]]:
+    return select(User).from_statement(_identifier_query(identifier, kind, User))
+
+
+def _conflict_query(payload: UserCreate) -> Select[tuple[str, str]]:
+    return select(User.email, User.username).where(
+        or_(User.email == payload.email, User.username == payload.username)
+    )
+
+
+def _conflicting_field(payload: UserCreate, rows: list) -> str | None:
+    """Report the violated column, preferring ``email`` like the old pre-checks did."""
+    if any(row.email == payload.email for row in rows):
+        return "email"
+    if rows:
+        return "username"
+    return None
+
+
+def _known_to_be_absent(identifier_filter: KnownIdentifierFilter | None, identifier: str) -> bool:
+    return identifier_filter is not None and not identifier_filter.might_exist(identifier)
+
+
+def _record_miss(identifier_filter: KnownIdentifierFilter | None, found: object) -> None:
+    if identifier_filter is not None and found is None:
+        identifier_filter.record_false_positive()
+
+
+def _login_query(identifier: str, kind: IdentifierKind) -> Select | CompoundSelect:
+    return _identifier_query(identifier, kind, User.id, User.hashed_password)
+
+
+def _account_query(identifier: str, kind: IdentifierKind) -> Select | CompoundSelect:
+    return _identifier_query(
+        identifier, kind, User.id, User.hashed_password, User.email, User.first_name, User.username
+    )
+
+
+def _remember(
+    user_cache: UserLookupCache | None, db: Session | AsyncSession, identifier: str, row: Row, token: int
+) -> UserAccount:
+    """Build the account from an ``_account_query`` row and cache it unless a replica served it.
+
+    A replica may not have replicated a password change yet, and caching its
+    row would keep the old hash around for the whole TTL.
+    """
+    account = UserAccount(row.id, row.hashed_password, row.email, row.first_name)
+    if user_cache is not None and not getattr(db, "last_bind_was_replica", False):
+        user_cache.put(identifier, account, (row.email, row.username), token)
+    return account
+
+
+def _invalidate_on_commit(user_cache: UserLookupCache | None, session: Session, email: str, username: str) -> None:
+    """Drop the user's cached lookups now and again once the transaction commits.
+
+    The second pass removes anything a concurrent request cached from the
+    still-committed old row while this transaction was open.
+    """
+    if user_cache is None:
+        return
+    user_cache.invalidate(email, username)
+    event.listen(session, "after_commit", lambda _: user_cache.invalidate(email, username), once=True)
 
 
 class UserRepository:
-    """Thin data-access layer providing focused operations."""
+    """Thin data-access layer providing focused operations.
+
+    When an ``identifier_filter`` is given, identifier lookups for emails and
+    usernames it knows are unregistered return ``None`` without a query. With
+    a ``user_cache``, login and forgot-password lookups are served from it and
+    every write to a user invalidates that user's entries.
+    """
 
-    def __init__(self, db: Session) -> None:
+    def __init__(
+        self,
+        db: Session,
+        identifier_filter: KnownIdentifierFilter | None = None,
+        user_cache: UserLookupCache | None = None,
+    ) -> None:
         self._db = db
+        self._identifier_filter = identifier_filter
+        self._user_cache = user_cache
+
+    def get_by_id(self, user_id: int) -> User | None:
+        return self._db.get(User, user_id)
+
+    def _first(self, *criteria: ColumnElement[bool]) -> User | None:
+        row = read_first(self._db, select(User).where(*criteria).limit(1))
+        return row[0] if row is not None else None
 
     def get_by_email(self, email: str) -> User | None:
-        return self._db.query(User).filter(User.email == email).first()
+        return self._first(User.email == email)
 
     def get_by_username(self, username: str) -> User | None:
-        return self._db.query(User).filter(User.username == username).first()
+        return self._first(User.username == username)
+
+    def get_by_identifier(self, identifier: str, kind: IdentifierKind | None = None) -> User | None:
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        row = read_first(self._db, _user_query(identifier, kind or classify_identifier(identifier)))
+        user = row[0] if row is not None else None
+        _record_miss(self._identifier_filter, user)
+        return user
+
+    def get_login_credentials(self, identifier: str, kind: IdentifierKind | None = None) -> LoginCredentials | None:
+        """Fetch only ``id`` and ``hashed_password`` in one statement, one unique index per branch.
 
-    def get_by_identifier(self, identifier: str) -> User | None:
-        query = self._db.query(User).filter((User.username == identifier) | (User.email == identifier))
-        return query.first()
+        ``kind`` is the caller's ``classify_identifier`` result, when it already has one.
+        """
+        if self._user_cache is not None:
+            account = self.find_account(identifier, kind)
+            return LoginCredentials(account.id, account.hashed_password) if account is not None else None
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        row = read_first(self._db, _login_query(identifier, kind or classify_identifier(identifier)))
+        _record_miss(self._identifier_filter, row)
+        return LoginCredentials(row.id, row.hashed_password) if row is not None else None
+
+    def find_account(self, identifier: str, kind: IdentifierKind | None = None) -> UserAccount | None:
+        """Return the columns login and forgot-password need, from the user cache when possible."""
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        if self._user_cache is not None and (account := self._user_cache.get(identifier)) is not None:
+            return account
+        token = self._user_cache.read_token() if self._user_cache is not None else 0
+        row = read_first(self._db, _account_query(identifier, kind or classify_identifier(identifier)))
+        _record_miss(self._identifier_filter, row)
+        return _remember(self._user_cache, self._db, identifier, row, token) if row is not None else None
 
     def create(self, payload: UserCreate, hashed_password: str) -> User:
-        new_user = User(
-            first_name=payload.first_name,
-            last_name=payload.last_name,
-            email=payload.email,
-            phone=payload.phone,
-            contact=payload.contact,
-            short_description=payload.short_description,
-            username=payload.username,
-            hashed_password=hashed_password,
-        )
+        """Insert optimistically and let the unique constraints catch duplicates.
+
+        Timestamps are assigned client-side so no refresh SELECT is needed. The
+        insert is flushed here; committing is left to the caller's unit of work.
+        A constraint violation rolls the transaction back before reporting it.
+        """
+        new_user = _build_user(payload, hashed_password)
         self._db.add(new_user)
-        self._db.commit()
-        self._db.refresh(new_user)
+        try:
+            self._db.flush()
+        except IntegrityError:
+            self._db.rollback()
+            field = _conflicting_field(payload, list(self._db.execute(_conflict_query(payload))))
+            if field is None:
+                raise
+            raise DuplicateUserError(field) from None
+        if self._identifier_filter is not None:
+            self._identifier_filter.add(new_user.email, new_user.username)
+        _invalidate_on_commit(self._user_cache, self._db, new_user.email, new_user.username)
         return new_user
 
     def update_password(self, user: User, hashed_password: str) -> User:
         user.hashed_password = hashed_password
         self._db.add(user)
-        self._db.commit()
-        self._db.refresh(user)
+        _invalidate_on_commit(self._user_cache, self._db, user.email, user.username)
+        return user
+
+    def replace_password_hash(self, user_id: int, current_hash: str, new_hash: str) -> bool:
+        """Swap ``current_hash`` for ``new_hash`` unless the password changed meanwhile."""
+        result = self._db.execute(
+            update(User)
+            .where(User.id == user_id, User.hashed_password == current_hash)
+            .values(hashed_password=new_hash)
+        )
+        if result.rowcount != 1:
+            return False
+        if self._user_cache is not None:
+            email, username = self._db.execute(select(User.email, User.username).where(User.id == user_id)).one()
+            _invalidate_on_commit(self._user_cache, self._db, email, username)
+        return True
+
+    def existing_identities(self, emails: Sequence[str], usernames: Sequence[str]) -> tuple[set[str], set[str]]:
+        """Return which of ``emails`` and ``usernames`` are already registered, in one query."""
+        if not emails and not usernames:
+            return set(), set()
+        rows = self._db.execute(
+            select(User.email, User.username).where(or_(User.email.in_(emails), User.username.in_(usernames)))
+        )
+        taken_emails: set[str] = set()
+        taken_usernames: set[str] = set()
+        for email, username in rows:
+            taken_emails.add(email)
+            taken_usernames.add(username)
+        return taken_emails, taken_usernames
+
+    def bulk_insert(self, rows: Sequence[dict[str, Any]]) -> None:
+        """Insert column dictionaries with a single executemany; the caller commits."""
+        if rows:
+            self._db.execute(insert(User), list(rows))
+
+
+class AsyncUserRepository:
+    """Async counterpart of :class:`UserRepository` backed by an ``AsyncSession``."""
+
+    def __init__(
+        self,
+        db: AsyncSession,
+        identifier_filter: KnownIdentifierFilter | None = None,
+        user_cache: UserLookupCache | None = None,
+    ) -> None:
+        self._db = db
+        self._identifier_filter = identifier_filter
+        self._user_cache = user_cache
+
+    async def _first(self, *criteria: ColumnElement[bool]) -> User | None:
+        result = await self._db.execute(select(User).where(*criteria).limit(1))
+        return result.scalars().first()
+
+    async def get_by_id(self, user_id: int) -> User | None:
+        return await self._db.get(User, user_id)
+
+    async def get_by_email(self, email: str) -> User | None:
+        return await self._first(User.email == email)
+
+    async def get_by_username(self, username: str) -> User | None:
+        return await self._first(User.username == username)
+
+    async def get_by_identifier(self, identifier: str, kind: IdentifierKind | None = None) -> User | None:
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        result = await self._db.execute(_user_query(identifier, kind or classify_identifier(identifier)))
+        user = result.scalars().first()
+        _record_miss(self._identifier_filter, user)
+        return user
+
+    async def get_login_credentials(
+        self, identifier: str, kind: IdentifierKind | None = None
+    ) -> LoginCredentials | None:
+        if self._user_cache is not None:
+            account = await self.find_account(identifier, kind)
+            return LoginCredentials(account.id, account.hashed_password) if account is not None else None
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        row = (await self._db.execute(_login_query(identifier, kind or classify_identifier(identifier)))).first()
+        _record_miss(self._identifier_filter, row)
+        return LoginCredentials(row.id, row.hashed_password) if row is not None else None
+
+    async def find_account(self, identifier: str, kind: IdentifierKind | None = None) -> UserAccount | None:
+        if _known_to_be_absent(self._identifier_filter, identifier):
+            return None
+        if self._user_cache is not None and (account := self._user_cache.get(identifier)) is not None:
+            return account
+        token = self._user_cache.read_token() if self._user_cache is not None else 0
+        row = (await self._db.execute(_account_query(identifier, kind or classify_identifier(identifier)))).first()
+        _record_miss(self._identifier_filter, row)
+        return _remember(self._user_cache, self._db, identifier, row, token) if row is not None else None
+
+    async def create(self, payload: UserCreate, hashed_password: str) -> User:
+        new_user = _build_user(payload, hashed_password)
+        self._db.add(new_user)
+        try:
+            await self._db.flush()
+        except IntegrityError:
+            await self._db.rollback()
+            field = _conflicting_field(payload, list(await self._db.execute(_conflict_query(payload))))
+            if field is None:
+                raise
+            raise DuplicateUserError(field) from None
+        if self._identifier_filter is not None:
+            self._identifier_filter.add(new_user.email, new_user.username)
+        _invalidate_on_commit(self._user_cache, self._db.sync_session, new_user.email, new_user.username)
+        return new_user
+
+    async def update_password(self, user: User, hashed_password: str) -> User:
+        user.hashed_password = hashed_password
+        self._db.add(user)
+        _invalidate_on_commit(self._user_cache, self._db.sync_session, user.email, user.username)
         return user
+
+
+def _build_user(payload: UserCreate, hashed_password: str) -> User:
+    now = datetime.now(timezone.utc)
+    return User(
+        first_name=payload.first_name,
+        last_name=payload.last_name,
+        email=payload.email,
+        phone=payload.phone,
+        contact=payload.contact,
+        short_description=payload.short_description,
+        username=payload.username,
+        hashed_password=hashed_password,
+        created_at=now,
+        updated_at=now,
+    )
@@ -1,11 +1,23 @@
 """API routes for authentication workflows."""
-from fastapi import APIRouter, Depends, status
+from collections.abc import Callable
+
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials, HTTPBearer
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
 from sqlalchemy.orm import Session
 
-from app.controllers.auth_controller import AuthController
-from app.db.session import get_db
-from app.repositories.password_reset_repository import PasswordResetRepository
-from app.repositories.user_repository import UserRepository
+from app.controllers.auth_controller import AsyncAuthController, AuthController
+from app.core.responses import ModelResponse
+from app.core.security import TokenError
+from app.core.token_cache import verify_access_token
+from app.db.async_session import get_async_db, get_async_session_factory
+from app.db.session import get_db, get_session_factory
+from app.db.unit_of_work import AsyncUnitOfWork, UnitOfWork
+from app.repositories.password_reset_repository import (
+    AsyncPasswordResetRepository,
+    PasswordResetRepository,
+)
+from app.repositories.user_repository import AsyncUserRepository, UserRepository
 from app.schemas.auth import (
     ForgotPasswordRequest,
     LoginRequest,
@@ -15,30 +27,78 @@ from app.schemas.auth import (
     UserCreate,
     UserRead,
 )
-from app.services.auth_service import AuthService
-from app.services.email_service import EmailService
+from app.services.auth_service import AsyncAuthService, AuthService, get_auth_collaborators
 
 router = APIRouter(prefix="/auth", tags=["auth"])
+async_router = APIRouter(prefix="/auth", tags=["auth"])
+bearer_scheme = HTTPBearer(auto_error=False)
+
+
+async def get_current_user_id(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> int:
+    """Resolve the bearer token's subject, reusing cached verifications for hot tokens."""
+    if credentials is None:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="not authenticated",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+    try:
+        claims = verify_access_token(credentials.credentials)
+        return int(claims["sub"])
+    except (TokenError, KeyError, ValueError) as exc:
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="invalid token",
+            headers={"WWW-Authenticate": "Bearer"},
+        ) from exc
+
+
+def _client_ip(request: Request) -> str | None:
+    return request.client.host if request.client else None
+
 
+async def get_auth_controller(
+    db: Session = Depends(get_db),
+    session_factory: Callable[[], Session] = Depends(get_session_factory),
+) -> AuthController:
+    """Bind the shared collaborators to this request's session.
 
-def get_auth_controller(db: Session = Depends(get_db)) -> AuthController:
-    user_repository = UserRepository(db)
-    password_reset_repository = PasswordResetRepository(db)
-    email_service = EmailService()
-    service = AuthService(user_repository, password_reset_repository, email_service)
+    Declared ``async`` because it never blocks, so FastAPI resolves it inline
+    instead of dispatching it to the threadpool.
+    """
+    collaborators = get_auth_collaborators()
+    service = AuthService(
+        UserRepository(db, collaborators.identifier_filter, collaborators.user_cache),
+        PasswordResetRepository(db),
+        UnitOfWork(db),
+        collaborators,
+        session_factory,
+    )
     return AuthController(service)
 
 
 @router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
 def register_user(
     payload: UserCreate, controller: AuthController = Depends(get_auth_controller)
-) -> UserRead:
-    return controller.register(payload)
+) -> ModelResponse:
+    return ModelResponse(controller.register(payload), status.HTTP_201_CREATED)
+
+
+@router.get("/me", response_model=UserRead)
+def read_current_user(
+    user_id: int = Depends(get_current_user_id),
+    controller: AuthController = Depends(get_auth_controller),
+) -> ModelResponse:
+    return ModelResponse(controller.me(user_id))
 
 
 @router.post("/login", response_model=TokenResponse)
-def login(payload: LoginRequest, controller: AuthController = Depends(get_auth_controller)) -> TokenResponse:
-    return controller.login(payload)
+def login(
+    payload: LoginRequest, request: Request, controller: AuthController = Depends(get_auth_controller)
+) -> ModelResponse:
+    return ModelResponse(controller.login(payload, _client_ip(request)))
 
 
 @router.post(
@@ -48,14 +108,74 @@ def login(payload: LoginRequest, controller: AuthController = Depends(get_auth_c
 )
 def forgot_password(
     payload: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
     controller: AuthController = Depends(get_auth_controller),
-) -> MessageResponse:
-    return controller.forgot_password(payload)
+) -> ModelResponse:
+    # FastAPI attaches ``background_tasks`` to the returned response; they run once it is sent.
+    return ModelResponse(controller.forgot_password(payload, background_tasks), status.HTTP_202_ACCEPTED)
 
 
 @router.post("/reset-password", response_model=MessageResponse)
 def reset_password(
     payload: ResetPasswordRequest,
     controller: AuthController = Depends(get_auth_controller),
-) -> MessageResponse:
-    return controller.reset_password(payload)
+) -> ModelResponse:
+    return ModelResponse(controller.reset_password(payload))
+
+
+async def get_async_auth_controller(
+    db: AsyncSession = Depends(get_async_db),
+    session_factory: async_sessionmaker[AsyncSession] = Depends(get_async_session_factory),
+) -> AsyncAuthController:
+    collaborators = get_auth_collaborators()
+    service = AsyncAuthService(
+        AsyncUserRepository(db, collaborators.identifier_filter, collaborators.user_cache),
+        AsyncPasswordResetRepository(db),
+        AsyncUnitOfWork(db),
+        collaborators,
+        session_factory,
+    )
+    return AsyncAuthController(service)
+
+
+@async_router.post("/register", response_model=UserRead, status_code=status.HTTP_201_CREATED)
+async def register_user_async(
+    payload: UserCreate, controller: AsyncAuthController = Depends(get_async_auth_controller)
+) -> ModelResponse:
+    return ModelResponse(await controller.register(payload), status.HTTP_201_CREATED)
+
+
+@async_router.get("/me", response_model=UserRead)
+async def read_current_user_async(
+    user_id: int = Depends(get_current_user_id),
+    controller: AsyncAuthController = Depends(get_async_auth_controller),
+) -> ModelResponse:
+    return ModelResponse(await controller.me(user_id))
+
+
+@async_router.post("/login", response_model=TokenResponse)
+async def login_async(
+    payload: LoginRequest, request: Request, controller: AsyncAuthController = Depends(get_async_auth_controller)
+) -> ModelResponse:
+    return ModelResponse(await controller.login(payload, _client_ip(request)))
+
+
+@async_router.post(
+    "/forgot-password",
+    response_model=MessageResponse,
+    status_code=status.HTTP_202_ACCEPTED,
+)
+async def forgot_password_async(
+    payload: ForgotPasswordRequest,
+    background_tasks: BackgroundTasks,
+    controller: AsyncAuthController = Depends(get_async_auth_controller),
+) -> ModelResponse:
+    return ModelResponse(await controller.forgot_password(payload, background_tasks), status.HTTP_202_ACCEPTED)
+
+
+@async_router.post("/reset-password", response_model=MessageResponse)
+async def reset_password_async(
+    payload: ResetPasswordRequest,
+    controller: AsyncAuthController = Depends(get_async_auth_controller),
+) -> ModelResponse:
+    return ModelResponse(await controller.reset_password(payload))
@@ -0,0 +1,139 @@
+"""Operational metrics endpoints used to size worker pools.
+
+Mounted only when ``REQUEST_METRICS_ENABLED=true``; keep it off the public network.
+"""
+from collections.abc import Callable
+from typing import Any, TypeVar
+
+from fastapi import APIRouter
+from fastapi.responses import PlainTextResponse
+
+from app.core.hashing import get_hashing_executor
+from app.core.rate_limit import get_login_rate_limiter
+from app.core.request_metrics import request_metrics, snapshot_gauges
+from app.core.token_cache import get_token_cache
+from app.db.async_session import get_async_engine
+from app.db.pool_metrics import pool_status
+from app.db.session import get_engine, get_replica_set
+from app.repositories.user_cache import get_user_cache
+from app.schemas.auth import normalize_email
+from app.services.identifier_filter import get_identifier_filter
+from app.services.password_rehash import get_password_rehasher
+from app.services.token_sweeper import get_token_sweeper
+
+router = APIRouter(prefix="/metrics", tags=["metrics"])
+
+T = TypeVar("T")
+
+
+def _created(factory: Callable[[], T]) -> T | None:
+    """Return the component if something already built it; a scrape never creates one.
+
+    Disabled features (the identifier filter, rehasher, sweeper, user cache)
+    are only built when used, so they stay out of memory and out of the report.
+    """
+    return factory() if factory.cache_info().currsize else None
+
+
+def _snapshot(factory: Callable[[], Any]) -> dict[str, Any]:
+    component = _created(factory)
+    return component.snapshot() if component is not None else {}
+
+
+def _hashing_gauges() -> dict[str, Any]:
+    executor = _created(get_hashing_executor)
+    if executor is None:
+        return {}
+    hashing = executor.metrics.snapshot()
+    return {
+        "rejected": hashing["rejected"],
+        "jobs": hashing["hash_time"]["count"],
+        "hash_seconds": hashing["hash_time"]["total_seconds"],
+        "queue_wait_seconds": hashing["queue_wait"]["total_seconds"],
+    }
+
+
+@router.get("", response_class=PlainTextResponse)
+def prometheus_metrics() -> PlainTextResponse:
+    """Prometheus text exposition of request timings and the component counters below."""
+    body = (
+        request_metrics.render_prometheus()
+        + snapshot_gauges(_hashing_gauges(), "hashing_pool")
+        + snapshot_gauges(_sync_pool_status(), "db_pool")
+        + snapshot_gauges(_async_pool_status(), "db_pool_async")
+        + snapshot_gauges(db_replica_metrics(), "db_replicas")
+        + snapshot_gauges(_snapshot(get_token_cache), "token_cache")
+        + snapshot_gauges(_snapshot(get_login_rate_limiter), "login_rate_limit")
+        + snapshot_gauges(_snapshot(get_token_sweeper), "reset_token_sweeper")
+        + snapshot_gauges(_snapshot(get_password_rehasher), "password_rehash")
+        + snapshot_gauges(_snapshot(get_identifier_filter), "identifier_filter")
+        + snapshot_gauges(email_validation_metrics(), "email_validation_cache")
+        + snapshot_gauges(_snapshot(get_user_cache), "user_cache")
+    )
+    return PlainTextResponse(body, media_type="text/plain; version=0.0.4")
+
+
+@router.get("/hashing")
+def hashing_metrics() -> dict[str, Any]:
+    executor = _created(get_hashing_executor)
+    if executor is None:
+        return {}
+    return {"workers": executor.workers, "capacity": executor.capacity, **executor.metrics.snapshot()}
+
+
+def _sync_pool_status() -> dict[str, Any]:
+    engine = _created(get_engine)
+    return pool_status(engine) if engine is not None else {}
+
+
+def _async_pool_status() -> dict[str, Any]:
+    engine = _created(get_async_engine)
+    return pool_status(engine.sync_engine) if engine is not None else {}
+
+
+@router.get("/db-pool")
+def db_pool_metrics() -> dict[str, Any]:
+    """Pool state of each engine this worker has created, keyed ``sync`` and ``async``."""
+    pools = {"sync": _sync_pool_status(), "async": _async_pool_status()}
+    return {name: status for name, status in pools.items() if status}
+
+
+@router.get("/db-replicas")
+def db_replica_metrics() -> dict[str, Any]:
+    replicas = _created(get_replica_set)
+    return replicas.snapshot() if replicas is not None else {"replicas": 0}
+
+
+@router.get("/token-cache")
+def token_cache_metrics() -> dict[str, Any]:
+    return _snapshot(get_token_cache)
+
+
+@router.get("/login-rate-limit")
+def login_rate_limit_metrics() -> dict[str, Any]:
+    return _snapshot(get_login_rate_limiter)
+
+
+@router.get("/token-sweeper")
+def token_sweeper_metrics() -> dict[str, Any]:
+    return _snapshot(get_token_sweeper)
+
+
+@router.get("/password-rehash")
+def password_rehash_metrics() -> dict[str, Any]:
+    return _snapshot(get_password_rehasher)
+
+
+@router.get("/identifier-filter")
+def identifier_filter_metrics() -> dict[str, Any]:
+    return _snapshot(get_identifier_filter)
+
+
+@router.get("/email-validation")
+def email_validation_metrics() -> dict[str, Any]:
+    return normalize_email.cache_info()._asdict()
+
+
+@router.get("/user-cache")
+def user_cache_metrics() -> dict[str, Any]:
+    return _snapshot(get_user_cache)
@@ -0,0 +1,63 @@
+"""Bulk user import endpoint for migrations from legacy systems."""
+import io
+import secrets
+import tempfile
+from typing import Literal
+
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from fastapi.security import HTTPAuthorizationCredentials
+from sqlalchemy.orm import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import get_settings
+from app.db.session import get_db
+from app.routers.auth_router import bearer_scheme
+from app.schemas.auth import ImportReport
+from app.services.user_import import UserImporter, get_import_hash_pool, iter_records
+
+router = APIRouter(prefix="/users", tags=["users"])
+
+_SPOOL_MAX_BYTES = 8 * 1024 * 1024
+
+
+async def require_import_token(
+    credentials: HTTPAuthorizationCredentials | None = Depends(bearer_scheme),
+) -> None:
+    """Admit only callers holding ``USER_IMPORT_API_TOKEN``; user access tokens never qualify.
+
+    The route does not exist (404) unless the API is enabled and a token is configured.
+    """
+    settings = get_settings()
+    if not settings.user_import_api_enabled or not settings.user_import_api_token:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="Not Found")
+    if credentials is None or not secrets.compare_digest(
+        credentials.credentials.encode(), settings.user_import_api_token.encode()
+    ):
+        raise HTTPException(
+            status_code=status.HTTP_401_UNAUTHORIZED,
+            detail="invalid import token",
+            headers={"WWW-Authenticate": "Bearer"},
+        )
+
+
+@router.post("/import", response_model=ImportReport, dependencies=[Depends(require_import_token)])
+async def import_users(
+    request: Request,
+    file_format: Literal["ndjson", "csv"] | None = None,
+    db: Session = Depends(get_db),
+) -> ImportReport:
+    """Import an NDJSON or CSV request body, reporting per-row conflicts instead of failing.
+
+    The body is spooled to a temporary file (in memory up to 8 MiB) so large
+    uploads never sit in memory whole; rows are then processed batch by batch.
+    """
+    if file_format is None:
+        file_format = "csv" if "csv" in request.headers.get("content-type", "") else "ndjson"
+
+    with tempfile.SpooledTemporaryFile(max_size=_SPOOL_MAX_BYTES) as spool:
+        async for chunk in request.stream():
+            spool.write(chunk)
+        spool.seek(0)
+        text = io.TextIOWrapper(spool, encoding="utf-8", newline="")
+        importer = UserImporter(db, get_settings())
+        return await run_in_threadpool(importer.run, iter_records(text, file_format), get_import_hash_pool())
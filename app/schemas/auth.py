@@ -1,13 +1,38 @@
 """Pydantic schemas used by the authentication API."""
 from datetime import datetime
+from functools import cached_property, lru_cache
+from typing import Annotated, Literal
 
-from pydantic import BaseModel, EmailStr, Field, ConfigDict, model_validator
+from pydantic import AfterValidator, BaseModel, Field, ConfigDict, WithJsonSchema, model_validator
+from pydantic.networks import validate_email
+
+from app.core.config import get_settings
+
+IdentifierKind = Literal["email", "username"]
+
+
+@lru_cache(maxsize=get_settings().email_validation_cache_size)
+def normalize_email(value: str) -> str:
+    """``EmailStr`` validation and normalization, memoized for addresses seen again.
+
+    Invalid addresses raise and are therefore never cached.
+    """
+    return validate_email(value)[1]
+
+
+# Validates and normalizes exactly like ``EmailStr``, minus the repeated email-validator work.
+CachedEmailStr = Annotated[str, AfterValidator(normalize_email), WithJsonSchema({"type": "string", "format": "email"})]
+
+
+def classify_identifier(identifier: str) -> IdentifierKind:
+    """Emails always contain ``@``; anything else can only be a username."""
+    return "email" if "@" in identifier else "username"
 
 
 class UserBase(BaseModel):
     first_name: str = Field(..., min_length=2, max_length=100)
     last_name: str = Field(..., min_length=2, max_length=100)
-    email: EmailStr
+    email: CachedEmailStr
     phone: str = Field(..., min_length=7, max_length=25)
     contact: str = Field(..., min_length=3, max_length=50)
     short_description: str | None = Field(default=None, max_length=255)
@@ -26,6 +51,27 @@ class UserCreate(UserBase):
         return self
 
 
+class UserImportRecord(UserBase):
+    """One row of a bulk import; passwords arrive in plain text and are hashed on import."""
+
+    password: str = Field(..., min_length=8, max_length=128)
+
+
+class ImportRowError(BaseModel):
+    row: int
+    field: str | None = None
+    message: str
+
+
+class ImportReport(BaseModel):
+    processed: int = 0
+    inserted: int = 0
+    conflicts: int = 0
+    invalid: int = 0
+    errors: list[ImportRowError] = Field(default_factory=list)
+    errors_truncated: bool = False
+
+
 class UserRead(UserBase):
     id: int
     created_at: datetime
@@ -38,6 +84,10 @@ class LoginRequest(BaseModel):
     identifier: str = Field(..., description="Username or email identifying the user")
     password: str = Field(..., min_length=8, max_length=128)
 
+    @cached_property
+    def identifier_kind(self) -> IdentifierKind:
+        return classify_identifier(self.identifier)
+
 
 class TokenResponse(BaseModel):
     access_token: str
@@ -47,10 +97,16 @@ class TokenResponse(BaseModel):
 class MessageResponse(BaseModel):
     message: str
 
+    model_config = ConfigDict(frozen=True)
+
 
 class ForgotPasswordRequest(BaseModel):
     identifier: str = Field(..., min_length=3, description="Email or username for the account")
 
+    @cached_property
+    def identifier_kind(self) -> IdentifierKind:
+        return classify_identifier(self.identifier)
+
 
 class ResetPasswordRequest(BaseModel):
     token: str = Field(..., min_length=10)
@@ -0,0 +1,76 @@
+"""Production entry point running one uvicorn worker process per CPU.
+
+Usage::
+
+    python -m app.serve
+
+``WEB_CONCURRENCY`` sets the number of worker processes (default: the CPU
+count). Each worker handles requests on its own event loop and opens its own
+database pools, so CPU-bound work such as bcrypt spreads across cores. When
+``PASSWORD_HASH_WORKERS`` is unset, the CPUs are divided between the workers'
+hashing pools rather than every worker sizing its pool to the whole machine.
+
+With ``DB_BOOTSTRAP_SCHEMA=true`` the tables are created once here, before any
+worker starts, and the workers skip it; concurrent ``CREATE TABLE`` from every
+worker's lifespan would race. Uvicorn replaces workers that die.
+
+With more than one worker the in-process token sweeper is switched off, since
+every worker would sweep the same rows; schedule
+``python -m app.services.token_sweeper`` (e.g. from cron) instead. The
+``memory`` user lookup cache is refused with more than one worker: a password
+change in one worker would leave the old hash cached in the others.
+"""
+import logging
+import os
+
+import uvicorn
+
+from app.core.config import Settings, get_settings
+from app.db import base  # noqa: F401 -- registers the models on Base.metadata
+from app.db.session import Base, dispose_engines, get_engine
+
+logger = logging.getLogger(__name__)
+
+
+def worker_count(settings: Settings) -> int:
+    return settings.web_concurrency or os.cpu_count() or 1
+
+
+def hash_workers_per_process(settings: Settings, workers: int) -> int:
+    """Hashing threads (or processes) for each worker so the total matches the CPU count."""
+    if settings.password_hash_workers:
+        return settings.password_hash_workers
+    return max(1, (os.cpu_count() or 1) // workers)
+
+
+def bootstrap_schema() -> None:
+    """Create missing tables from the supervisor, then drop its connections."""
+    Base.metadata.create_all(bind=get_engine())
+    dispose_engines()
+
+
+def main() -> None:
+    settings = get_settings()
+    workers = worker_count(settings)
+    if workers > 1 and settings.user_cache_enabled and settings.user_cache_backend == "memory":
+        raise SystemExit(
+            f"USER_CACHE_BACKEND=memory is per process and {workers} workers would serve stale password hashes; "
+            "set USER_CACHE_BACKEND to a shared backend or WEB_CONCURRENCY=1"
+        )
+    if settings.db_bootstrap_schema:
+        bootstrap_schema()
+    # Worker processes are spawned and read their settings from the environment.
+    os.environ["DB_BOOTSTRAP_SCHEMA"] = "false"
+    os.environ["PASSWORD_HASH_WORKERS"] = str(hash_workers_per_process(settings, workers))
+    if workers > 1:
+        if settings.token_sweeper_enabled:
+            logger.warning(
+                "Token sweeper disabled in the %d workers; run `python -m app.services.token_sweeper` from cron",
+                workers,
+            )
+        os.environ["TOKEN_SWEEPER_ENABLED"] = "false"
+    uvicorn.run("app.main:app", host=settings.server_host, port=settings.server_port, workers=workers)
+
+
+if __name__ == "__main__":
+    main()
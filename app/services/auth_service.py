@@ -1,25 +1,182 @@
 """Domain logic for authentication workflows."""
 from __future__ import annotations
 
+import asyncio
 import hashlib
+import logging
 import secrets
+from collections.abc import Callable
+from dataclasses import dataclass
 from datetime import datetime, timedelta, timezone
+from functools import lru_cache
 
-from fastapi import HTTPException, status
+from fastapi import BackgroundTasks, HTTPException, status
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker
+from sqlalchemy.orm import Session
 
-from app.core.config import get_settings
-from app.core.security import create_access_token, get_password_hash, verify_password
+from app.core.config import Settings, get_settings
+from app.core.hashing import HashingExecutor, get_hashing_executor
+from app.core.rate_limit import LoginRateLimiter, get_login_rate_limiter
+from app.core.security import create_access_token, password_needs_rehash
+from app.db.async_session import get_async_sessionmaker
+from app.db.session import SessionLocal
+from app.db.unit_of_work import AsyncUnitOfWork, UnitOfWork
 from app.models.user import User
-from app.repositories.password_reset_repository import PasswordResetRepository
-from app.repositories.user_repository import UserRepository
+from app.repositories.password_reset_repository import (
+    AsyncPasswordResetRepository,
+    PasswordResetRepository,
+)
+from app.repositories.user_cache import UserLookupCache, get_user_cache
+from app.repositories.user_repository import (
+    AsyncUserRepository,
+    DuplicateUserError,
+    LoginCredentials,
+    UserRepository,
+)
 from app.schemas.auth import (
     ForgotPasswordRequest,
+    IdentifierKind,
     LoginRequest,
     ResetPasswordRequest,
     TokenResponse,
     UserCreate,
 )
+from app.services.email_outbox import get_email_outbox
 from app.services.email_service import EmailService
+from app.services.identifier_filter import KnownIdentifierFilter, get_identifier_filter
+from app.services.password_rehash import PasswordRehasher, get_password_rehasher
+
+logger = logging.getLogger(__name__)
+
+
+def _as_utc(value: datetime) -> datetime:
+    """Treat naive timestamps (as returned by SQLite) as UTC."""
+    return value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+
+
+def _issue_reset_token(expire_minutes: int) -> tuple[str, str, datetime]:
+    """Return a fresh reset token, its persisted digest, and its expiry."""
+    token_value = secrets.token_urlsafe(32)
+    token_hash = hashlib.sha256(token_value.encode()).hexdigest()
+    expires_at = datetime.now(timezone.utc) + timedelta(minutes=expire_minutes)
+    return token_value, token_hash, expires_at
+
+
+_DUPLICATE_USER_DETAILS = {
+    "email": "email is already registered",
+    "username": "username is already taken",
+}
+
+
+def _duplicate_user_exception(exc: DuplicateUserError) -> HTTPException:
+    return HTTPException(
+        status_code=status.HTTP_400_BAD_REQUEST,
+        detail=_DUPLICATE_USER_DETAILS[exc.field],
+    )
+
+
+def _invalid_reset_token_exception() -> HTTPException:
+    return HTTPException(status_code=status.HTTP_400_BAD_REQUEST, detail="invalid or expired reset token")
+
+
+def _schedule_rehash(
+    rehasher: PasswordRehasher | None, credentials: LoginCredentials, password: str
+) -> None:
+    """Hand a verified password whose hash uses an outdated cost to the background rehasher."""
+    if rehasher is not None and password_needs_rehash(credentials.hashed_password):
+        rehasher.schedule(credentials.id, password, credentials.hashed_password)
+
+
+@dataclass(frozen=True)
+class AuthCollaborators:
+    """Process-wide collaborators shared by every request's auth service.
+
+    None of these hold request or session state, so they are built once and
+    only the repositories and unit of work are created per request.
+    """
+
+    settings: Settings
+    email_service: EmailService
+    hashing: HashingExecutor
+    login_rate_limiter: LoginRateLimiter
+    password_rehasher: PasswordRehasher | None
+    identifier_filter: KnownIdentifierFilter | None = None
+    user_cache: UserLookupCache | None = None
+
+
+def build_auth_collaborators(settings: Settings | None = None) -> AuthCollaborators:
+    settings = settings or get_settings()
+    outbox = get_email_outbox() if settings.email_outbox_enabled else None
+    return AuthCollaborators(
+        settings=settings,
+        email_service=EmailService(settings, outbox),
+        hashing=get_hashing_executor(),
+        login_rate_limiter=get_login_rate_limiter(),
+        password_rehasher=get_password_rehasher() if settings.password_rehash_on_login else None,
+        identifier_filter=get_identifier_filter() if settings.identifier_filter_enabled else None,
+        user_cache=get_user_cache() if settings.user_cache_enabled else None,
+    )
+
+
+@lru_cache
+def get_auth_collaborators() -> AuthCollaborators:
+    """Return the collaborators built on first use (or at startup, see ``app.main``)."""
+    return build_auth_collaborators()
+
+
+def issue_password_reset(
+    session_factory: Callable[[], Session], collaborators: AuthCollaborators, identifier: str, kind: IdentifierKind
+) -> None:
+    """Store a reset token for ``identifier`` and email it, if the account exists.
+
+    Runs after the forgot-password response has been sent, in its own session,
+    so nothing here can show up in the response time.
+    """
+    try:
+        with session_factory() as db:
+            user = UserRepository(db, collaborators.identifier_filter, collaborators.user_cache).find_account(
+                identifier, kind
+            )
+            if not user:
+                return
+            token_value, token_hash, expires_at = _issue_reset_token(
+                collaborators.settings.password_reset_token_expire_minutes
+            )
+            password_reset_repository = PasswordResetRepository(db)
+            with UnitOfWork(db).begin():
+                password_reset_repository.remove_active_tokens_for_user(user.id)
+                password_reset_repository.create(user.id, token_hash, expires_at)
+        collaborators.email_service.send_password_reset(user.email, token_value, user.first_name)
+    except Exception:
+        logger.exception("Password reset could not be issued")
+
+
+async def aissue_password_reset(
+    session_factory: async_sessionmaker[AsyncSession],
+    collaborators: AuthCollaborators,
+    identifier: str,
+    kind: IdentifierKind,
+) -> None:
+    """Async counterpart of :func:`issue_password_reset`."""
+    try:
+        async with session_factory() as db:
+            user = await AsyncUserRepository(
+                db, collaborators.identifier_filter, collaborators.user_cache
+            ).find_account(identifier, kind)
+            if not user:
+                return
+            token_value, token_hash, expires_at = _issue_reset_token(
+                collaborators.settings.password_reset_token_expire_minutes
+            )
+            password_reset_repository = AsyncPasswordResetRepository(db)
+            async with AsyncUnitOfWork(db).begin():
+                await password_reset_repository.remove_active_tokens_for_user(user.id)
+                await password_reset_repository.create(user.id, token_hash, expires_at)
+        await asyncio.to_thread(
+            collaborators.email_service.send_password_reset, user.email, token_value, user.first_name
+        )
+    except Exception:
+        logger.exception("Password reset could not be issued")
 
 
 class AuthService:
@@ -29,61 +186,144 @@ class AuthService:
         self,
         user_repository: UserRepository,
         password_reset_repository: PasswordResetRepository,
-        email_service: EmailService,
+        unit_of_work: UnitOfWork,
+        collaborators: AuthCollaborators | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
     ) -> None:
+        collaborators = collaborators or get_auth_collaborators()
+        self._collaborators = collaborators
+        self._session_factory = session_factory
         self._user_repository = user_repository
         self._password_reset_repository = password_reset_repository
-        self._email_service = email_service
-        self._settings = get_settings()
+        self._unit_of_work = unit_of_work
+        self._email_service = collaborators.email_service
+        self._hashing = collaborators.hashing
+        self._login_rate_limiter = collaborators.login_rate_limiter
+        self._password_rehasher = collaborators.password_rehasher
+        self._settings = collaborators.settings
 
     def register_user(self, payload: UserCreate) -> User:
-        if self._user_repository.get_by_email(payload.email):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="email is already registered",
-            )
-        if self._user_repository.get_by_username(payload.username):
-            raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="username is already taken",
-            )
+        hashed_password = self._hashing.hash_password(payload.password)
+        try:
+            with self._unit_of_work.begin():
+                return self._user_repository.create(payload, hashed_password)
+        except DuplicateUserError as exc:
+            raise _duplicate_user_exception(exc) from exc
 
-        hashed_password = get_password_hash(payload.password)
-        return self._user_repository.create(payload, hashed_password)
+    def get_user(self, user_id: int) -> User:
+        user = self._user_repository.get_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="user not found")
+        return user
 
-    def authenticate_user(self, payload: LoginRequest) -> TokenResponse:
-        user = self._user_repository.get_by_identifier(payload.identifier)
-        if not user or not verify_password(payload.password, user.hashed_password):
+    def authenticate_user(self, payload: LoginRequest, client_ip: str | None = None) -> TokenResponse:
+        self._login_rate_limiter.check(payload.identifier, client_ip)
+        credentials = self._user_repository.get_login_credentials(payload.identifier, payload.identifier_kind)
+        if not credentials or not self._hashing.verify_password(payload.password, credentials.hashed_password):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="invalid credentials",
             )
-        token = create_access_token(str(user.id))
+        _schedule_rehash(self._password_rehasher, credentials, payload.password)
+        token = create_access_token(str(credentials.id))
         return TokenResponse(access_token=token)
 
-    def request_password_reset(self, payload: ForgotPasswordRequest) -> None:
-        user = self._user_repository.get_by_identifier(payload.identifier)
-        if not user:
-            return
+    def request_password_reset(
+        self, payload: ForgotPasswordRequest, background_tasks: BackgroundTasks | None = None
+    ) -> None:
+        """Schedule the lookup, token and email to run after the response is sent.
 
-        self._password_reset_repository.remove_active_tokens_for_user(user.id)
-        token_value = secrets.token_urlsafe(32)
-        token_hash = hashlib.sha256(token_value.encode()).hexdigest()
-        expires_at = datetime.now(timezone.utc) + timedelta(
-            minutes=self._settings.password_reset_token_expire_minutes
-        )
-        self._password_reset_repository.create(user.id, token_hash, expires_at)
-        self._email_service.send_password_reset(user.email, token_value, user.first_name)
+        The request does the same work whether or not the account exists, so
+        its latency reveals nothing. Without ``background_tasks`` the work runs
+        inline.
+        """
+        args = (self._session_factory, self._collaborators, payload.identifier, payload.identifier_kind)
+        if background_tasks is None:
+            issue_password_reset(*args)
+        else:
+            background_tasks.add_task(issue_password_reset, *args)
 
     def reset_password(self, payload: ResetPasswordRequest) -> None:
         token_hash = hashlib.sha256(payload.token.encode()).hexdigest()
         token = self._password_reset_repository.get_by_hash(token_hash)
-        if not token or token.used or token.expires_at < datetime.now(timezone.utc):
+        if not token or token.used or _as_utc(token.expires_at) < datetime.now(timezone.utc):
+            raise _invalid_reset_token_exception()
+
+        hashed_password = self._hashing.hash_password(payload.new_password)
+        with self._unit_of_work.begin():
+            if not self._password_reset_repository.mark_used(token):
+                raise _invalid_reset_token_exception()
+            self._user_repository.update_password(token.user, hashed_password)
+
+
+class AsyncAuthService:
+    """Async variant of :class:`AuthService` for the AsyncSession request path."""
+
+    def __init__(
+        self,
+        user_repository: AsyncUserRepository,
+        password_reset_repository: AsyncPasswordResetRepository,
+        unit_of_work: AsyncUnitOfWork,
+        collaborators: AuthCollaborators | None = None,
+        session_factory: async_sessionmaker[AsyncSession] | None = None,
+    ) -> None:
+        collaborators = collaborators or get_auth_collaborators()
+        self._collaborators = collaborators
+        self._session_factory = session_factory or get_async_sessionmaker()
+        self._user_repository = user_repository
+        self._password_reset_repository = password_reset_repository
+        self._unit_of_work = unit_of_work
+        self._email_service = collaborators.email_service
+        self._hashing = collaborators.hashing
+        self._login_rate_limiter = collaborators.login_rate_limiter
+        self._password_rehasher = collaborators.password_rehasher
+        self._settings = collaborators.settings
+
+    async def register_user(self, payload: UserCreate) -> User:
+        hashed_password = await self._hashing.ahash_password(payload.password)
+        try:
+            async with self._unit_of_work.begin():
+                return await self._user_repository.create(payload, hashed_password)
+        except DuplicateUserError as exc:
+            raise _duplicate_user_exception(exc) from exc
+
+    async def get_user(self, user_id: int) -> User:
+        user = await self._user_repository.get_by_id(user_id)
+        if not user:
+            raise HTTPException(status_code=status.HTTP_404_NOT_FOUND, detail="user not found")
+        return user
+
+    async def authenticate_user(self, payload: LoginRequest, client_ip: str | None = None) -> TokenResponse:
+        self._login_rate_limiter.check(payload.identifier, client_ip)
+        credentials = await self._user_repository.get_login_credentials(payload.identifier, payload.identifier_kind)
+        if not credentials or not await self._hashing.averify_password(
+            payload.password, credentials.hashed_password
+        ):
             raise HTTPException(
-                status_code=status.HTTP_400_BAD_REQUEST,
-                detail="invalid or expired reset token",
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="invalid credentials",
             )
+        _schedule_rehash(self._password_rehasher, credentials, payload.password)
+        token = create_access_token(str(credentials.id))
+        return TokenResponse(access_token=token)
+
+    async def request_password_reset(
+        self, payload: ForgotPasswordRequest, background_tasks: BackgroundTasks | None = None
+    ) -> None:
+        args = (self._session_factory, self._collaborators, payload.identifier, payload.identifier_kind)
+        if background_tasks is None:
+            await aissue_password_reset(*args)
+        else:
+            background_tasks.add_task(aissue_password_reset, *args)
+
+    async def reset_password(self, payload: ResetPasswordRequest) -> None:
+        token_hash = hashlib.sha256(payload.token.encode()).hexdigest()
+        token = await self._password_reset_repository.get_by_hash(token_hash)
+        if not token or token.used or _as_utc(token.expires_at) < datetime.now(timezone.utc):
+            raise _invalid_reset_token_exception()
 
-        hashed_password = get_password_hash(payload.new_password)
-        self._user_repository.update_password(token.user, hashed_password)
-        self._password_reset_repository.mark_used(token)
+        hashed_password = await self._hashing.ahash_password(payload.new_password)
+        async with self._unit_of_work.begin():
+            if not await self._password_reset_repository.mark_used(token):
+                raise _invalid_reset_token_exception()
+            await self._user_repository.update_password(token.user, hashed_password)
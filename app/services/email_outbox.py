@@ -0,0 +1,104 @@
+"""In-process outbox that delivers queued emails from a background thread."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from email.message import EmailMessage
+from functools import lru_cache
+
+from app.core.config import Settings, get_settings
+from app.services.email_service import SmtpTransport
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class EmailOutbox:
+    """Bounded queue drained by a single sender thread.
+
+    The sender keeps one SMTP connection open while messages keep arriving,
+    sends whatever has accumulated as a batch, and closes the connection after
+    ``smtp_idle_timeout_seconds`` without traffic.
+    """
+
+    def __init__(self, settings: Settings | None = None, transport: SmtpTransport | None = None) -> None:
+        self._settings = settings or get_settings()
+        self._transport = transport or SmtpTransport(self._settings)
+        self._queue: queue.Queue = queue.Queue(maxsize=self._settings.email_outbox_max_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.sent = 0
+        self.failed = 0
+
+    def enqueue(self, message: EmailMessage) -> bool:
+        """Queue ``message`` for delivery; returns ``False`` when the outbox is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(message)
+        except queue.Full:
+            logger.warning("Email outbox full; delivering to %s inline", message["To"])
+            return False
+        return True
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="email-outbox", daemon=True)
+                self._thread.start()
+
+    def _next_batch(self) -> tuple[list[EmailMessage], bool]:
+        """Return the next batch and whether the stop marker was consumed with it."""
+        try:
+            first = self._queue.get(timeout=self._settings.smtp_idle_timeout_seconds)
+        except queue.Empty:
+            self._transport.close()
+            return [], False
+        batch = [first]
+        while len(batch) < self._settings.email_outbox_batch_size:
+            try:
+                batch.append(self._queue.get_nowait())
+            except queue.Empty:
+                break
+        messages = [item for item in batch if item is not _STOP]
+        return messages, len(messages) != len(batch)
+
+    def _run(self) -> None:
+        stopping = False
+        while not stopping:
+            batch, stopping = self._next_batch()
+            if not batch:
+                continue
+            try:
+                failed = self._transport.send_batch(batch)
+            except Exception:
+                failed = len(batch)
+                self._transport.close()
+                logger.exception("Failed to deliver %d queued email(s)", len(batch))
+            self.sent += len(batch) - failed
+            self.failed += failed
+        self._transport.close()
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Deliver what is already queued, then stop the sender thread.
+
+        The stop marker is consumed by the sender, so messages enqueued later
+        start a fresh sender thread and are delivered as usual.
+        """
+        if self._thread is None:
+            return
+        try:
+            self._queue.put(_STOP, timeout=timeout)
+        except queue.Full:
+            logger.warning("Email outbox still full at shutdown; %d message(s) undelivered", self._queue.qsize())
+        self._thread.join(timeout)
+        self._thread = None
+
+
+@lru_cache
+def get_email_outbox() -> EmailOutbox:
+    """Return the process-wide outbox used by request handlers."""
+    return EmailOutbox()
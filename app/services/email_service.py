@@ -1,22 +1,100 @@
-"""Simple SMTP email delivery helper."""
+"""SMTP email composition and delivery helpers."""
 from __future__ import annotations
 
 import logging
 import smtplib
+import time
+from collections.abc import Sequence
 from email.message import EmailMessage
+from typing import TYPE_CHECKING
 
 from app.core.config import Settings, get_settings
+from app.core.request_metrics import record_email_time
+
+if TYPE_CHECKING:
+    from app.services.email_outbox import EmailOutbox
 
 logger = logging.getLogger(__name__)
 
 
-class EmailService:
-    """Responsible for composing and dispatching transactional emails."""
+# Refusals the server answered with; smtplib resets the transaction and the session stays usable.
+_SESSION_INTACT_ERRORS = (smtplib.SMTPResponseException, smtplib.SMTPRecipientsRefused)
+
+
+class SmtpTransport:
+    """Holds one SMTP connection open across sends and reconnects when it drops."""
 
     def __init__(self, settings: Settings | None = None) -> None:
         self._settings = settings or get_settings()
+        self._smtp: smtplib.SMTP | None = None
 
-    def send_password_reset(self, recipient: str, token: str, recipient_name: str | None = None) -> None:
+    def _connect(self) -> smtplib.SMTP:
+        smtp = smtplib.SMTP(self._settings.smtp_host, self._settings.smtp_port)
+        if self._settings.smtp_use_tls:
+            smtp.starttls()
+        if self._settings.smtp_username and self._settings.smtp_password:
+            smtp.login(self._settings.smtp_username, self._settings.smtp_password)
+        return smtp
+
+    def send_batch(self, messages: Sequence[EmailMessage]) -> int:
+        """Deliver ``messages`` over the shared connection and return how many failed.
+
+        A dropped connection is re-opened once per message. Any other failure
+        is logged and skips only that message; the connection is closed unless
+        the server answered, in which case the session is still usable.
+        """
+        if self._settings.smtp_suppress_send:
+            for message in messages:
+                logger.info("SMTP send suppressed. Message to %s:\n%s", message["To"], message.get_content())
+            return 0
+
+        failed = 0
+        for message in messages:
+            try:
+                try:
+                    self._send_one(message)
+                except smtplib.SMTPServerDisconnected:
+                    self.close()
+                    self._send_one(message)
+            except (smtplib.SMTPException, OSError) as exc:
+                failed += 1
+                logger.exception("Failed to deliver email to %s", message["To"])
+                if not isinstance(exc, _SESSION_INTACT_ERRORS):
+                    self.close()
+        return failed
+
+    def _send_one(self, message: EmailMessage) -> None:
+        if self._smtp is None:
+            self._smtp = self._connect()
+        self._smtp.send_message(message)
+
+    def close(self) -> None:
+        if self._smtp is None:
+            return
+        try:
+            self._smtp.quit()
+        except smtplib.SMTPException:
+            self._smtp.close()
+        except OSError:
+            pass
+        finally:
+            self._smtp = None
+
+
+class EmailService:
+    """Responsible for composing and dispatching transactional emails.
+
+    When an outbox is supplied, messages are queued for background delivery
+    and the caller returns without waiting on SMTP.
+    """
+
+    def __init__(self, settings: Settings | None = None, outbox: EmailOutbox | None = None) -> None:
+        self._settings = settings or get_settings()
+        self._outbox = outbox
+
+    def compose_password_reset(
+        self, recipient: str, token: str, recipient_name: str | None = None
+    ) -> EmailMessage:
         reset_link = f"{self._settings.password_reset_base_url}?token={token}"
         subject = f"Reset your {self._settings.project_name} password"
         greeting_name = recipient_name or "there"
@@ -33,14 +111,18 @@ class EmailService:
         message["From"] = self._settings.smtp_sender
         message["To"] = recipient
         message.set_content(body)
+        return message
 
-        if self._settings.smtp_suppress_send:
-            logger.info("SMTP send suppressed. Token for %s would be %s", recipient, token)
-            return
-
-        with smtplib.SMTP(self._settings.smtp_host, self._settings.smtp_port) as smtp:
-            if self._settings.smtp_use_tls:
-                smtp.starttls()
-            if self._settings.smtp_username and self._settings.smtp_password:
-                smtp.login(self._settings.smtp_username, self._settings.smtp_password)
-            smtp.send_message(message)
+    def send_password_reset(self, recipient: str, token: str, recipient_name: str | None = None) -> None:
+        started = time.perf_counter()
+        message = self.compose_password_reset(recipient, token, recipient_name)
+        try:
+            if self._outbox is not None and self._outbox.enqueue(message):
+                return
+            transport = SmtpTransport(self._settings)
+            try:
+                transport.send_batch([message])
+            finally:
+                transport.close()
+        finally:
+            record_email_time(time.perf_counter() - started)
@@ -0,0 +1,224 @@
+"""In-process Bloom filter of known emails and usernames for short-circuiting lookups.
+
+A negative answer means the identifier is definitely not registered, so login
+and forgot-password can skip the database entirely; a positive answer may be a
+false positive and falls through to the normal query.
+"""
+from __future__ import annotations
+
+import hashlib
+import logging
+import math
+import threading
+import time
+from collections.abc import Callable, Iterable
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy import select
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.db.session import SessionLocal
+from app.models.user import User
+
+logger = logging.getLogger(__name__)
+
+# Ids that appear as gaps during incremental syncs (an insert that committed out
+# of order, or a rolled-back one) are re-read for this long.
+_HOLE_GRACE_SECONDS = 60.0
+_MAX_TRACKED_HOLES = 10_000
+
+
+class BloomFilter:
+    """Fixed-size Bloom filter using double hashing over a single BLAKE2b digest."""
+
+    def __init__(self, capacity: int, error_rate: float) -> None:
+        self.capacity = max(capacity, 1)
+        self.error_rate = error_rate
+        self.size_bits = max(8, math.ceil(-self.capacity * math.log(error_rate) / math.log(2) ** 2))
+        self.hash_count = max(1, round(self.size_bits / self.capacity * math.log(2)))
+        self._bits = bytearray((self.size_bits + 7) // 8)
+
+    def _positions(self, key: str) -> Iterable[int]:
+        digest = hashlib.blake2b(key.encode(), digest_size=16).digest()
+        first = int.from_bytes(digest[:8], "little")
+        second = int.from_bytes(digest[8:], "little") | 1
+        return ((first + index * second) % self.size_bits for index in range(self.hash_count))
+
+    def add(self, key: str) -> None:
+        for position in self._positions(key):
+            self._bits[position >> 3] |= 1 << (position & 7)
+
+    def __contains__(self, key: str) -> bool:
+        return all(self._bits[position >> 3] & (1 << (position & 7)) for position in self._positions(key))
+
+    @property
+    def memory_bytes(self) -> int:
+        return len(self._bits)
+
+    def fill_ratio(self) -> float:
+        return int.from_bytes(self._bits, "little").bit_count() / self.size_bits
+
+    def estimated_keys(self) -> int:
+        """Distinct keys estimated from the fill ratio, so re-adding a key is not double counted."""
+        fill = self.fill_ratio()
+        if fill >= 1.0:
+            return self.capacity * 100
+        return round(-self.size_bits / self.hash_count * math.log(1 - fill))
+
+    def estimated_false_positive_rate(self) -> float:
+        return self.fill_ratio() ** self.hash_count
+
+
+def _normalize(identifier: str) -> str | None:
+    """Case-fold ASCII identifiers; ``None`` means the filter must not be consulted.
+
+    Database collations may fold case, trailing spaces or accents, so only keys
+    whose comparison the filter can reproduce exactly are ever answered negatively.
+    """
+    key = identifier.strip()
+    return key.casefold() if key.isascii() else None
+
+
+class KnownIdentifierFilter:
+    """Bloom filter of every registered email and username, kept fresh by a sync thread.
+
+    The sync thread loads all users on start and then tails new ids every
+    ``identifier_filter_sync_seconds``; users created through this process are
+    added immediately. Until the first load completes every identifier is
+    reported as possibly present.
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._session_factory = session_factory
+        self._bloom = BloomFilter(self._settings.identifier_filter_capacity, self._settings.identifier_filter_error_rate)
+        self._lock = threading.Lock()
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._max_id = 0
+        self._holes: dict[int, float] = {}
+        self.ready = False
+        self.checks = 0
+        self.definitely_absent = 0
+        self.false_positives = 0
+        self.syncs = 0
+        self.last_sync_rows = 0
+
+    def add(self, email: str, username: str) -> None:
+        with self._lock:
+            for identifier in (email, username):
+                key = _normalize(identifier)
+                if key is not None:
+                    self._bloom.add(key)
+
+    def might_exist(self, identifier: str) -> bool:
+        """Return ``False`` only when ``identifier`` is certainly not registered."""
+        key = _normalize(identifier)
+        with self._lock:
+            self.checks += 1
+            if not self.ready or key is None or key in self._bloom:
+                return True
+            self.definitely_absent += 1
+            return False
+
+    def record_false_positive(self) -> None:
+        """Called by the repository when a possibly-present identifier was not found."""
+        with self._lock:
+            self.false_positives += 1
+
+    def sync(self, batch_size: int = 10_000) -> int:
+        """Add users inserted since the last sync and return how many rows were read."""
+        now = time.monotonic()
+        rows_read = 0
+        with self._session_factory() as db:
+            with self._lock:
+                self._holes = {hole: seen for hole, seen in self._holes.items() if now - seen < _HOLE_GRACE_SECONDS}
+                after = min(self._holes) - 1 if self._holes else self._max_id
+            while True:
+                rows = db.execute(
+                    select(User.id, User.email, User.username).where(User.id > after).order_by(User.id).limit(batch_size)
+                ).all()
+                self._apply(rows, now, track_holes=self.ready)
+                rows_read += len(rows)
+                if len(rows) < batch_size:
+                    break
+                after = rows[-1].id
+        with self._lock:
+            self.ready = True
+            self.syncs += 1
+            self.last_sync_rows = rows_read
+            estimated_keys = self._bloom.estimated_keys() if rows_read else 0
+        if estimated_keys > self._bloom.capacity:
+            logger.warning(
+                "Identifier filter holds about %d keys, above its capacity of %d; raise IDENTIFIER_FILTER_CAPACITY",
+                estimated_keys,
+                self._bloom.capacity,
+            )
+        return rows_read
+
+    def _apply(self, rows: list[Any], now: float, track_holes: bool) -> None:
+        with self._lock:
+            for user_id, email, username in rows:
+                for identifier in (email, username):
+                    key = _normalize(identifier)
+                    if key is not None:
+                        self._bloom.add(key)
+                self._holes.pop(user_id, None)
+                if user_id > self._max_id:
+                    if track_holes:
+                        for missing in range(self._max_id + 1, min(user_id, self._max_id + 1 + _MAX_TRACKED_HOLES)):
+                            self._holes[missing] = now
+                    self._max_id = user_id
+
+    def _run(self) -> None:
+        while True:
+            try:
+                self.sync()
+            except Exception:
+                logger.exception("Identifier filter sync failed")
+            if self._stop.wait(self._settings.identifier_filter_sync_seconds):
+                return
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="identifier-filter-sync", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            negatives = self.definitely_absent + self.false_positives
+            return {
+                "ready": self.ready,
+                "estimated_keys": self._bloom.estimated_keys(),
+                "capacity": self._bloom.capacity,
+                "memory_bytes": self._bloom.memory_bytes,
+                "hash_count": self._bloom.hash_count,
+                "estimated_false_positive_rate": self._bloom.estimated_false_positive_rate(),
+                "observed_false_positive_rate": self.false_positives / negatives if negatives else 0.0,
+                "checks": self.checks,
+                "definitely_absent": self.definitely_absent,
+                "false_positives": self.false_positives,
+                "syncs": self.syncs,
+                "last_sync_rows": self.last_sync_rows,
+                "tracked_id_gaps": len(self._holes),
+            }
+
+
+@lru_cache
+def get_identifier_filter() -> KnownIdentifierFilter:
+    """Return the process-wide identifier filter."""
+    return KnownIdentifierFilter()
@@ -0,0 +1,131 @@
+"""Background persistence of password hashes whose bcrypt cost no longer matches settings."""
+from __future__ import annotations
+
+import logging
+import queue
+import threading
+from collections.abc import Callable
+from functools import lru_cache
+from typing import Any, NamedTuple
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.hashing import HashingExecutor, HashingPoolSaturatedError, get_hashing_executor
+from app.db.session import SessionLocal
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.user_cache import get_user_cache
+from app.repositories.user_repository import UserRepository
+
+logger = logging.getLogger(__name__)
+
+_STOP = object()
+
+
+class RehashJob(NamedTuple):
+    user_id: int
+    password: str
+    current_hash: str
+
+
+class PasswordRehasher:
+    """Rehashes passwords after a successful login on a single background thread.
+
+    Login only verifies the password and checks whether the stored hash uses the
+    configured cost; the new hash is computed and written here, so raising or
+    lowering ``bcrypt_rounds`` never adds a second bcrypt run to a request.
+    Jobs are dropped when the queue is full or the hashing pool is saturated;
+    the user is simply picked up again on a later login.
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+        hashing_executor: HashingExecutor | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._session_factory = session_factory
+        self._hashing = hashing_executor
+        self._queue: queue.Queue = queue.Queue(maxsize=self._settings.password_rehash_queue_size)
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.scheduled = 0
+        self.rehashed = 0
+        self.stale = 0
+        self.dropped = 0
+        self.failed = 0
+
+    def schedule(self, user_id: int, password: str, current_hash: str) -> bool:
+        """Queue a rehash; returns ``False`` when the queue is full."""
+        self._ensure_started()
+        try:
+            self._queue.put_nowait(RehashJob(user_id, password, current_hash))
+        except queue.Full:
+            self._count("dropped")
+            return False
+        self._count("scheduled")
+        return True
+
+    def rehash(self, job: RehashJob) -> bool:
+        """Hash ``job.password`` with the current cost and store it if the old hash is still current."""
+        hashing = self._hashing or get_hashing_executor()
+        try:
+            new_hash = hashing.hash_password(job.password)
+        except HashingPoolSaturatedError:
+            self._count("dropped")
+            return False
+        with self._session_factory() as db:
+            with UnitOfWork(db).begin():
+                user_cache = get_user_cache() if self._settings.user_cache_enabled else None
+                repository = UserRepository(db, user_cache=user_cache)
+                replaced = repository.replace_password_hash(job.user_id, job.current_hash, new_hash)
+        self._count("rehashed" if replaced else "stale")
+        return replaced
+
+    def _ensure_started(self) -> None:
+        if self._thread is not None:
+            return
+        with self._lock:
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._run, name="password-rehash", daemon=True)
+                self._thread.start()
+
+    def _run(self) -> None:
+        while (job := self._queue.get()) is not _STOP:
+            try:
+                self.rehash(job)
+            except Exception:
+                self._count("failed")
+                logger.exception("Failed to rehash password for user %s", job.user_id)
+
+    def _count(self, counter: str) -> None:
+        with self._lock:
+            setattr(self, counter, getattr(self, counter) + 1)
+
+    def stop(self, timeout: float | None = 5.0) -> None:
+        """Finish the queued rehashes, then stop the worker thread."""
+        if self._thread is None:
+            return
+        self._queue.put(_STOP)
+        self._thread.join(timeout)
+        self._thread = None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "enabled": self._settings.password_rehash_on_login,
+                "bcrypt_rounds": self._settings.bcrypt_rounds,
+                "queued": self._queue.qsize(),
+                "scheduled": self.scheduled,
+                "rehashed": self.rehashed,
+                "stale": self.stale,
+                "dropped": self.dropped,
+                "failed": self.failed,
+            }
+
+
+@lru_cache
+def get_password_rehasher() -> PasswordRehasher:
+    """Return the process-wide rehasher used by the login path."""
+    return PasswordRehasher()
@@ -0,0 +1,112 @@
+"""Scheduled, batched purge of expired and used password reset tokens."""
+from __future__ import annotations
+
+import logging
+import threading
+import time
+from collections.abc import Callable
+from datetime import datetime, timedelta, timezone
+from functools import lru_cache
+from typing import Any
+
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.db.session import SessionLocal
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.password_reset_repository import PasswordResetRepository
+
+logger = logging.getLogger(__name__)
+
+
+class PasswordResetTokenSweeper:
+    """Deletes purgeable tokens in small committed batches on a background thread.
+
+    Unused tokens are purged as soon as they expire; used tokens are kept for
+    ``used_token_retention_hours`` first. Each batch commits on its own and the
+    sweeper pauses between batches so no single transaction holds locks long.
+    """
+
+    def __init__(
+        self,
+        settings: Settings | None = None,
+        session_factory: Callable[[], Session] = SessionLocal,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._session_factory = session_factory
+        self._stop = threading.Event()
+        self._thread: threading.Thread | None = None
+        self._lock = threading.Lock()
+        self.rows_purged = 0
+        self.batches = 0
+        self.runs = 0
+        self.last_run_seconds = 0.0
+        self.last_run_rows = 0
+
+    def sweep(self) -> int:
+        """Purge everything currently eligible and return the number of rows removed."""
+        started = time.perf_counter()
+        now = datetime.now(timezone.utc)
+        used_before = now - timedelta(hours=self._settings.used_token_retention_hours)
+        batch_size = self._settings.token_sweeper_batch_size
+        removed = 0
+        with self._session_factory() as db:
+            repository = PasswordResetRepository(db)
+            unit_of_work = UnitOfWork(db)
+            while not self._stop.is_set():
+                with unit_of_work.begin():
+                    deleted = repository.purge_batch(now, used_before, batch_size)
+                removed += deleted
+                with self._lock:
+                    self.rows_purged += deleted
+                    self.batches += 1
+                if deleted < batch_size:
+                    break
+                self._stop.wait(self._settings.token_sweeper_batch_pause_seconds)
+        with self._lock:
+            self.runs += 1
+            self.last_run_rows = removed
+            self.last_run_seconds = time.perf_counter() - started
+        return removed
+
+    def _run(self) -> None:
+        while not self._stop.wait(self._settings.token_sweeper_interval_seconds):
+            try:
+                removed = self.sweep()
+                logger.info("Purged %d password reset token(s)", removed)
+            except Exception:
+                logger.exception("Password reset token sweep failed")
+
+    def start(self) -> None:
+        if self._thread is not None:
+            return
+        self._stop.clear()
+        self._thread = threading.Thread(target=self._run, name="reset-token-sweeper", daemon=True)
+        self._thread.start()
+
+    def stop(self) -> None:
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join(timeout=5)
+            self._thread = None
+
+    def snapshot(self) -> dict[str, Any]:
+        with self._lock:
+            return {
+                "rows_purged": self.rows_purged,
+                "batches": self.batches,
+                "runs": self.runs,
+                "last_run_rows": self.last_run_rows,
+                "last_run_seconds": self.last_run_seconds,
+            }
+
+
+@lru_cache
+def get_token_sweeper() -> PasswordResetTokenSweeper:
+    """Return the process-wide sweeper."""
+    return PasswordResetTokenSweeper()
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO)
+    print(f"purged {get_token_sweeper().sweep()} password reset token(s)")
@@ -0,0 +1,211 @@
+"""Streaming bulk user import with pooled password hashing and batched inserts.
+
+Usage as a CLI::
+
+    python -m app.services.user_import users.ndjson
+    python -m app.services.user_import users.csv --format csv --batch-size 1000
+"""
+from __future__ import annotations
+
+import argparse
+import csv
+import json
+import logging
+import multiprocessing
+import sys
+from collections.abc import Callable, Iterable, Iterator
+from concurrent.futures import Executor, ProcessPoolExecutor
+from datetime import datetime, timezone
+from functools import lru_cache
+from itertools import islice
+from typing import IO, Any
+
+from pydantic import ValidationError
+from sqlalchemy.exc import IntegrityError
+from sqlalchemy.orm import Session
+
+from app.core.config import Settings, get_settings
+from app.core.security import get_password_hash
+from app.db.session import SessionLocal
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import ImportReport, ImportRowError, UserImportRecord
+
+logger = logging.getLogger(__name__)
+
+IMPORT_FORMATS = ("ndjson", "csv")
+
+
+def iter_records(stream: IO[str], file_format: str) -> Iterator[tuple[int, dict[str, Any] | None]]:
+    """Yield ``(row_number, record)`` lazily; ``record`` is ``None`` for unparseable lines."""
+    if file_format == "csv":
+        reader = csv.DictReader(stream)
+        for row_number, row in enumerate(reader, start=2):
+            yield row_number, {key: value for key, value in row.items() if value not in (None, "")}
+        return
+    for row_number, line in enumerate(stream, start=1):
+        if not line.strip():
+            continue
+        try:
+            record = json.loads(line)
+        except json.JSONDecodeError:
+            yield row_number, None
+            continue
+        yield row_number, record if isinstance(record, dict) else None
+
+
+class UserImporter:
+    """Imports users batch by batch so memory stays flat regardless of input size.
+
+    For each batch: validate rows, drop rows that clash with existing users or
+    earlier rows, hash the survivors on a process pool, and insert them with
+    one executemany. Conflicts and invalid rows are reported, never fatal.
+    """
+
+    def __init__(
+        self,
+        db: Session,
+        settings: Settings | None = None,
+        on_error: Callable[[ImportRowError], None] | None = None,
+    ) -> None:
+        self._settings = settings or get_settings()
+        self._db = db
+        self._repository = UserRepository(db)
+        self._unit_of_work = UnitOfWork(db)
+        self._on_error = on_error
+        self.report = ImportReport()
+
+    def _error(self, row: int, message: str, field: str | None = None) -> None:
+        error = ImportRowError(row=row, field=field, message=message)
+        if self._on_error is not None:
+            self._on_error(error)
+        if len(self.report.errors) < self._settings.user_import_max_reported_errors:
+            self.report.errors.append(error)
+        else:
+            self.report.errors_truncated = True
+
+    def run(
+        self, records: Iterable[tuple[int, dict[str, Any] | None]], pool: Executor | None = None
+    ) -> ImportReport:
+        """Import ``records``, hashing on ``pool`` or on a process pool started for this run."""
+        if pool is None:
+            with ProcessPoolExecutor(max_workers=self._settings.user_import_hash_workers or None) as run_pool:
+                return self.run(records, run_pool)
+        iterator = iter(records)
+        while batch := list(islice(iterator, self._settings.user_import_batch_size)):
+            self._import_batch(batch, pool)
+        return self.report
+
+    def _validate(self, batch: list[tuple[int, dict[str, Any] | None]]) -> list[tuple[int, UserImportRecord]]:
+        valid = []
+        for row_number, record in batch:
+            self.report.processed += 1
+            if record is None:
+                self.report.invalid += 1
+                self._error(row_number, "row is not a JSON object")
+                continue
+            try:
+                valid.append((row_number, UserImportRecord.model_validate(record)))
+            except ValidationError as exc:
+                self.report.invalid += 1
+                first = exc.errors()[0]
+                self._error(row_number, first["msg"], ".".join(str(part) for part in first["loc"]) or None)
+        return valid
+
+    def _without_conflicts(
+        self, rows: list[tuple[int, UserImportRecord]]
+    ) -> list[tuple[int, UserImportRecord]]:
+        taken_emails, taken_usernames = self._repository.existing_identities(
+            [record.email for _, record in rows], [record.username for _, record in rows]
+        )
+        # Earlier batches are already committed, so only this batch needs tracking here.
+        accepted = []
+        for row_number, record in rows:
+            if record.email in taken_emails:
+                self.report.conflicts += 1
+                self._error(row_number, "email is already registered", "email")
+            elif record.username in taken_usernames:
+                self.report.conflicts += 1
+                self._error(row_number, "username is already taken", "username")
+            else:
+                taken_emails.add(record.email)
+                taken_usernames.add(record.username)
+                accepted.append((row_number, record))
+        return accepted
+
+    def _import_batch(self, batch: list[tuple[int, dict[str, Any] | None]], pool: Executor) -> None:
+        rows = self._without_conflicts(self._validate(batch))
+        if not rows:
+            return
+        chunksize = max(1, len(rows) // 32)
+        hashes = pool.map(get_password_hash, [record.password for _, record in rows], chunksize=chunksize)
+        now = datetime.now(timezone.utc)
+        values = [
+            (row_number, record.model_dump(exclude={"password"}) | {
+                "hashed_password": hashed,
+                "created_at": now,
+                "updated_at": now,
+            })
+            for (row_number, record), hashed in zip(rows, hashes)
+        ]
+        try:
+            with self._unit_of_work.begin():
+                self._repository.bulk_insert([value for _, value in values])
+            self.report.inserted += len(values)
+        except IntegrityError:
+            # A concurrent writer claimed an identity after the pre-check; retry row by row.
+            for row_number, value in values:
+                try:
+                    with self._unit_of_work.begin():
+                        self._repository.bulk_insert([value])
+                    self.report.inserted += 1
+                except IntegrityError:
+                    self.report.conflicts += 1
+                    self._error(row_number, "email or username already exists")
+
+
+@lru_cache
+def get_import_hash_pool() -> ProcessPoolExecutor:
+    """Return the process pool shared by API imports in this worker, created on first use.
+
+    Workers are spawned rather than forked, since forking the threaded web
+    server could copy locks held by other threads into the children.
+    """
+    return ProcessPoolExecutor(
+        max_workers=get_settings().user_import_hash_workers or None,
+        mp_context=multiprocessing.get_context("spawn"),
+    )
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("path", help="NDJSON or CSV file, or - for stdin")
+    parser.add_argument("--format", choices=IMPORT_FORMATS)
+    parser.add_argument("--batch-size", type=int)
+    parser.add_argument("--hash-workers", type=int)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    overrides = {
+        key: value
+        for key, value in {
+            "user_import_batch_size": args.batch_size,
+            "user_import_hash_workers": args.hash_workers,
+        }.items()
+        if value is not None
+    }
+    settings = settings.model_copy(update=overrides)
+    file_format = args.format or ("csv" if args.path.endswith(".csv") else "ndjson")
+
+    def print_error(error: ImportRowError) -> None:
+        print(error.model_dump_json(), file=sys.stderr)
+
+    stream = sys.stdin if args.path == "-" else open(args.path, newline="", encoding="utf-8")
+    with stream, SessionLocal() as db:
+        importer = UserImporter(db, settings, on_error=print_error)
+        report = importer.run(iter_records(stream, file_format))
+    print(report.model_dump_json(exclude={"errors"}))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,191 @@
+"""Latency, throughput and statement-count benchmarks for the auth flows.
+
+Usage::
+
+    python -m benchmarks.auth_suite                                   # scratch sqlite file
+    python -m benchmarks.auth_suite --database-url mysql+pymysql://...  # local MySQL
+    python -m benchmarks.auth_suite --save-baseline benchmarks/baselines/sqlite.json
+    python -m benchmarks.auth_suite --compare benchmarks/baselines/sqlite.json
+
+Endpoint scenarios go through the full ASGI stack with ``TestClient``; the
+function scenarios call ``AuthService`` and ``app.core.security`` directly.
+With ``--compare`` the run exits non-zero when a scenario's p95 regresses by
+more than ``--tolerance`` or it issues more statements than the baseline.
+
+The schema is dropped and recreated before the run, so a ``--database-url``
+that already has tables is refused unless ``--reset`` is given.
+"""
+from __future__ import annotations
+
+import argparse
+import itertools
+import json
+import logging
+import sys
+import tempfile
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+from sqlalchemy.orm import Session, sessionmaker
+
+from app.core.config import Settings
+from app.core.rate_limit import LoginRateLimiter
+from app.core.security import create_access_token, decode_access_token, get_password_hash, verify_password
+from app.db.base import Base
+from app.db.session import get_db, get_session_factory
+from app.db.unit_of_work import UnitOfWork
+from app.main import create_app
+from app.repositories.password_reset_repository import PasswordResetRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import LoginRequest
+from app.services.auth_service import AuthCollaborators, AuthService, build_auth_collaborators
+from benchmarks.harness import find_regressions, measure, print_table, save_results
+
+PASSWORD = "supersecret"
+
+
+def _user(index: int, prefix: str = "bench") -> dict[str, str]:
+    return {
+        "first_name": "Bench",
+        "last_name": "User",
+        "email": f"{prefix}{index}@example.com",
+        "phone": "+15555550123",
+        "contact": "email",
+        "username": f"{prefix}{index}",
+        "password": PASSWORD,
+        "confirm_password": PASSWORD,
+    }
+
+
+def _unthrottled_collaborators() -> AuthCollaborators:
+    """Every request comes from one client address, which the per-IP login limit would throttle."""
+    return replace(
+        build_auth_collaborators(), login_rate_limiter=LoginRateLimiter(Settings(login_rate_limit_enabled=False))
+    )
+
+
+def run(database_url: str, iterations: int, reset: bool = False) -> dict[str, dict[str, float]]:
+    engine = create_engine(database_url)
+    existing = inspect(engine).get_table_names()
+    if existing and not reset:
+        engine.dispose()
+        raise SystemExit(
+            f"{engine.url.render_as_string()} already has tables ({', '.join(existing)}); "
+            "pass --reset to drop them"
+        )
+    Base.metadata.drop_all(bind=engine)
+    Base.metadata.create_all(bind=engine)
+    session_factory = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+
+    def override_get_db():
+        db = session_factory()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    app = create_app()
+    app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: session_factory
+    results: dict[str, dict[str, float]] = {}
+    token_counter = itertools.count()
+    collaborators = _unthrottled_collaborators()
+
+    with TestClient(app) as client, mock.patch(
+        "app.services.auth_service.secrets.token_urlsafe", lambda _: f"bench-token-{next(token_counter)}"
+    ), mock.patch("app.routers.auth_router.get_auth_collaborators", lambda: collaborators):
+        prefix = "/api/v1/auth"
+        results["endpoint.register"] = measure(
+            lambda i: client.post(f"{prefix}/register", json=_user(i)), iterations, engine, 201
+        )
+        results["endpoint.login"] = measure(
+            lambda i: client.post(f"{prefix}/login", json={"identifier": f"bench{i}", "password": PASSWORD}),
+            iterations,
+            engine,
+            200,
+        )
+        first_token = next(token_counter)
+        results["endpoint.forgot_password"] = measure(
+            lambda i: client.post(f"{prefix}/forgot-password", json={"identifier": f"bench{i}"}),
+            iterations,
+            engine,
+            202,
+        )
+        results["endpoint.forgot_password_unknown"] = measure(
+            lambda i: client.post(f"{prefix}/forgot-password", json={"identifier": f"missing{i}"}),
+            iterations,
+            engine,
+            202,
+        )
+        results["endpoint.reset_password"] = measure(
+            lambda i: client.post(
+                f"{prefix}/reset-password",
+                json={
+                    "token": f"bench-token-{first_token + 1 + i}",
+                    "new_password": "brandnewpass",
+                    "confirm_password": "brandnewpass",
+                },
+            ),
+            iterations,
+            engine,
+            200,
+        )
+
+    with Session(engine, expire_on_commit=False) as db:
+        # App shutdown released the hashing pool the endpoint scenarios used.
+        collaborators = _unthrottled_collaborators()
+        service = AuthService(UserRepository(db), PasswordResetRepository(db), UnitOfWork(db), collaborators)
+        results["service.authenticate_user"] = measure(
+            lambda i: service.authenticate_user(LoginRequest(identifier=f"bench{i}", password="brandnewpass")),
+            iterations,
+            engine,
+        )
+
+    hashed = get_password_hash(PASSWORD)
+    token = create_access_token("1")
+    results["security.get_password_hash"] = measure(lambda _: get_password_hash(PASSWORD), iterations)
+    results["security.verify_password"] = measure(lambda _: verify_password(PASSWORD, hashed), iterations)
+    results["security.create_access_token"] = measure(lambda _: create_access_token("1"), iterations * 100)
+    results["security.decode_access_token"] = measure(lambda _: decode_access_token(token), iterations * 100)
+
+    engine.dispose()
+    return results
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--database-url", help="defaults to a scratch SQLite file")
+    parser.add_argument("--reset", action="store_true", help="drop the tables of a non-empty database first")
+    parser.add_argument("--iterations", type=int, default=50)
+    parser.add_argument("--save-baseline", type=Path)
+    parser.add_argument("--compare", type=Path)
+    parser.add_argument("--tolerance", type=float, default=0.25)
+    parser.add_argument("--min-delta-ms", type=float, default=1.0)
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.WARNING)
+    if args.database_url:
+        results = run(args.database_url, args.iterations, args.reset)
+    else:
+        with tempfile.TemporaryDirectory() as directory:
+            results = run(f"sqlite:///{Path(directory) / 'bench_auth.db'}", args.iterations)
+    print_table(results)
+
+    if args.save_baseline:
+        save_results(results, args.save_baseline)
+        print(f"baseline written to {args.save_baseline}")
+    if args.compare:
+        regressions = find_regressions(
+            results, json.loads(args.compare.read_text()), args.tolerance, args.min_delta_ms
+        )
+        for line in regressions:
+            print(f"REGRESSION {line}")
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,79 @@
+"""Microbenchmark of per-request dependency resolution for the auth controller.
+
+Usage::
+
+    python -m benchmarks.dependency_resolution --iterations 20000
+
+Three endpoints that do no work of their own are driven directly through the
+ASGI interface (no HTTP client in the loop):
+
+* ``baseline``  - no dependencies, the routing/serialisation floor
+* ``legacy``    - the previous wiring: a sync dependency (dispatched to the
+  threadpool) that builds the email service, repositories, service and
+  controller on every request
+* ``current``   - :func:`app.routers.auth_router.get_auth_controller`, which
+  binds the app-scoped collaborators to the request's session inline
+
+The reported overhead is each endpoint's mean latency minus the baseline.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+
+from fastapi import Depends, FastAPI
+from sqlalchemy.orm import Session
+
+from app.controllers.auth_controller import AuthController
+from app.db.session import get_db
+from app.db.unit_of_work import UnitOfWork
+from app.repositories.password_reset_repository import PasswordResetRepository
+from app.repositories.user_repository import UserRepository
+from app.routers.auth_router import get_auth_controller
+from app.services.auth_service import AuthService, build_auth_collaborators
+from benchmarks.harness import mean_asgi_latency_us
+
+
+def legacy_auth_controller(db: Session = Depends(get_db)) -> AuthController:
+    """The per-request wiring ``get_auth_controller`` used before collaborators were shared."""
+    service = AuthService(UserRepository(db), PasswordResetRepository(db), UnitOfWork(db), build_auth_collaborators())
+    return AuthController(service)
+
+
+def build_app() -> FastAPI:
+    application = FastAPI()
+
+    @application.get("/baseline")
+    def baseline() -> dict[str, bool]:
+        return {"ok": True}
+
+    @application.get("/legacy")
+    def legacy(controller: AuthController = Depends(legacy_auth_controller)) -> dict[str, bool]:
+        return {"ok": controller is not None}
+
+    @application.get("/current")
+    def current(controller: AuthController = Depends(get_auth_controller)) -> dict[str, bool]:
+        return {"ok": controller is not None}
+
+    return application
+
+
+async def _run(iterations: int) -> None:
+    application = build_app()
+    baseline = await mean_asgi_latency_us(application, "/baseline", iterations)
+    print(f"{'endpoint':>10}  {'mean us':>9}  {'overhead us':>11}")
+    print(f"{'baseline':>10}  {baseline:>9.1f}  {'-':>11}")
+    for name in ("legacy", "current"):
+        mean = await mean_asgi_latency_us(application, f"/{name}", iterations)
+        print(f"{name:>10}  {mean:>9.1f}  {mean - baseline:>11.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,173 @@
+"""Compare forgot-password response latency for known and unknown identifiers.
+
+Usage::
+
+    python -m benchmarks.forgot_password_timing --users 1000 --requests 2000 --smtp-ms 20
+
+Known and unknown identifiers are sent in random order through the ASGI
+interface. Latency is measured up to the last body message, i.e. what a
+client sees, not until background tasks finish. The email service sleeps
+``--smtp-ms`` per send to stand in for an SMTP round trip.
+
+``inline`` runs the lookup, token write and email before responding, as the
+route used to; ``background`` is the current route. Welch's t compares the
+two groups: |t| below about 2 means the difference is indistinguishable from
+noise at this sample size.
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+import json
+import random
+import statistics
+import tempfile
+import time
+from dataclasses import replace
+from pathlib import Path
+from unittest import mock
+
+from sqlalchemy import create_engine, insert
+from sqlalchemy.orm import sessionmaker
+from starlette.types import ASGIApp
+
+from app.db.base import Base, User
+from app.db.session import get_db, get_session_factory
+from app.main import create_app
+from app.services.auth_service import AuthService, build_auth_collaborators
+from benchmarks.harness import percentile
+
+
+class SlowEmailService:
+    def __init__(self, delay_seconds: float) -> None:
+        self._delay = delay_seconds
+
+    def send_password_reset(self, email: str, token: str, first_name: str) -> None:
+        time.sleep(self._delay)
+
+
+async def _time_to_response(application: ASGIApp, identifier: str) -> float:
+    """Seconds until the response body is complete; background tasks run afterwards."""
+    body = json.dumps({"identifier": identifier}).encode()
+    path = "/api/v1/auth/forgot-password"
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "POST",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [(b"content-type", b"application/json"), (b"content-length", str(len(body)).encode())],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+    responded_at: list[float] = []
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": body, "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 202:
+            raise RuntimeError(f"{path} returned {message['status']}")
+        if message["type"] == "http.response.body" and not message.get("more_body"):
+            responded_at.append(time.perf_counter())
+
+    started = time.perf_counter()
+    await application(scope, receive, send)
+    return responded_at[0] - started
+
+
+def _summary(samples: list[float]) -> dict[str, float]:
+    ordered = sorted(sample * 1000 for sample in samples)
+    return {
+        "mean_ms": statistics.fmean(ordered),
+        "p50_ms": percentile(ordered, 0.5),
+        "p95_ms": percentile(ordered, 0.95),
+        "stdev_ms": statistics.stdev(ordered),
+    }
+
+
+def welch_t(first: list[float], second: list[float]) -> float:
+    standard_error = (
+        statistics.variance(first) / len(first) + statistics.variance(second) / len(second)
+    ) ** 0.5
+    return (statistics.fmean(first) - statistics.fmean(second)) / standard_error if standard_error else 0.0
+
+
+async def _run(application: ASGIApp, users: int, requests: int) -> tuple[list[float], list[float]]:
+    plan = [("known", f"user{i % users}") if i % 2 else ("unknown", f"ghost{i}") for i in range(requests)]
+    random.shuffle(plan)
+    for _, identifier in plan[: min(requests, 100)]:
+        await _time_to_response(application, identifier)
+    samples: dict[str, list[float]] = {"known": [], "unknown": []}
+    for group, identifier in plan:
+        samples[group].append(await _time_to_response(application, identifier))
+    return samples["known"], samples["unknown"]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--smtp-ms", type=float, default=20.0)
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as directory:
+        engine = create_engine(f"sqlite:///{Path(directory) / 'forgot.db'}")
+        Base.metadata.create_all(bind=engine)
+        with engine.begin() as connection:
+            connection.execute(
+                insert(User),
+                [
+                    {
+                        "first_name": "Bench",
+                        "last_name": "User",
+                        "email": f"user{i}@example.com",
+                        "phone": "+15555550123",
+                        "contact": "email",
+                        "short_description": "Benchmark user",
+                        "username": f"user{i}",
+                        "hashed_password": "$2b$12$" + "x" * 53,
+                    }
+                    for i in range(args.users)
+                ],
+            )
+        session_factory = sessionmaker(autoflush=False, expire_on_commit=False, bind=engine)
+
+        def override_get_db():
+            db = session_factory()
+            try:
+                yield db
+            finally:
+                db.close()
+
+        application = create_app()
+        application.dependency_overrides[get_db] = override_get_db
+        application.dependency_overrides[get_session_factory] = lambda: session_factory
+        collaborators = replace(build_auth_collaborators(), email_service=SlowEmailService(args.smtp_ms / 1000))
+        background = AuthService.request_password_reset
+
+        def inline(self: AuthService, payload, background_tasks=None) -> None:
+            background(self, payload)
+
+        print(f"{'mode':>10}  {'group':>7}  {'mean ms':>8}  {'p50 ms':>8}  {'p95 ms':>8}  {'welch t':>8}")
+        with mock.patch("app.routers.auth_router.get_auth_collaborators", lambda: collaborators):
+            for mode in ("inline", "background"):
+                replacement = inline if mode == "inline" else background
+                with mock.patch.object(AuthService, "request_password_reset", replacement):
+                    known, unknown = asyncio.run(_run(application, args.users, args.requests))
+                t_statistic = welch_t(known, unknown)
+                for group, samples in (("known", known), ("unknown", unknown)):
+                    row = _summary(samples)
+                    print(
+                        f"{mode:>10}  {group:>7}  {row['mean_ms']:>8.2f}  {row['p50_ms']:>8.2f}"
+                        f"  {row['p95_ms']:>8.2f}  {t_statistic:>8.2f}"
+                    )
+        engine.dispose()
+
+
+if __name__ == "__main__":
+    main()
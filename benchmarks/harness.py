@@ -0,0 +1,149 @@
+"""Shared timing, statement counting and baseline comparison helpers."""
+from __future__ import annotations
+
+import json
+import time
+from collections.abc import Callable, Iterator
+from contextlib import contextmanager
+from pathlib import Path
+from typing import Any
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+from starlette.types import ASGIApp
+
+
+def percentile(sorted_samples: list[float], fraction: float) -> float:
+    """Nearest-rank percentile of an already sorted sample list."""
+    if not sorted_samples:
+        return 0.0
+    index = max(0, min(len(sorted_samples) - 1, round(fraction * len(sorted_samples)) - 1))
+    return sorted_samples[index]
+
+
+@contextmanager
+def count_statements(engine: Engine) -> Iterator[list[int]]:
+    """Count cursor executions on ``engine``; the count is in ``counter[0]``."""
+    counter = [0]
+
+    def record(*_: Any) -> None:
+        counter[0] += 1
+
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        yield counter
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+
+
+def measure(
+    fn: Callable[[int], Any],
+    iterations: int,
+    engine: Engine | None = None,
+    expected_status: int | None = None,
+) -> dict[str, float]:
+    """Call ``fn(i)`` ``iterations`` times and summarise latency and statement counts.
+
+    With ``expected_status``, ``fn`` returns a response and any other status
+    aborts the run, so throttled or failing requests are never timed as successes.
+    """
+    samples: list[float] = []
+    with count_statements(engine) if engine is not None else _no_counter() as counter:
+        started = time.perf_counter()
+        for index in range(iterations):
+            call_started = time.perf_counter()
+            result = fn(index)
+            samples.append((time.perf_counter() - call_started) * 1000)
+            if expected_status is not None and result.status_code != expected_status:
+                raise RuntimeError(f"call {index} returned {result.status_code}, expected {expected_status}")
+        elapsed = time.perf_counter() - started
+    samples.sort()
+    return {
+        "iterations": iterations,
+        "p50_ms": percentile(samples, 0.50),
+        "p95_ms": percentile(samples, 0.95),
+        "p99_ms": percentile(samples, 0.99),
+        "throughput_per_s": iterations / elapsed if elapsed else 0.0,
+        "statements_per_call": counter[0] / iterations if iterations else 0.0,
+    }
+
+
+@contextmanager
+def _no_counter() -> Iterator[list[int]]:
+    yield [0]
+
+
+def save_results(results: dict[str, dict[str, float]], path: Path) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_text(json.dumps(results, indent=2, sort_keys=True) + "\n")
+
+
+def find_regressions(
+    results: dict[str, dict[str, float]],
+    baseline: dict[str, dict[str, float]],
+    tolerance: float,
+    min_delta_ms: float = 1.0,
+) -> list[str]:
+    """Describe every scenario whose p95 grew beyond ``tolerance`` or that issues more statements.
+
+    Latency growth smaller than ``min_delta_ms`` is treated as noise.
+    """
+    regressions = []
+    for name, current in results.items():
+        previous = baseline.get(name)
+        if previous is None:
+            continue
+        grew_by = current["p95_ms"] - previous["p95_ms"]
+        if current["p95_ms"] > previous["p95_ms"] * (1 + tolerance) and grew_by >= min_delta_ms:
+            regressions.append(f"{name}: p95 {previous['p95_ms']:.2f}ms -> {current['p95_ms']:.2f}ms")
+        if current["statements_per_call"] > previous["statements_per_call"]:
+            regressions.append(
+                f"{name}: statements {previous['statements_per_call']:.1f} -> {current['statements_per_call']:.1f}"
+            )
+    return regressions
+
+
+def print_table(results: dict[str, dict[str, float]]) -> None:
+    print(f"{'scenario':<34}{'p50 ms':>9}{'p95 ms':>9}{'p99 ms':>9}{'ops/s':>10}{'stmts':>7}")
+    for name, row in results.items():
+        print(
+            f"{name:<34}{row['p50_ms']:>9.2f}{row['p95_ms']:>9.2f}{row['p99_ms']:>9.2f}"
+            f"{row['throughput_per_s']:>10.1f}{row['statements_per_call']:>7.1f}"
+        )
+
+
+async def asgi_get(application: ASGIApp, path: str) -> None:
+    """Drive one GET through the ASGI interface, failing on any status other than 200."""
+    scope = {
+        "type": "http",
+        "asgi": {"version": "3.0"},
+        "http_version": "1.1",
+        "method": "GET",
+        "scheme": "http",
+        "path": path,
+        "raw_path": path.encode(),
+        "root_path": "",
+        "query_string": b"",
+        "headers": [],
+        "client": ("127.0.0.1", 50000),
+        "server": ("testserver", 80),
+    }
+
+    async def receive() -> dict:
+        return {"type": "http.request", "body": b"", "more_body": False}
+
+    async def send(message: dict) -> None:
+        if message["type"] == "http.response.start" and message["status"] != 200:
+            raise RuntimeError(f"{path} returned {message['status']}")
+
+    await application(scope, receive, send)
+
+
+async def mean_asgi_latency_us(application: ASGIApp, path: str, iterations: int) -> float:
+    """Mean latency of ``GET path`` in microseconds, after a short warm-up."""
+    for _ in range(min(iterations, 500)):
+        await asgi_get(application, path)
+    started = time.perf_counter()
+    for _ in range(iterations):
+        await asgi_get(application, path)
+    return (time.perf_counter() - started) / iterations * 1_000_000
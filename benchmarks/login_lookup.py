@@ -0,0 +1,128 @@
+"""Compare the legacy OR login lookup with the projected single-index lookup.
+
+Usage::
+
+    python -m benchmarks.login_lookup --users 1000000 --database-url sqlite:///./bench.db
+
+Seeds ``--users`` rows (skipped when the table is already populated), prints
+the query plan of the legacy statement and of the one ``get_login_credentials``
+issues for an email, and reports per-lookup latency for registered
+identifiers (hits) and unregistered ones (misses) separately.
+"""
+from __future__ import annotations
+
+import argparse
+import random
+import statistics
+import time
+
+from sqlalchemy import create_engine, event, func, insert, or_, select, text
+from sqlalchemy.orm import Session
+
+from app.db.base import Base, User
+from app.repositories.user_repository import UserRepository
+
+_BATCH = 10_000
+
+
+def _seed(session: Session, users: int) -> None:
+    existing = session.scalar(select(func.count()).select_from(User))
+    for start in range(existing, users, _BATCH):
+        rows = [
+            {
+                "first_name": "Bench",
+                "last_name": "User",
+                "email": f"user{i}@example.com",
+                "phone": "+15555550123",
+                "contact": "email",
+                "short_description": "x" * 200,
+                "username": f"user{i}",
+                "hashed_password": "$2b$12$" + "x" * 53,
+            }
+            for i in range(start, min(start + _BATCH, users))
+        ]
+        session.execute(insert(User), rows)
+        session.commit()
+
+
+def _explain(session: Session, statement, dialect: str) -> list[str]:
+    compiled = statement.compile(dialect=session.bind.dialect, compile_kwargs={"literal_binds": True})
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    return [str(tuple(row)) for row in session.execute(text(prefix + str(compiled)))]
+
+
+def _explain_issued(session: Session, fn, identifier: str, dialect: str) -> list[str]:
+    """Run ``fn(identifier)`` and return the plan of the statement it sent."""
+    issued: list[tuple[str, object]] = []
+
+    def record(conn, cursor, statement, parameters, context, executemany) -> None:
+        issued.append((statement, parameters))
+
+    engine = session.get_bind()
+    event.listen(engine, "before_cursor_execute", record)
+    try:
+        fn(identifier)
+    finally:
+        event.remove(engine, "before_cursor_execute", record)
+    statement, parameters = issued[-1]
+    prefix = "EXPLAIN QUERY PLAN " if dialect == "sqlite" else "EXPLAIN "
+    return [str(tuple(row)) for row in session.connection().exec_driver_sql(prefix + statement, parameters)]
+
+
+def _time(fn, identifiers: list[str]) -> dict[str, float]:
+    samples = []
+    for identifier in identifiers:
+        started = time.perf_counter()
+        fn(identifier)
+        samples.append((time.perf_counter() - started) * 1_000_000)
+    samples.sort()
+    return {
+        "mean_us": statistics.fmean(samples),
+        "p50_us": samples[len(samples) // 2],
+        "p99_us": samples[int(len(samples) * 0.99) - 1],
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--users", type=int, default=1_000_000)
+    parser.add_argument("--lookups", type=int, default=5_000)
+    parser.add_argument("--database-url", default="sqlite:///./bench_login.db")
+    args = parser.parse_args()
+
+    engine = create_engine(args.database_url)
+    Base.metadata.create_all(bind=engine)
+    dialect = engine.dialect.name
+    with Session(engine) as session:
+        _seed(session, args.users)
+        repository = UserRepository(session)
+        picks = [random.randrange(args.users) for _ in range(args.lookups)]
+        hits = [f"user{i}@example.com" if i % 2 else f"user{i}" for i in picks]
+        misses = [f"ghost{i}@example.com" if i % 2 else f"ghost{i}" for i in picks]
+
+        sample = "user0@example.com"
+        legacy = select(User).where(or_(User.username == sample, User.email == sample))
+        print("legacy plan:   ", *_explain(session, legacy, dialect), sep="\n  ")
+        print(
+            "projected plan:",
+            *_explain_issued(session, repository.get_login_credentials, sample, dialect),
+            sep="\n  ",
+        )
+
+        def legacy_lookup(identifier: str) -> User | None:
+            return session.scalars(
+                select(User).where(or_(User.username == identifier, User.email == identifier))
+            ).first()
+
+        results = {
+            "legacy_or_lookup hit": _time(legacy_lookup, hits),
+            "legacy_or_lookup miss": _time(legacy_lookup, misses),
+            "get_login_credentials hit": _time(repository.get_login_credentials, hits),
+            "get_login_credentials miss": _time(repository.get_login_credentials, misses),
+        }
+    for name, stats in results.items():
+        print(f"{name:>27}: " + "  ".join(f"{key}={value:.1f}" for key, value in stats.items()))
+
+
+if __name__ == "__main__":
+    main()
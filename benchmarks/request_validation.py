@@ -0,0 +1,108 @@
+"""Microbenchmark of per-request schema validation cost.
+
+Usage::
+
+    python -m benchmarks.request_validation --iterations 20000
+
+Each request body is validated from raw JSON with ``model_validate_json``, as
+FastAPI does. ``legacy`` models are the same schemas with pydantic's plain
+``EmailStr``; the current ones use the memoized ``CachedEmailStr``.
+
+* ``register-unique``   - every body carries a new address (cache misses)
+* ``register-repeated`` - the same address again (retries, duplicate checks)
+* ``me``                - ``UserRead`` built from an ORM-like object
+* ``login`` / ``forgot-password`` - no email validation, for scale
+"""
+from __future__ import annotations
+
+import argparse
+import json
+import time
+from collections.abc import Callable
+from datetime import datetime, timezone
+from types import SimpleNamespace
+
+from pydantic import EmailStr
+
+from app.schemas.auth import ForgotPasswordRequest, LoginRequest, UserCreate, UserRead
+
+
+class LegacyUserCreate(UserCreate):
+    email: EmailStr
+
+
+class LegacyUserRead(UserRead):
+    email: EmailStr
+
+
+def _register_body(email: str) -> str:
+    return json.dumps(
+        {
+            "first_name": "Jane",
+            "last_name": "Doe",
+            "email": email,
+            "phone": "+15555550123",
+            "contact": "email",
+            "short_description": "Sample user",
+            "username": "janedoe",
+            "password": "supersecret",
+            "confirm_password": "supersecret",
+        }
+    )
+
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+STORED_USER = SimpleNamespace(**json.loads(_register_body("jane.doe@example.com")), id=1, created_at=_NOW, updated_at=_NOW)
+LOGIN_BODY = json.dumps({"identifier": "jane.doe@example.com", "password": "supersecret"})
+FORGOT_BODY = json.dumps({"identifier": "janedoe"})
+
+
+def _mean_us(fn: Callable[[int], object], iterations: int) -> float:
+    started = time.perf_counter()
+    for index in range(iterations):
+        fn(index)
+    return (time.perf_counter() - started) / iterations * 1_000_000
+
+
+def _scenarios(iterations: int) -> dict[str, tuple[Callable[[int], object], Callable[[int], object]]]:
+    # Separate address ranges so the current models never see a legacy run's addresses.
+    unique = [_register_body(f"user{index}@example.com") for index in range(iterations * 2)]
+    repeated = _register_body("jane.doe@example.com")
+    return {
+        "register-unique": (
+            lambda index: LegacyUserCreate.model_validate_json(unique[index]),
+            lambda index: UserCreate.model_validate_json(unique[iterations + index]),
+        ),
+        "register-repeated": (
+            lambda _: LegacyUserCreate.model_validate_json(repeated),
+            lambda _: UserCreate.model_validate_json(repeated),
+        ),
+        "me": (
+            lambda _: LegacyUserRead.model_validate(STORED_USER),
+            lambda _: UserRead.model_validate(STORED_USER),
+        ),
+        "login": (
+            lambda _: LoginRequest.model_validate_json(LOGIN_BODY),
+            lambda _: LoginRequest.model_validate_json(LOGIN_BODY).identifier_kind,
+        ),
+        "forgot-password": (
+            lambda _: ForgotPasswordRequest.model_validate_json(FORGOT_BODY),
+            lambda _: ForgotPasswordRequest.model_validate_json(FORGOT_BODY).identifier_kind,
+        ),
+    }
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    print(f"{'scenario':>18}  {'legacy us':>10}  {'current us':>10}")
+    for name, (legacy, current) in _scenarios(args.iterations).items():
+        legacy_us = _mean_us(legacy, args.iterations)
+        current_us = _mean_us(current, args.iterations)
+        print(f"{name:>18}  {legacy_us:>10.1f}  {current_us:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,88 @@
+"""Microbenchmark of auth response serialization paths.
+
+Usage::
+
+    python -m benchmarks.response_serialization --iterations 20000
+
+Each endpoint returns the same ``UserRead`` (or constant ``MessageResponse``)
+built once up front, driven directly through the ASGI interface:
+
+* ``user-model``        - returns the model and lets ``response_model``
+  validate, ``jsonable_encoder`` and ``json.dumps`` it (the previous routes)
+* ``user-model-orjson`` - the same with ``ORJSONResponse`` as default class
+* ``user-prevalidated`` - returns :class:`app.core.responses.ModelResponse`
+* ``message-model``     - constant message through ``response_model``
+* ``message-constant``  - constant message with its pre-encoded body
+"""
+from __future__ import annotations
+
+import argparse
+import asyncio
+from datetime import datetime, timezone
+
+from fastapi import FastAPI
+from fastapi.responses import ORJSONResponse
+
+from app.controllers.auth_controller import RESET_EMAIL_SENT
+from app.core.responses import ModelResponse
+from app.schemas.auth import MessageResponse, UserRead
+from benchmarks.harness import mean_asgi_latency_us
+
+_NOW = datetime(2024, 1, 1, tzinfo=timezone.utc)
+USER = UserRead(
+    id=1,
+    first_name="Jane",
+    last_name="Doe",
+    email="jane.doe@example.com",
+    phone="+15555550123",
+    contact="email",
+    short_description="Sample user",
+    username="janedoe",
+    created_at=_NOW,
+    updated_at=_NOW,
+)
+
+
+def build_app() -> FastAPI:
+    application = FastAPI()
+
+    @application.get("/user-model", response_model=UserRead)
+    def user_model() -> UserRead:
+        return USER
+
+    @application.get("/user-model-orjson", response_model=UserRead, response_class=ORJSONResponse)
+    def user_model_orjson() -> UserRead:
+        return USER
+
+    @application.get("/user-prevalidated", response_model=UserRead)
+    def user_prevalidated() -> ModelResponse:
+        return ModelResponse(USER)
+
+    @application.get("/message-model", response_model=MessageResponse)
+    def message_model() -> MessageResponse:
+        return RESET_EMAIL_SENT
+
+    @application.get("/message-constant", response_model=MessageResponse)
+    def message_constant() -> ModelResponse:
+        return ModelResponse(RESET_EMAIL_SENT)
+
+    return application
+
+
+async def _run(iterations: int) -> None:
+    application = build_app()
+    print(f"{'endpoint':>18}  {'mean us':>9}")
+    for name in ("user-model", "user-model-orjson", "user-prevalidated", "message-model", "message-constant"):
+        mean = await mean_asgi_latency_us(application, f"/{name}", iterations)
+        print(f"{name:>18}  {mean:>9.1f}")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+    asyncio.run(_run(args.iterations))
+
+
+if __name__ == "__main__":
+    main()
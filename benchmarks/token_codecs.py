@@ -0,0 +1,48 @@
+"""Microbenchmark of access-token encode/decode throughput per JWT backend.
+
+Usage::
+
+    python -m benchmarks.token_codecs --iterations 20000
+
+Backends whose optional dependency is missing (PyJWT) are skipped.
+"""
+from __future__ import annotations
+
+import argparse
+import time
+
+from app.core.config import get_settings
+from app.core.security import build_token_codec
+
+BACKENDS = ("jose", "pyjwt", "native")
+
+
+def _rate(fn, iterations: int) -> float:
+    started = time.perf_counter()
+    for _ in range(iterations):
+        fn()
+    return iterations / (time.perf_counter() - started)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=20_000)
+    args = parser.parse_args()
+
+    settings = get_settings()
+    claims = {"sub": "12345", "exp": int(time.time()) + 3600}
+    print(f"{'backend':>8}  {'encode/s':>10}  {'decode/s':>10}")
+    for backend in BACKENDS:
+        try:
+            codec = build_token_codec(settings.model_copy(update={"jwt_backend": backend}))
+        except ImportError:
+            print(f"{backend:>8}  (not installed)")
+            continue
+        token = codec.encode(claims)
+        encode_rate = _rate(lambda: codec.encode(claims), args.iterations)
+        decode_rate = _rate(lambda: codec.decode(token), args.iterations)
+        print(f"{backend:>8}  {encode_rate:>10,.0f}  {decode_rate:>10,.0f}")
+
+
+if __name__ == "__main__":
+    main()
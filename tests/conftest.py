@@ -1,21 +1,27 @@
 """Shared pytest fixtures."""
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, Generator
+from pathlib import Path
 
 import pytest
 from fastapi.testclient import TestClient
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
+from sqlalchemy.ext.asyncio import AsyncSession, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
-from sqlalchemy.pool import StaticPool
+from sqlalchemy.pool import NullPool, StaticPool
 
-from app.main import app
-from app.db.session import Base, get_db
+from app.core.config import Settings
+from app.core.rate_limit import get_login_rate_limiter
+from app.core.request_metrics import instrument_statement_timing, request_metrics
+from app.main import app, create_app
+from app.db.async_session import get_async_db, get_async_session_factory
+from app.db.session import Base, get_db, get_session_factory
 
 SQLALCHEMY_DATABASE_URL = "sqlite+pysqlite:///:memory:"
 
 engine = create_engine(
     SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}, poolclass=StaticPool
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
 
 
 @pytest.fixture(scope="function", autouse=True)
@@ -25,6 +31,26 @@ def setup_test_database() -> Generator[None, None, None]:
     Base.metadata.drop_all(bind=engine)
 
 
+@pytest.fixture(autouse=True)
+def reset_login_rate_limiter() -> Generator[None, None, None]:
+    get_login_rate_limiter.cache_clear()
+    yield
+    get_login_rate_limiter.cache_clear()
+
+
+@pytest.fixture()
+def sql_statements() -> Generator[list[str], None, None]:
+    """Capture every SQL statement sent to the test engine."""
+    statements: list[str] = []
+
+    def record(conn, cursor, statement, *_) -> None:
+        statements.append(statement)
+
+    event.listen(engine, "before_cursor_execute", record)
+    yield statements
+    event.remove(engine, "before_cursor_execute", record)
+
+
 @pytest.fixture()
 def client() -> Generator[TestClient, None, None]:
     def override_get_db():
@@ -35,6 +61,47 @@ def client() -> Generator[TestClient, None, None]:
             db.close()
 
     app.dependency_overrides[get_db] = override_get_db
+    app.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
     with TestClient(app) as test_client:
         yield test_client
     app.dependency_overrides.pop(get_db, None)
+    app.dependency_overrides.pop(get_session_factory, None)
+
+
+@pytest.fixture()
+def metrics_client() -> Generator[TestClient, None, None]:
+    def override_get_db():
+        db = TestingSessionLocal()
+        try:
+            yield db
+        finally:
+            db.close()
+
+    instrument_statement_timing(engine)
+    request_metrics.reset()
+    application = create_app(Settings(request_metrics_enabled=True))
+    application.dependency_overrides[get_db] = override_get_db
+    application.dependency_overrides[get_session_factory] = lambda: TestingSessionLocal
+    with TestClient(application) as test_client:
+        yield test_client
+
+
+@pytest.fixture()
+def async_client(tmp_path: Path) -> Generator[TestClient, None, None]:
+    database_file = tmp_path / "async.db"
+    sync_engine = create_engine(f"sqlite:///{database_file}")
+    Base.metadata.create_all(bind=sync_engine)
+    sync_engine.dispose()
+
+    async_engine = create_async_engine(f"sqlite+aiosqlite:///{database_file}", poolclass=NullPool)
+    AsyncTestingSessionLocal = async_sessionmaker(bind=async_engine, expire_on_commit=False)
+
+    async def override_get_async_db() -> AsyncGenerator[AsyncSession, None]:
+        async with AsyncTestingSessionLocal() as db:
+            yield db
+
+    async_app = create_app(Settings(use_async_db=True))
+    async_app.dependency_overrides[get_async_db] = override_get_async_db
+    async_app.dependency_overrides[get_async_session_factory] = lambda: AsyncTestingSessionLocal
+    with TestClient(async_app) as test_client:
+        yield test_client
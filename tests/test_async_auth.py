@@ -0,0 +1,35 @@
+"""Authentication route tests against the AsyncSession stack (aiosqlite)."""
+from fastapi.testclient import TestClient
+
+from tests.test_auth import _user_payload
+
+
+def test_async_register_and_login(async_client: TestClient) -> None:
+    response = async_client.post("/api/v1/auth/register", json=_user_payload())
+    assert response.status_code == 201
+    assert response.json()["username"] == "janedoe"
+
+    duplicate = async_client.post("/api/v1/auth/register", json=_user_payload() | {"email": "x@example.com"})
+    assert duplicate.status_code == 400
+    assert duplicate.json()["detail"] == "username is already taken"
+
+    login = async_client.post(
+        "/api/v1/auth/login", json={"identifier": "jane.doe@example.com", "password": "supersecret"}
+    )
+    assert login.status_code == 200
+    assert login.json()["access_token"]
+
+
+def test_async_reset_password_flow(async_client: TestClient, monkeypatch) -> None:
+    async_client.post("/api/v1/auth/register", json=_user_payload())
+    monkeypatch.setattr("app.services.auth_service.secrets.token_urlsafe", lambda _: "static-token")
+
+    response = async_client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+    assert response.status_code == 202
+
+    reset_payload = {"token": "static-token", "new_password": "brandnewpass", "confirm_password": "brandnewpass"}
+    assert async_client.post("/api/v1/auth/reset-password", json=reset_payload).status_code == 200
+    assert async_client.post("/api/v1/auth/reset-password", json=reset_payload).status_code == 400
+
+    login = async_client.post("/api/v1/auth/login", json={"identifier": "janedoe", "password": "brandnewpass"})
+    assert login.status_code == 200
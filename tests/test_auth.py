@@ -31,6 +31,21 @@ def test_register_user_duplicate_email_fails(client: TestClient) -> None:
     assert response.status_code == 400
 
 
+def test_register_user_duplicate_username_fails(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    duplicate_payload = _user_payload() | {"email": "other@example.com"}
+    response = client.post("/api/v1/auth/register", json=duplicate_payload)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "username is already taken"
+
+
+def test_register_user_issues_a_single_insert(client: TestClient, sql_statements: list[str]) -> None:
+    response = client.post("/api/v1/auth/register", json=_user_payload())
+    assert response.status_code == 201
+    assert response.json()["created_at"]
+    assert [statement.split()[0] for statement in sql_statements] == ["INSERT"]
+
+
 def test_login_with_username_returns_token(client: TestClient) -> None:
     client.post("/api/v1/auth/register", json=_user_payload())
     login_payload = {"identifier": "janedoe", "password": "supersecret"}
@@ -94,3 +109,31 @@ def test_reset_password_with_invalid_token_fails(client: TestClient) -> None:
     response = client.post("/api/v1/auth/reset-password", json=reset_payload)
     assert response.status_code == 400
     assert response.json()["detail"] == "invalid or expired reset token"
+
+
+def test_login_with_email_returns_token(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    login_payload = {"identifier": "jane.doe@example.com", "password": "supersecret"}
+    response = client.post("/api/v1/auth/login", json=login_payload)
+    assert response.status_code == 200
+
+
+def test_login_with_username_containing_at_sign(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload() | {"username": "jane@home"})
+    login_payload = {"identifier": "jane@home", "password": "supersecret"}
+    response = client.post("/api/v1/auth/login", json=login_payload)
+    assert response.status_code == 200
+
+
+def test_reset_flow_statement_counts(client: TestClient, sql_statements: list[str], monkeypatch) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    monkeypatch.setattr("app.services.auth_service.secrets.token_urlsafe", lambda _: "static-token")
+
+    sql_statements.clear()
+    client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+    assert [statement.split()[0] for statement in sql_statements] == ["SELECT", "DELETE", "INSERT"]
+
+    sql_statements.clear()
+    reset_payload = {"token": "static-token", "new_password": "brandnewpass", "confirm_password": "brandnewpass"}
+    assert client.post("/api/v1/auth/reset-password", json=reset_payload).status_code == 200
+    assert [statement.split()[0] for statement in sql_statements] == ["SELECT", "UPDATE", "UPDATE"]
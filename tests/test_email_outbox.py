@@ -0,0 +1,127 @@
+"""Email outbox delivery tests against a local aiosmtpd server."""
+import socket
+from collections.abc import Generator
+
+import pytest
+
+from app.core.config import Settings
+from app.services.email_outbox import EmailOutbox
+from app.services.email_service import EmailService, SmtpTransport
+
+controller_module = pytest.importorskip("aiosmtpd.controller")
+
+
+class _RecordingHandler:
+    def __init__(self) -> None:
+        self.messages: list[bytes] = []
+        self.sessions: set[int] = set()
+
+    async def handle_RCPT(self, server, session, envelope, address, rcpt_options) -> str:  # noqa: N802
+        if address.startswith("refused"):
+            return "550 mailbox unavailable"
+        envelope.rcpt_tos.append(address)
+        return "250 OK"
+
+    async def handle_DATA(self, server, session, envelope) -> str:  # noqa: N802 -- aiosmtpd hook name
+        self.messages.append(envelope.content)
+        self.sessions.add(id(session))
+        return "250 OK"
+
+
+@pytest.fixture()
+def smtp_server() -> Generator[tuple[_RecordingHandler, int], None, None]:
+    with socket.socket() as probe:
+        probe.bind(("127.0.0.1", 0))
+        port = probe.getsockname()[1]
+    handler = _RecordingHandler()
+    controller = controller_module.Controller(handler, hostname="127.0.0.1", port=port)
+    controller.start()
+    try:
+        yield handler, port
+    finally:
+        controller.stop()
+
+
+def _settings(port: int) -> Settings:
+    return Settings(
+        smtp_host="127.0.0.1",
+        smtp_port=port,
+        smtp_use_tls=False,
+        smtp_suppress_send=False,
+        email_outbox_batch_size=10,
+    )
+
+
+def test_outbox_delivers_queued_messages_over_one_connection(smtp_server) -> None:
+    handler, port = smtp_server
+    settings = _settings(port)
+    outbox = EmailOutbox(settings)
+    service = EmailService(settings, outbox)
+
+    for index in range(5):
+        service.send_password_reset(f"user{index}@example.com", f"token-{index}", "Jane")
+    outbox.stop()
+
+    assert outbox.sent == 5
+    assert len(handler.messages) == 5
+    assert len(handler.sessions) == 1
+    assert b"token-3" in b"".join(handler.messages)
+
+
+def test_transport_reconnects_after_server_disconnect(smtp_server) -> None:
+    handler, port = smtp_server
+    settings = _settings(port)
+    transport = SmtpTransport(settings)
+    service = EmailService(settings)
+    message = service.compose_password_reset("jane@example.com", "token-a")
+
+    transport.send_batch([message])
+    transport._smtp.sock.close()
+    transport.send_batch([service.compose_password_reset("jane@example.com", "token-b")])
+    transport.close()
+
+    assert len(handler.messages) == 2
+
+
+def test_full_outbox_falls_back_to_inline_delivery(smtp_server) -> None:
+    handler, port = smtp_server
+    settings = _settings(port).model_copy(update={"email_outbox_max_size": 1})
+    outbox = EmailOutbox(settings)
+    outbox._thread = object()  # pretend the sender is busy so nothing drains
+    service = EmailService(settings, outbox)
+
+    service.send_password_reset("first@example.com", "queued")
+    service.send_password_reset("second@example.com", "inline")
+
+    assert len(handler.messages) == 1
+    assert b"inline" in handler.messages[0]
+
+
+def test_outbox_delivers_messages_queued_after_a_restart(smtp_server) -> None:
+    handler, port = smtp_server
+    settings = _settings(port)
+    outbox = EmailOutbox(settings)
+    service = EmailService(settings, outbox)
+
+    service.send_password_reset("before@example.com", "token-before", "Jane")
+    outbox.stop()
+    service.send_password_reset("after@example.com", "token-after", "Jane")
+    outbox.stop()
+
+    assert outbox.sent == 2
+    assert b"token-after" in b"".join(handler.messages)
+
+
+def test_refused_recipient_fails_only_its_own_message(smtp_server) -> None:
+    handler, port = smtp_server
+    settings = _settings(port)
+    outbox = EmailOutbox(settings)
+    service = EmailService(settings, outbox)
+
+    for recipient in ("first@example.com", "refused@example.com", "third@example.com", "fourth@example.com"):
+        service.send_password_reset(recipient, "token", "Jane")
+    outbox.stop()
+
+    assert (outbox.sent, outbox.failed) == (3, 1)
+    assert len(handler.messages) == 3
+    assert len(handler.sessions) == 1
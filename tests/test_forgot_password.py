@@ -0,0 +1,64 @@
+"""Forgot-password background scheduling tests."""
+import asyncio
+import logging
+from dataclasses import replace
+
+from fastapi import BackgroundTasks
+from fastapi.testclient import TestClient
+from sqlalchemy import func, select
+
+from app.db.unit_of_work import UnitOfWork
+from app.models.password_reset_token import PasswordResetToken
+from app.repositories.password_reset_repository import PasswordResetRepository
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import ForgotPasswordRequest
+from app.services.auth_service import AuthService, build_auth_collaborators
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+
+class RecordingEmailService:
+    def __init__(self, fail: bool = False) -> None:
+        self.sent: list[str] = []
+        self._fail = fail
+
+    def send_password_reset(self, email: str, token: str, first_name: str) -> None:
+        if self._fail:
+            raise OSError("smtp unavailable")
+        self.sent.append(email)
+
+
+def _token_count() -> int:
+    with TestingSessionLocal() as db:
+        return db.scalar(select(func.count()).select_from(PasswordResetToken))
+
+
+def test_token_and_email_are_deferred_until_background_tasks_run(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    email_service = RecordingEmailService()
+    collaborators = replace(build_auth_collaborators(), email_service=email_service)
+    background_tasks = BackgroundTasks()
+
+    with TestingSessionLocal() as db:
+        service = AuthService(
+            UserRepository(db), PasswordResetRepository(db), UnitOfWork(db), collaborators, TestingSessionLocal
+        )
+        service.request_password_reset(ForgotPasswordRequest(identifier="janedoe"), background_tasks)
+    assert _token_count() == 0
+    assert email_service.sent == []
+
+    asyncio.run(background_tasks())
+    assert _token_count() == 1
+    assert email_service.sent == ["jane.doe@example.com"]
+
+
+def test_background_failure_is_logged_after_accepted_response(client: TestClient, monkeypatch, caplog) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    collaborators = replace(build_auth_collaborators(), email_service=RecordingEmailService(fail=True))
+    monkeypatch.setattr("app.routers.auth_router.get_auth_collaborators", lambda: collaborators)
+
+    with caplog.at_level(logging.ERROR, logger="app.services.auth_service"):
+        response = client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+
+    assert response.status_code == 202
+    assert "Password reset could not be issued" in caplog.text
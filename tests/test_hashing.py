@@ -0,0 +1,73 @@
+"""Hashing executor admission control tests."""
+import threading
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.hashing import HashingExecutor, HashingPoolSaturatedError, admission_capacity
+from tests.test_auth import _user_payload
+
+
+def _executor(**overrides) -> HashingExecutor:
+    options = {"password_hash_workers": 1, "password_hash_queue_size": 0} | overrides
+    return HashingExecutor(Settings(**options))
+
+
+def test_executor_rejects_jobs_beyond_capacity() -> None:
+    executor = _executor()
+    started, release = threading.Event(), threading.Event()
+
+    def blocking_job() -> None:
+        started.set()
+        release.wait()
+
+    blocker = threading.Thread(target=executor.run, args=(blocking_job,))
+    blocker.start()
+    started.wait()
+    try:
+        with pytest.raises(HashingPoolSaturatedError):
+            executor.run(lambda: None)
+    finally:
+        release.set()
+        blocker.join()
+        executor.shutdown()
+    assert executor.metrics.snapshot()["rejected"] == 1
+
+
+def test_admission_leaves_threadpool_tokens_for_other_routes() -> None:
+    assert admission_capacity(workers=8, queue_size=32, threadpool_tokens=40) == 30
+    assert admission_capacity(workers=2, queue_size=4, threadpool_tokens=40) == 6
+    assert admission_capacity(workers=1, queue_size=0, threadpool_tokens=1) == 1
+    assert _executor(password_hash_workers=4, password_hash_queue_size=32, threadpool_tokens=8).capacity == 6
+
+
+def test_executor_records_queue_wait_and_hash_time() -> None:
+    executor = _executor(password_hash_queue_size=4)
+    hashed = executor.hash_password("supersecret")
+    assert executor.verify_password("supersecret", hashed)
+    snapshot = executor.metrics.snapshot()
+    executor.shutdown()
+    assert snapshot["hash_time"]["count"] == 2
+    assert snapshot["hash_time"]["total_seconds"] > 0
+
+
+def test_process_pool_spawns_its_workers() -> None:
+    executor = _executor(password_hash_executor="process")
+    try:
+        assert executor.verify_password("supersecret", executor.hash_password("supersecret"))
+        assert executor._pool._mp_context.get_start_method() == "spawn"
+    finally:
+        executor.shutdown()
+
+
+def test_saturated_pool_returns_service_unavailable(client: TestClient, monkeypatch) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+
+    def saturated(*_: object) -> None:
+        raise HashingPoolSaturatedError(retry_after=3)
+
+    monkeypatch.setattr("app.core.hashing.HashingExecutor.run", saturated)
+    response = client.post("/api/v1/auth/login", json={"identifier": "janedoe", "password": "supersecret"})
+    assert response.status_code == 503
+    assert response.headers["Retry-After"] == "3"
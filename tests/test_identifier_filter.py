@@ -0,0 +1,110 @@
+"""Bloom filter short-circuit tests for unknown login identifiers."""
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.models.user import User
+from app.services.auth_service import build_auth_collaborators
+from app.services.identifier_filter import BloomFilter, KnownIdentifierFilter
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+
+def _insert(user_id: int, username: str) -> None:
+    with TestingSessionLocal() as db:
+        db.add(
+            User(
+                id=user_id,
+                first_name="Jane",
+                last_name="Doe",
+                email=f"{username}@example.com",
+                phone="+15555550123",
+                contact="email",
+                username=username,
+                hashed_password="x",
+            )
+        )
+        db.commit()
+
+
+def _filter() -> KnownIdentifierFilter:
+    settings = Settings(identifier_filter_enabled=True, identifier_filter_capacity=1_000)
+    return KnownIdentifierFilter(settings, session_factory=TestingSessionLocal)
+
+
+@pytest.fixture()
+def identifier_filter(monkeypatch) -> KnownIdentifierFilter:
+    known = _filter()
+    known.sync()
+    collaborators = replace(build_auth_collaborators(), identifier_filter=known)
+    monkeypatch.setattr("app.routers.auth_router.get_auth_collaborators", lambda: collaborators)
+    return known
+
+
+def test_bloom_filter_has_no_false_negatives_and_bounded_false_positives() -> None:
+    bloom = BloomFilter(capacity=10_000, error_rate=0.01)
+    for index in range(10_000):
+        bloom.add(f"user-{index}")
+
+    assert all(f"user-{index}" in bloom for index in range(10_000))
+    false_positives = sum(f"other-{index}" in bloom for index in range(10_000))
+    assert false_positives / 10_000 < 0.02
+    assert 9_000 < bloom.estimated_keys() < 11_000
+
+
+def test_identifiers_are_matched_case_insensitively_and_non_ascii_always_passes() -> None:
+    known = _filter()
+    known.sync()
+    known.add("Jane@Example.com", "JaneDoe")
+
+    assert known.might_exist("jane@example.com")
+    assert known.might_exist("janedoe")
+    assert known.might_exist("jöhn")
+    assert not known.might_exist("nobody")
+
+
+def test_sync_picks_up_rows_committed_out_of_id_order() -> None:
+    known = _filter()
+    _insert(1, "first")
+    known.sync()
+    _insert(3, "third")
+    known.sync()
+    assert known.snapshot()["tracked_id_gaps"] == 1
+
+    _insert(2, "second")
+    known.sync()
+    assert known.might_exist("second")
+    assert known.snapshot()["tracked_id_gaps"] == 0
+
+
+def test_unknown_identifier_login_skips_database(
+    client: TestClient, identifier_filter: KnownIdentifierFilter, sql_statements: list[str]
+) -> None:
+    response = client.post("/api/v1/auth/login", json={"identifier": "ghost", "password": "supersecret"})
+
+    assert response.status_code == 401
+    assert sql_statements == []
+    assert identifier_filter.snapshot()["definitely_absent"] == 1
+
+
+def test_user_registered_through_process_can_log_in(
+    client: TestClient, identifier_filter: KnownIdentifierFilter
+) -> None:
+    assert client.post("/api/v1/auth/register", json=_user_payload()).status_code == 201
+
+    response = client.post("/api/v1/auth/login", json={"identifier": "JaneDoe", "password": "supersecret"})
+    assert response.status_code == 401
+    response = client.post("/api/v1/auth/login", json={"identifier": "janedoe", "password": "supersecret"})
+    assert response.status_code == 200
+    assert identifier_filter.snapshot()["false_positives"] == 1
+
+
+def test_forgot_password_for_unknown_identifier_skips_the_query(
+    client: TestClient, identifier_filter: KnownIdentifierFilter, sql_statements: list[str]
+) -> None:
+    response = client.post("/api/v1/auth/forgot-password", json={"identifier": "ghost"})
+
+    assert response.status_code == 202
+    assert sql_statements == []
@@ -0,0 +1,57 @@
+"""Rehash-on-login tests."""
+from fastapi.testclient import TestClient
+from sqlalchemy import select, update
+
+from app.core.security import build_password_context, password_needs_rehash, verify_password
+from app.models.user import User
+from app.services.auth_service import get_auth_collaborators
+from app.services.password_rehash import PasswordRehasher, RehashJob
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+LOW_COST_HASH = build_password_context(4).hash("supersecret")
+
+
+def _store_hash(hashed_password: str) -> int:
+    with TestingSessionLocal() as db:
+        db.execute(update(User).values(hashed_password=hashed_password))
+        db.commit()
+        return db.scalar(select(User.id))
+
+
+def _stored_hash() -> str:
+    with TestingSessionLocal() as db:
+        return db.scalar(select(User.hashed_password))
+
+
+def test_outdated_cost_needs_rehash() -> None:
+    assert password_needs_rehash(LOW_COST_HASH)
+    assert not password_needs_rehash(build_password_context(12).hash("supersecret"))
+
+
+def test_rehash_skips_password_changed_meanwhile(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    user_id = _store_hash(LOW_COST_HASH)
+    rehasher = PasswordRehasher(session_factory=TestingSessionLocal)
+
+    assert not rehasher.rehash(RehashJob(user_id, "supersecret", "stale-hash"))
+    assert _stored_hash() == LOW_COST_HASH
+    assert rehasher.snapshot()["stale"] == 1
+
+
+def test_login_rehashes_outdated_hash_in_background(client: TestClient, monkeypatch) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    _store_hash(LOW_COST_HASH)
+    rehasher = PasswordRehasher(session_factory=TestingSessionLocal)
+    monkeypatch.setattr("app.services.auth_service.get_password_rehasher", lambda: rehasher)
+    get_auth_collaborators.cache_clear()
+
+    response = client.post("/api/v1/auth/login", json={"identifier": "janedoe", "password": "supersecret"})
+    assert response.status_code == 200
+    rehasher.stop()
+
+    upgraded = _stored_hash()
+    assert upgraded != LOW_COST_HASH
+    assert not password_needs_rehash(upgraded)
+    assert verify_password("supersecret", upgraded)
+    assert rehasher.snapshot()["rehashed"] == 1
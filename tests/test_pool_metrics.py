@@ -0,0 +1,94 @@
+"""Connection pool tuning and instrumentation tests."""
+import asyncio
+from pathlib import Path
+
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, text
+
+from app.core.config import Settings
+from app.db.async_session import get_async_engine
+from app.db.pool_metrics import TimedAsyncAdaptedQueuePool, TimedQueuePool, instrument_pool, pool_status
+from app.db.session import pool_options
+
+
+def test_pool_options_apply_settings_for_server_databases() -> None:
+    options = pool_options(
+        Settings(db_pool_size=20, db_max_overflow=0, db_pool_recycle=300, db_pool_pre_ping=False),
+        "mysql+pymysql://user:pw@db/app",
+    )
+    assert options == {
+        "pool_pre_ping": False,
+        "pool_size": 20,
+        "max_overflow": 0,
+        "pool_timeout": 30.0,
+        "pool_recycle": 300,
+    }
+    assert pool_options(Settings(), "sqlite:///./app.db") == {"pool_pre_ping": True}
+
+
+def test_pool_events_feed_metrics(tmp_path: Path) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'pool.db'}", poolclass=TimedQueuePool, pool_size=2)
+    instrument_pool(engine)
+
+    with engine.connect() as connection:
+        connection.execute(text("SELECT 1"))
+        assert pool_status(engine)["checked_out"] == 1
+        connection.invalidate()
+
+    status = pool_status(engine)
+    engine.dispose()
+    assert status["checkouts"] == 1
+    assert status["checkins"] == 1
+    assert status["invalidations"] == 1
+    assert status["checked_out"] == 0
+
+
+def test_each_engine_keeps_its_own_counters(tmp_path: Path) -> None:
+    busy = create_engine(f"sqlite:///{tmp_path / 'busy.db'}", poolclass=TimedQueuePool)
+    idle = create_engine(f"sqlite:///{tmp_path / 'idle.db'}", poolclass=TimedQueuePool)
+    busy_metrics = instrument_pool(busy)
+    instrument_pool(idle)
+
+    for _ in range(3):
+        with busy.connect() as connection:
+            connection.execute(text("SELECT 1"))
+    busy.dispose()
+    assert busy.pool.metrics is busy_metrics
+    with busy.connect() as connection:
+        connection.execute(text("SELECT 1"))
+
+    busy_status, idle_status = pool_status(busy), pool_status(idle)
+    busy.dispose()
+    idle.dispose()
+    assert busy_status["checkouts"] == 4
+    assert busy_status["checkout_wait_max_seconds"] > 0
+    assert idle_status["checkouts"] == 0
+
+
+def test_db_pool_endpoint_reports_counters(metrics_client: TestClient) -> None:
+    response = metrics_client.get("/metrics/db-pool")
+    assert response.status_code == 200
+    assert {"pool_class", "checkouts", "invalidations", "checkout_wait_avg_seconds"} <= response.json()["sync"].keys()
+
+
+def test_async_engine_pool_feeds_metrics(tmp_path: Path, monkeypatch) -> None:
+    settings = Settings(async_database_url=f"sqlite+aiosqlite:///{tmp_path / 'async-pool.db'}")
+    monkeypatch.setattr("app.db.async_session.get_settings", lambda: settings)
+    monkeypatch.setattr("app.db.async_session.pool_options", lambda *_: {"poolclass": TimedAsyncAdaptedQueuePool})
+    get_async_engine.cache_clear()
+
+    async def query() -> dict:
+        engine = get_async_engine()
+        async with engine.connect() as connection:
+            await connection.execute(text("SELECT 1"))
+        status = pool_status(engine.sync_engine)
+        await engine.dispose()
+        return status
+
+    try:
+        status = asyncio.run(query())
+    finally:
+        get_async_engine.cache_clear()
+    assert status["pool_class"] == "TimedAsyncAdaptedQueuePool"
+    assert status["checkouts"] == 1
+    assert status["checkins"] == 1
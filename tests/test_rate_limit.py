@@ -0,0 +1,79 @@
+"""Login rate limiting tests."""
+import time
+
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.config import Settings
+from app.core.rate_limit import (
+    InMemoryCounterStore,
+    LoginRateLimiter,
+    RateLimitExceededError,
+    get_login_rate_limiter,
+)
+from tests.test_auth import _user_payload
+
+
+class SharedStoreStandIn:
+    """Dict-backed stand-in for a shared counter store such as Redis."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, int] = {}
+
+    def incr(self, key: str, ttl_seconds: int) -> int:
+        self.values[key] = self.values.get(key, 0) + 1
+        return self.values[key]
+
+    def get(self, key: str) -> int:
+        return self.values.get(key, 0)
+
+
+def test_memory_store_stays_within_max_keys_under_unique_key_bursts() -> None:
+    store = InMemoryCounterStore(max_keys=1000)
+    started = time.perf_counter()
+    for index in range(20_000):
+        store.incr(f"login:id:user{index}", 120)
+
+    assert time.perf_counter() - started < 1
+    assert len(store) == 1000
+    assert store.evictions == 19_000
+    assert store.get("login:id:user19999") == 1
+    assert store.get("login:id:user0") == 0
+
+
+def test_limiters_sharing_a_store_enforce_a_combined_budget() -> None:
+    settings = Settings(login_rate_limit_per_identifier=3, login_rate_limit_per_ip=100)
+    store = SharedStoreStandIn()
+    workers = [LoginRateLimiter(settings, store), LoginRateLimiter(settings, store)]
+
+    for attempt in range(3):
+        workers[attempt % 2].check("JaneDoe", "10.0.0.1")
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        workers[1].check("janedoe ", "10.0.0.2")
+    assert excinfo.value.scope == "identifier"
+    assert excinfo.value.retry_after >= 1
+    assert workers[1].snapshot()["shed_identifier"] == 1
+
+
+def test_client_ip_limit_applies_across_identifiers() -> None:
+    limiter = LoginRateLimiter(Settings(login_rate_limit_per_ip=2), SharedStoreStandIn())
+    limiter.check("alice", "10.0.0.1")
+    limiter.check("bob", "10.0.0.1")
+    with pytest.raises(RateLimitExceededError) as excinfo:
+        limiter.check("carol", "10.0.0.1")
+    assert excinfo.value.scope == "client"
+    limiter.check("carol", "10.0.0.2")
+
+
+def test_throttled_login_skips_lookup_and_hashing(client: TestClient, sql_statements: list[str]) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    attempt = {"identifier": "janedoe", "password": "wrongpass"}
+    for _ in range(10):
+        assert client.post("/api/v1/auth/login", json=attempt).status_code == 401
+
+    sql_statements.clear()
+    response = client.post("/api/v1/auth/login", json=attempt)
+    assert response.status_code == 429
+    assert int(response.headers["Retry-After"]) >= 1
+    assert sql_statements == []
+    assert get_login_rate_limiter().snapshot()["shed_identifier"] == 1
@@ -0,0 +1,121 @@
+"""Read-replica routing tests, with SQLite files standing in for primary and replicas."""
+from collections.abc import Generator
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.engine import Engine
+from sqlalchemy.orm import Session
+
+from app.db.replicas import ReplicaSet, RoutingSession
+from app.db.session import Base
+from app.db.unit_of_work import UnitOfWork
+from app.models.user import User
+from app.repositories.password_reset_repository import PasswordResetRepository
+from app.repositories.user_repository import UserRepository
+from tests.conftest import TestingSessionLocal
+
+
+def _user(username: str) -> User:
+    return User(
+        first_name="Jane",
+        last_name="Doe",
+        email=f"{username}@example.com",
+        phone="+15555550123",
+        contact="email",
+        username=username,
+        hashed_password="x",
+    )
+
+
+def _database(path: Path, *usernames: str) -> Engine:
+    engine = create_engine(f"sqlite:///{path}")
+    Base.metadata.create_all(bind=engine)
+    with Session(engine) as db:
+        db.add_all(_user(username) for username in usernames)
+        db.commit()
+    return engine
+
+
+@pytest.fixture()
+def primary(tmp_path: Path) -> Generator[Engine, None, None]:
+    engine = _database(tmp_path / "primary.db", "on-primary")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture()
+def replica(tmp_path: Path) -> Generator[Engine, None, None]:
+    engine = _database(tmp_path / "replica.db", "on-replica")
+    yield engine
+    engine.dispose()
+
+
+def test_lookups_are_served_by_replica(primary: Engine, replica: Engine) -> None:
+    replicas = ReplicaSet([replica])
+    with RoutingSession(bind=primary, replicas=replicas, fallback_on_miss=False) as db:
+        repository = UserRepository(db)
+        assert repository.get_by_username("on-replica") is not None
+        assert repository.get_login_credentials("on-replica@example.com") is not None
+        assert repository.get_by_username("on-primary") is None
+        assert repository.get_by_id(1).username == "on-primary"
+    assert replicas.snapshot()["replica_reads"] == 3
+
+
+def test_replica_miss_is_retried_on_primary(primary: Engine, replica: Engine) -> None:
+    replicas = ReplicaSet([replica])
+    with RoutingSession(bind=primary, replicas=replicas) as db:
+        assert UserRepository(db).get_login_credentials("on-primary") is not None
+    assert replicas.snapshot()["miss_fallbacks"] == 1
+
+
+def test_reads_inside_write_transaction_stay_on_primary(primary: Engine, replica: Engine) -> None:
+    replicas = ReplicaSet([replica])
+    with RoutingSession(bind=primary, replicas=replicas, fallback_on_miss=False) as db:
+        repository = UserRepository(db)
+        with UnitOfWork(db).begin():
+            assert repository.get_by_username("on-primary") is not None
+
+        db.add(_user("fresh"))
+        db.flush()
+        assert repository.get_by_username("fresh") is not None
+        db.commit()
+
+        assert repository.get_by_username("on-replica") is not None
+    assert replicas.snapshot()["replica_reads"] == 1
+
+
+def test_replicas_round_robin(tmp_path: Path) -> None:
+    first, second = create_engine(f"sqlite:///{tmp_path / 'a.db'}"), create_engine(f"sqlite:///{tmp_path / 'b.db'}")
+    replicas = ReplicaSet([first, second])
+    assert [replicas.choose() for _ in range(4)] == [first, second, first, second]
+
+
+def test_failed_replica_fails_over_to_primary_and_cools_down(primary: Engine, tmp_path: Path) -> None:
+    unreachable = create_engine(f"sqlite:///{tmp_path / 'missing-dir' / 'replica.db'}")
+    replicas = ReplicaSet([unreachable], retry_after_seconds=60)
+    with RoutingSession(bind=primary, replicas=replicas) as db:
+        assert UserRepository(db).get_by_username("on-primary") is not None
+        assert UserRepository(db).get_by_username("on-primary") is not None
+
+    snapshot = replicas.snapshot()
+    assert snapshot["failovers"] == 1
+    assert snapshot["healthy_replicas"] == 0
+    assert snapshot["replica_reads"] == 1
+
+
+def test_reset_token_cannot_be_claimed_twice() -> None:
+    with TestingSessionLocal() as db:
+        user = _user("janedoe")
+        db.add(user)
+        db.flush()
+        PasswordResetRepository(db).create(user.id, "digest", datetime.now(timezone.utc) + timedelta(minutes=5))
+        db.commit()
+
+    with TestingSessionLocal() as first, TestingSessionLocal() as second:
+        stale_token = PasswordResetRepository(second).get_by_hash("digest")
+        with UnitOfWork(first).begin():
+            assert PasswordResetRepository(first).mark_used(PasswordResetRepository(first).get_by_hash("digest"))
+        with UnitOfWork(second).begin():
+            assert not PasswordResetRepository(second).mark_used(stale_token)
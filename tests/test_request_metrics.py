@@ -0,0 +1,58 @@
+"""Request timing middleware and Prometheus exposition tests."""
+from fastapi.testclient import TestClient
+
+from app.repositories.user_cache import get_user_cache
+from app.services.identifier_filter import get_identifier_filter
+from tests.test_auth import _user_payload
+
+
+def test_server_timing_header_breaks_down_request(metrics_client: TestClient) -> None:
+    response = metrics_client.post("/api/v1/auth/register", json=_user_payload())
+    assert response.status_code == 201
+    server_timing = response.headers["server-timing"]
+    assert 'db;dur=' in server_timing
+    assert '"1 stmts"' in server_timing
+    hash_ms = float(server_timing.split("hash;dur=")[1].split(",")[0])
+    assert hash_ms > 0
+
+
+def test_failed_statement_is_charged_to_its_own_request(metrics_client: TestClient) -> None:
+    metrics_client.post("/api/v1/auth/register", json=_user_payload())
+    duplicate = metrics_client.post("/api/v1/auth/register", json=_user_payload())
+    assert duplicate.status_code == 400
+    # The rejected INSERT and the lookup of the conflicting column.
+    assert '"2 stmts"' in duplicate.headers["server-timing"]
+
+    other = _user_payload() | {"email": "john.doe@example.com", "username": "johndoe"}
+    response = metrics_client.post("/api/v1/auth/register", json=other)
+    assert response.status_code == 201
+    assert '"1 stmts"' in response.headers["server-timing"]
+
+
+def test_prometheus_endpoint_reports_per_route_series(metrics_client: TestClient) -> None:
+    metrics_client.post("/api/v1/auth/register", json=_user_payload())
+    metrics_client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+
+    body = metrics_client.get("/metrics").text
+    register_labels = 'method="POST",route="/api/v1/auth/register",status="201"'
+    assert f"http_request_duration_seconds_count{{{register_labels}}} 1" in body
+    assert f"http_request_db_statements_total{{{register_labels}}} 1" in body
+    forgot_labels = 'method="POST",route="/api/v1/auth/forgot-password",status="202"'
+    assert f"http_request_email_seconds_total{{{forgot_labels}}}" in body
+    assert "hashing_pool_rejected" in body
+
+
+def test_metrics_are_not_mounted_by_default(client: TestClient) -> None:
+    assert client.get("/metrics").status_code == 404
+    assert client.get("/metrics/db-pool").status_code == 404
+
+
+def test_scrape_does_not_build_disabled_components(metrics_client: TestClient) -> None:
+    get_identifier_filter.cache_clear()
+    get_user_cache.cache_clear()
+
+    assert metrics_client.get("/metrics").status_code == 200
+    assert metrics_client.get("/metrics/identifier-filter").json() == {}
+
+    assert get_identifier_filter.cache_info().currsize == 0
+    assert get_user_cache.cache_info().currsize == 0
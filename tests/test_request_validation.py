@@ -0,0 +1,80 @@
+"""Request validation fast-path tests."""
+import pytest
+from fastapi.testclient import TestClient
+from pydantic import BaseModel, EmailStr, TypeAdapter, ValidationError
+
+from app.repositories.user_repository import UserRepository
+from app.schemas.auth import ForgotPasswordRequest, LoginRequest, UserCreate, normalize_email
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+EMAIL_STR = TypeAdapter(EmailStr)
+
+
+@pytest.mark.parametrize("value", ["jane.doe@example.com", "Jane.Doe@EXAMPLE.com", "Jane Doe <jane@exämple.com>"])
+def test_cached_email_matches_email_str(value: str) -> None:
+    assert UserCreate.model_validate(_user_payload() | {"email": value}).email == EMAIL_STR.validate_python(value)
+
+
+@pytest.mark.parametrize("value", ["not-an-email", "jane@", "a" * 65 + "@example.com"])
+def test_invalid_email_is_rejected_and_not_cached(value: str) -> None:
+    with pytest.raises(ValidationError):
+        EMAIL_STR.validate_python(value)
+    before = normalize_email.cache_info().currsize
+    with pytest.raises(ValidationError):
+        UserCreate.model_validate(_user_payload() | {"email": value})
+    assert normalize_email.cache_info().currsize == before
+
+
+def test_repeated_email_is_served_from_cache() -> None:
+    UserCreate.model_validate(_user_payload() | {"email": "repeat@example.com"})
+    hits = normalize_email.cache_info().hits
+    UserCreate.model_validate(_user_payload() | {"email": "repeat@example.com"})
+    assert normalize_email.cache_info().hits == hits + 1
+
+
+def test_email_keeps_its_openapi_schema() -> None:
+    class Legacy(BaseModel):
+        email: EmailStr
+
+    assert UserCreate.model_json_schema()["properties"]["email"] == Legacy.model_json_schema()["properties"]["email"]
+
+
+def test_identifier_is_classified_once() -> None:
+    assert LoginRequest(identifier="jane.doe@example.com", password="supersecret").identifier_kind == "email"
+    assert ForgotPasswordRequest(identifier="janedoe").identifier_kind == "username"
+
+
+def test_username_lookup_probes_only_the_username_column(client: TestClient, sql_statements: list[str]) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    sql_statements.clear()
+
+    client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+    lookup = sql_statements[0]
+    assert "users.username = ?" in lookup
+    assert "users.email = ?" not in lookup
+
+
+def test_email_lookup_miss_is_a_single_statement(client: TestClient, sql_statements: list[str]) -> None:
+    client.post("/api/v1/auth/forgot-password", json={"identifier": "ghost@example.com"})
+    assert len(sql_statements) == 1
+    assert "UNION ALL" in sql_statements[0]
+    assert " OR " not in sql_statements[0]
+
+
+def test_email_match_wins_over_email_shaped_username(client: TestClient) -> None:
+    rows = [
+        _user_payload() | {"username": "jane.doe@example.com", "email": "other@example.com"},
+        _user_payload(),
+    ]
+    with TestingSessionLocal() as db:
+        repository = UserRepository(db)
+        repository.bulk_insert(
+            [
+                {key: value for key, value in row.items() if "password" not in key} | {"hashed_password": f"hash{i}"}
+                for i, row in enumerate(rows)
+            ]
+        )
+        db.commit()
+        assert repository.get_login_credentials("jane.doe@example.com").hashed_password == "hash1"
+        assert repository.get_by_identifier("jane.doe@example.com").username == "janedoe"
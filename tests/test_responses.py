@@ -0,0 +1,41 @@
+"""Response serialization fast-path tests."""
+from datetime import datetime, timezone
+
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse, ORJSONResponse
+from fastapi.testclient import TestClient
+
+from app.controllers.auth_controller import RESET_EMAIL_SENT
+from app.core.config import Settings
+from app.core.responses import ModelResponse, default_response_class, encode_model
+from app.main import create_app
+from app.schemas.auth import UserRead
+from tests.test_auth import _user_payload
+
+
+def test_model_response_matches_response_model_serialization() -> None:
+    payload = _user_payload() | {"first_name": "Zoë", "short_description": None}
+    now = datetime(2024, 5, 1, 12, 30, tzinfo=timezone.utc)
+    user = UserRead.model_validate(payload | {"id": 7, "created_at": now, "updated_at": now})
+
+    assert ModelResponse(user).body == JSONResponse(jsonable_encoder(user)).body
+
+
+def test_constant_bodies_are_encoded_once() -> None:
+    assert encode_model(RESET_EMAIL_SENT) is encode_model(RESET_EMAIL_SENT)
+
+
+def test_register_response_matches_validated_user(client: TestClient) -> None:
+    response = client.post("/api/v1/auth/register", json=_user_payload())
+
+    assert response.status_code == 201
+    assert response.json() == UserRead.model_validate(response.json()).model_dump(mode="json")
+    assert response.json()["username"] == "janedoe"
+
+
+def test_orjson_default_response_class_is_opt_in() -> None:
+    assert default_response_class(Settings()) is JSONResponse
+    assert default_response_class(Settings(fast_json_responses=True)) is ORJSONResponse
+
+    with TestClient(create_app(Settings(token_sweeper_enabled=False, fast_json_responses=True))) as fast_client:
+        assert fast_client.get("/health").json() == {"status": "ok"}
@@ -0,0 +1,84 @@
+"""Multi-process serving topology tests."""
+import os
+from pathlib import Path
+
+import anyio.to_thread
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import create_engine, inspect
+
+from app.core.config import Settings
+from app.main import create_app
+from app.serve import hash_workers_per_process, main, worker_count
+from tests.test_startup import _python
+
+
+def test_workers_default_to_cpu_count_and_share_hashing_threads(monkeypatch) -> None:
+    monkeypatch.setattr("app.serve.os.cpu_count", lambda: 8)
+
+    assert worker_count(Settings()) == 8
+    assert worker_count(Settings(web_concurrency=3)) == 3
+    assert hash_workers_per_process(Settings(), 8) == 1
+    assert hash_workers_per_process(Settings(), 3) == 2
+    assert hash_workers_per_process(Settings(password_hash_workers=4), 8) == 4
+
+
+def test_threadpool_tokens_are_applied_at_startup() -> None:
+    application = create_app(Settings(token_sweeper_enabled=False, threadpool_tokens=7))
+
+    @application.get("/thread-tokens")
+    async def thread_tokens() -> int:
+        return anyio.to_thread.current_default_thread_limiter().total_tokens
+
+    with TestClient(application) as test_client:
+        assert test_client.get("/thread-tokens").json() == 7
+
+
+def test_forked_worker_opens_its_own_connections(tmp_path: Path) -> None:
+    script = (
+        "import os\n"
+        "from sqlalchemy import text\n"
+        "from app.db.session import get_engine\n"
+        "engine = get_engine()\n"
+        "with engine.connect() as connection:\n"
+        "    connection.execute(text('select 1'))\n"
+        "assert engine.pool.checkedin() == 1\n"
+        "pid = os.fork()\n"
+        "if pid == 0:\n"
+        "    ok = get_engine().pool.checkedin() == 0\n"
+        "    with get_engine().connect() as connection:\n"
+        "        ok = ok and connection.execute(text('select 1')).scalar() == 1\n"
+        "    os._exit(0 if ok else 1)\n"
+        "_, status = os.waitpid(pid, 0)\n"
+        "assert os.waitstatus_to_exitcode(status) == 0\n"
+        "with engine.connect() as connection:\n"
+        "    assert connection.execute(text('select 1')).scalar() == 1\n"
+    )
+    _python("-c", script, database_url=f"sqlite:///{tmp_path / 'fork.db'}")
+
+
+def test_one_off_work_runs_once_before_workers_start(tmp_path: Path, monkeypatch) -> None:
+    engine = create_engine(f"sqlite:///{tmp_path / 'serve.db'}")
+    started: list[dict] = []
+    monkeypatch.setattr("app.serve.get_engine", lambda: engine)
+    monkeypatch.setattr("app.serve.get_settings", lambda: Settings(db_bootstrap_schema=True, web_concurrency=2))
+    monkeypatch.setattr("app.serve.uvicorn.run", lambda *args, **kwargs: started.append(dict(os.environ)))
+    monkeypatch.setenv("DB_BOOTSTRAP_SCHEMA", "true")
+    monkeypatch.delenv("PASSWORD_HASH_WORKERS", raising=False)
+    monkeypatch.delenv("TOKEN_SWEEPER_ENABLED", raising=False)
+
+    main()
+
+    assert {"users", "password_reset_tokens"} <= set(inspect(engine).get_table_names())
+    assert started[0]["DB_BOOTSTRAP_SCHEMA"] == "false"
+    assert started[0]["TOKEN_SWEEPER_ENABLED"] == "false"
+    engine.dispose()
+
+
+def test_memory_user_cache_is_refused_with_several_workers(monkeypatch) -> None:
+    settings = Settings(web_concurrency=2, user_cache_enabled=True)
+    monkeypatch.setattr("app.serve.get_settings", lambda: settings)
+    monkeypatch.setattr("app.serve.uvicorn.run", lambda *args, **kwargs: pytest.fail("workers started"))
+
+    with pytest.raises(SystemExit, match="USER_CACHE_BACKEND"):
+        main()
@@ -0,0 +1,56 @@
+"""Access-token verification cache tests."""
+import time
+
+from fastapi.testclient import TestClient
+
+from app.core.security import decode_access_token
+from app.core.token_cache import TokenCache, get_token_cache
+from tests.test_auth import _user_payload
+
+
+def test_cache_evicts_least_recently_used_entries() -> None:
+    cache = TokenCache(max_size=2)
+    expires = time.time() + 60
+    for token in ("a", "b"):
+        cache.put(token, {"sub": token, "exp": expires})
+    assert cache.get("a") == {"sub": "a", "exp": expires}
+    cache.put("c", {"sub": "c", "exp": expires})
+
+    assert cache.get("b") is None
+    assert cache.get("a") is not None
+    assert cache.snapshot()["evictions"] == 1
+
+
+def test_cache_drops_entries_at_expiry() -> None:
+    cache = TokenCache(max_size=10)
+    cache.put("stale", {"sub": "1", "exp": time.time() - 1})
+    assert cache.get("stale") is None
+    assert cache.snapshot()["expirations"] == 1
+
+
+def test_me_endpoint_reuses_cached_verification(client: TestClient, monkeypatch) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    token = client.post(
+        "/api/v1/auth/login", json={"identifier": "janedoe", "password": "supersecret"}
+    ).json()["access_token"]
+    get_token_cache().clear()
+    decodes: list[str] = []
+
+    def counting_decode(value: str) -> dict:
+        decodes.append(value)
+        return decode_access_token(value)
+
+    monkeypatch.setattr("app.core.token_cache.decode_access_token", counting_decode)
+
+    headers = {"Authorization": f"Bearer {token}"}
+    for _ in range(3):
+        response = client.get("/api/v1/auth/me", headers=headers)
+        assert response.status_code == 200
+        assert response.json()["username"] == "janedoe"
+    assert len(decodes) == 1
+
+
+def test_me_endpoint_rejects_invalid_token(client: TestClient) -> None:
+    response = client.get("/api/v1/auth/me", headers={"Authorization": "Bearer not-a-jwt"})
+    assert response.status_code == 401
+    assert client.get("/api/v1/auth/me").status_code == 401
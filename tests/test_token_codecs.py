@@ -0,0 +1,51 @@
+"""JWT codec backend tests."""
+import importlib.util
+import time
+
+import pytest
+
+from app.core.config import Settings
+from app.core.security import TokenError, build_token_codec
+
+BACKENDS = ["jose", "native"] + (["pyjwt"] if importlib.util.find_spec("jwt") else [])
+
+
+@pytest.mark.parametrize("encoder", BACKENDS)
+@pytest.mark.parametrize("decoder", BACKENDS)
+def test_codecs_are_interchangeable(encoder: str, decoder: str) -> None:
+    claims = {"sub": "42", "exp": int(time.time()) + 60}
+    token = build_token_codec(Settings(jwt_backend=encoder)).encode(claims)
+    assert build_token_codec(Settings(jwt_backend=decoder)).decode(token) == claims
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+def test_codecs_reject_tampered_and_expired_tokens(backend: str) -> None:
+    codec = build_token_codec(Settings(jwt_backend=backend))
+    token = codec.encode({"sub": "42", "exp": int(time.time()) + 60})
+    forged = build_token_codec(Settings(jwt_backend=backend, jwt_secret_key="other")).encode(
+        {"sub": "1", "exp": int(time.time()) + 60}
+    )
+
+    with pytest.raises(TokenError):
+        codec.decode(token[:-2] + ("AA" if not token.endswith("AA") else "BB"))
+    with pytest.raises(TokenError):
+        codec.decode(forged)
+    with pytest.raises(TokenError):
+        codec.decode(codec.encode({"sub": "42", "exp": int(time.time()) - 10}))
+    with pytest.raises(TokenError):
+        codec.decode("not-a-token")
+
+
+def test_native_codec_rejects_asymmetric_algorithms() -> None:
+    with pytest.raises(ValueError):
+        build_token_codec(Settings(jwt_backend="native", jwt_algorithm="RS256"))
+
+
+@pytest.mark.parametrize("backend", BACKENDS)
+@pytest.mark.parametrize("header_segment", ["W10", "bnVsbA", "MQ"])
+def test_codecs_reject_headers_that_are_not_objects(backend: str, header_segment: str) -> None:
+    codec = build_token_codec(Settings(jwt_backend=backend))
+    _, payload_segment, signature = codec.encode({"sub": "42", "exp": int(time.time()) + 60}).split(".")
+
+    with pytest.raises(TokenError):
+        codec.decode(f"{header_segment}.{payload_segment}.{signature}")
@@ -0,0 +1,60 @@
+"""Password reset token sweeper tests."""
+from datetime import datetime, timedelta, timezone
+
+from sqlalchemy import select
+
+from app.core.config import Settings
+from app.models.password_reset_token import PasswordResetToken
+from app.models.user import User
+from app.services.token_sweeper import PasswordResetTokenSweeper
+from tests.conftest import TestingSessionLocal
+
+
+def _seed_tokens() -> None:
+    now = datetime.now(timezone.utc)
+    with TestingSessionLocal() as db:
+        user = User(
+            first_name="Jane",
+            last_name="Doe",
+            email="jane.doe@example.com",
+            phone="+15555550123",
+            contact="email",
+            username="janedoe",
+            hashed_password="x",
+        )
+        db.add(user)
+        db.flush()
+
+        def token(name: str, expires_in: timedelta, used_ago: timedelta | None = None) -> PasswordResetToken:
+            return PasswordResetToken(
+                user_id=user.id,
+                token_hash=name,
+                expires_at=now + expires_in,
+                used=used_ago is not None,
+                used_at=now - used_ago if used_ago is not None else None,
+            )
+
+        db.add_all([token(f"expired-{i}", timedelta(minutes=-5)) for i in range(5)])
+        db.add(token("used-long-ago", timedelta(hours=-47), used_ago=timedelta(hours=48)))
+        db.add(token("used-and-expired-within-retention", timedelta(minutes=-5), used_ago=timedelta(minutes=20)))
+        db.add(token("used-recently", timedelta(minutes=10), used_ago=timedelta(minutes=1)))
+        db.add(token("active", timedelta(minutes=10)))
+        db.commit()
+
+
+def test_sweeper_purges_in_batches_and_keeps_live_tokens() -> None:
+    _seed_tokens()
+    sweeper = PasswordResetTokenSweeper(
+        Settings(token_sweeper_batch_size=2, token_sweeper_batch_pause_seconds=0, used_token_retention_hours=24),
+        session_factory=TestingSessionLocal,
+    )
+
+    assert sweeper.sweep() == 6
+
+    with TestingSessionLocal() as db:
+        remaining = set(db.execute(select(PasswordResetToken.token_hash)).scalars())
+    assert remaining == {"used-recently", "used-and-expired-within-retention", "active"}
+    snapshot = sweeper.snapshot()
+    assert snapshot["rows_purged"] == 6
+    assert snapshot["batches"] == 4
+    assert sweeper.sweep() == 0
@@ -0,0 +1,147 @@
+"""User lookup cache tests."""
+import time
+from dataclasses import replace
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import Settings
+from app.db.unit_of_work import UnitOfWork
+from app.models.user import User
+from app.repositories.user_cache import StripedTTLCache, UserAccount, UserCacheBackend, UserLookupCache
+from app.repositories.user_repository import UserRepository
+from app.services.auth_service import build_auth_collaborators
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+ACCOUNT = UserAccount(1, "hash", "jane.doe@example.com", "Jane")
+
+
+class DictBackend:
+    """Stand-in for a shared backend such as Redis."""
+
+    def __init__(self) -> None:
+        self.values: dict[str, UserAccount] = {}
+
+    def get(self, key: str) -> UserAccount | None:
+        return self.values.get(key)
+
+    def set(self, key: str, value: UserAccount, ttl_seconds: float) -> None:
+        self.values[key] = value
+
+    def delete(self, keys: list[str]) -> None:
+        for key in keys:
+            self.values.pop(key, None)
+
+
+def build_dict_backend() -> UserCacheBackend:
+    return DictBackend()
+
+
+@pytest.fixture()
+def user_cache(monkeypatch) -> UserLookupCache:
+    cache = UserLookupCache(Settings(user_cache_enabled=True))
+    collaborators = replace(build_auth_collaborators(), user_cache=cache)
+    monkeypatch.setattr("app.routers.auth_router.get_auth_collaborators", lambda: collaborators)
+    return cache
+
+
+def _login(test_client: TestClient, password: str) -> int:
+    response = test_client.post("/api/v1/auth/login", json={"identifier": "janedoe", "password": password})
+    return response.status_code
+
+
+def test_striped_cache_evicts_least_recently_used_and_expires() -> None:
+    cache = StripedTTLCache(max_size=2, shards=1)
+    cache.set("a", ACCOUNT, 60)
+    cache.set("b", ACCOUNT, 60)
+    assert cache.get("a") == ACCOUNT
+    cache.set("c", ACCOUNT, 60)
+    assert cache.get("b") is None
+
+    cache.set("short", ACCOUNT, 0.01)
+    time.sleep(0.02)
+    assert cache.get("short") is None
+
+    snapshot = cache.snapshot()
+    assert snapshot["evictions"] == 2
+    assert snapshot["expirations"] == 1
+    assert snapshot["hit_ratio"] == pytest.approx(1 / 3)
+
+
+def test_only_stored_identifiers_are_cached_and_racing_writes_are_dropped() -> None:
+    cache = UserLookupCache(Settings(), backend=DictBackend())
+    stored = ("jane.doe@example.com", "janedoe")
+
+    cache.put("JaneDoe", ACCOUNT, stored, cache.read_token())
+    assert cache.get("JaneDoe") is None
+
+    token = cache.read_token()
+    cache.invalidate(*stored)
+    cache.put("janedoe", ACCOUNT, stored, token)
+    assert cache.get("janedoe") is None
+    assert cache.snapshot()["skipped_writes"] == 1
+
+
+def test_invalidation_reaches_other_workers_through_a_shared_backend() -> None:
+    shared = DictBackend()
+    writer, reader = UserLookupCache(Settings(), backend=shared), UserLookupCache(Settings(), backend=shared)
+    stored = ("jane.doe@example.com", "janedoe")
+    reader.put("janedoe", ACCOUNT, stored, reader.read_token())
+    assert reader.get("janedoe") == ACCOUNT
+
+    writer.invalidate(*stored)
+
+    assert reader.get("janedoe") is None
+    assert reader.get("jane.doe@example.com") is None
+
+
+def test_backend_is_pluggable() -> None:
+    cache = UserLookupCache(Settings(user_cache_backend="tests.test_user_cache:build_dict_backend"))
+    cache.put("janedoe", ACCOUNT, ("jane.doe@example.com", "janedoe"), cache.read_token())
+    assert cache.get("janedoe") == ACCOUNT
+
+
+def test_repeat_login_and_forgot_password_skip_user_lookup(
+    client: TestClient, user_cache: UserLookupCache, sql_statements: list[str]
+) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    assert _login(client, "supersecret") == 200
+
+    sql_statements.clear()
+    assert _login(client, "supersecret") == 200
+    client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+    assert [statement.split()[0] for statement in sql_statements] == ["DELETE", "INSERT"]
+    assert user_cache.snapshot()["hits"] == 2
+
+
+@pytest.mark.parametrize("client_fixture", ["client", "async_client"])
+def test_password_change_is_visible_immediately(
+    client_fixture: str, user_cache: UserLookupCache, monkeypatch, request
+) -> None:
+    test_client: TestClient = request.getfixturevalue(client_fixture)
+    monkeypatch.setattr("app.services.auth_service.secrets.token_urlsafe", lambda _: "static-token")
+    test_client.post("/api/v1/auth/register", json=_user_payload())
+    assert _login(test_client, "supersecret") == 200
+
+    test_client.post("/api/v1/auth/forgot-password", json={"identifier": "janedoe"})
+    reset_payload = {"token": "static-token", "new_password": "brandnewpass", "confirm_password": "brandnewpass"}
+    assert test_client.post("/api/v1/auth/reset-password", json=reset_payload).status_code == 200
+
+    assert _login(test_client, "supersecret") == 401
+    assert _login(test_client, "brandnewpass") == 200
+
+
+def test_background_rehash_invalidates_cached_hash(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    cache = UserLookupCache(Settings(user_cache_enabled=True))
+    with TestingSessionLocal() as db:
+        repository = UserRepository(db, user_cache=cache)
+        account = repository.find_account("janedoe")
+        assert cache.get("janedoe") == account
+
+        with UnitOfWork(db).begin():
+            assert repository.replace_password_hash(account.id, account.hashed_password, "rehashed")
+        assert cache.get("janedoe") is None
+        assert db.scalar(select(User.hashed_password)) == "rehashed"
@@ -0,0 +1,98 @@
+"""Bulk user import tests."""
+import io
+import json
+
+from fastapi.testclient import TestClient
+from sqlalchemy import select
+
+from app.core.config import Settings
+from app.core.security import verify_password
+from app.models.user import User
+from app.services.user_import import UserImporter, iter_records
+from tests.conftest import TestingSessionLocal
+from tests.test_auth import _user_payload
+
+IMPORT_SETTINGS = Settings(
+    user_import_batch_size=2,
+    user_import_hash_workers=2,
+    user_import_api_enabled=True,
+    user_import_api_token="import-secret",
+)
+
+
+def _record(index: int, **overrides: str) -> dict[str, str]:
+    return {
+        "first_name": "Legacy",
+        "last_name": "User",
+        "email": f"legacy{index}@example.com",
+        "phone": "+15555550123",
+        "contact": "email",
+        "username": f"legacy{index}",
+        "password": f"password-{index}",
+    } | overrides
+
+
+def test_importer_reports_conflicts_without_aborting_batches(client: TestClient) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    lines = [
+        json.dumps(_record(1)),
+        json.dumps(_record(2, email="jane.doe@example.com")),
+        "not json",
+        json.dumps(_record(3, username="legacy1")),
+        json.dumps(_record(4, password="short")),
+        json.dumps(_record(5)),
+    ]
+
+    with TestingSessionLocal() as db:
+        report = UserImporter(db, IMPORT_SETTINGS).run(iter_records(io.StringIO("\n".join(lines)), "ndjson"))
+
+    assert (report.processed, report.inserted, report.conflicts, report.invalid) == (6, 2, 2, 2)
+    assert [(error.row, error.field) for error in report.errors] == [
+        (2, "email"),
+        (3, None),
+        (4, "username"),
+        (5, "password"),
+    ]
+    with TestingSessionLocal() as db:
+        imported = db.execute(select(User).where(User.username.like("legacy%"))).scalars().all()
+    assert sorted(user.username for user in imported) == ["legacy1", "legacy5"]
+    assert all(verify_password(f"password-{user.username[-1]}", user.hashed_password) for user in imported)
+
+
+def _access_token(client: TestClient) -> str:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    return client.post(
+        "/api/v1/auth/login", json={"identifier": "janedoe", "password": "supersecret"}
+    ).json()["access_token"]
+
+
+def test_import_endpoint_accepts_csv(client: TestClient, monkeypatch) -> None:
+    client.post("/api/v1/auth/register", json=_user_payload())
+    monkeypatch.setattr("app.routers.user_import_router.get_settings", lambda: IMPORT_SETTINGS)
+    header = "first_name,last_name,email,phone,contact,username,password"
+    rows = [",".join(_record(index).values()) for index in (1, 2)] + [",".join(_record(3, username="janedoe").values())]
+
+    response = client.post(
+        "/api/v1/users/import",
+        content="\n".join([header, *rows]).encode(),
+        headers={"Authorization": "Bearer import-secret", "Content-Type": "text/csv"},
+    )
+
+    assert response.status_code == 200
+    body = response.json()
+    assert (body["inserted"], body["conflicts"]) == (2, 1)
+    assert body["errors"] == [{"row": 4, "field": "username", "message": "username is already taken"}]
+
+
+def test_import_endpoint_is_disabled_by_default(client: TestClient) -> None:
+    response = client.post("/api/v1/users/import", content=b"", headers={"Authorization": "Bearer import-secret"})
+    assert response.status_code == 404
+
+
+def test_import_endpoint_rejects_user_access_tokens(client: TestClient, monkeypatch) -> None:
+    token = _access_token(client)
+    monkeypatch.setattr("app.routers.user_import_router.get_settings", lambda: IMPORT_SETTINGS)
+
+    response = client.post("/api/v1/users/import", content=b"", headers={"Authorization": f"Bearer {token}"})
+    assert response.status_code == 401
+    assert client.post("/api/v1/users/import", content=b"").status_code == 401